@@ -0,0 +1,142 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Lookup tables of an agent tree, built once when the tree is frozen."""
+
+from __future__ import annotations
+
+from typing import Optional
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+  from .base_agent import BaseAgent
+
+
+def compute_transfer_targets(agent: BaseAgent) -> list[BaseAgent]:
+  """Returns the agents an LLM agent can transfer to."""
+  from .llm_agent import LlmAgent
+
+  result = []
+  result.extend(agent.sub_agents)
+
+  if not agent.parent_agent or not isinstance(agent.parent_agent, LlmAgent):
+    return result
+
+  if not agent.disallow_transfer_to_parent:
+    result.append(agent.parent_agent)
+
+  if not agent.disallow_transfer_to_peers:
+    result.extend([
+        peer_agent
+        for peer_agent in agent.parent_agent.sub_agents
+        if peer_agent.name != agent.name
+    ])
+
+  return result
+
+
+def compute_is_transferable_across_agent_tree(agent: BaseAgent) -> bool:
+  """Whether the agent and all its ancestors can transfer to their parents."""
+  from .llm_agent import LlmAgent
+
+  current_agent = agent
+  while current_agent:
+    if not isinstance(current_agent, LlmAgent):
+      # Only LLM-based Agent can provider agent transfer capability.
+      return False
+    if current_agent.disallow_transfer_to_parent:
+      return False
+    current_agent = current_agent.parent_agent
+  return True
+
+
+class AgentTree:
+  """The lookup tables of an agent tree.
+
+  The tables are built from the tree when it is frozen, i.e. when a Runner is
+  created for it, and must be built again with `freeze` if the tree changes.
+  Agents are keyed by identity, so copies of agents are not in the tables.
+  """
+
+  def __init__(self, root_agent: BaseAgent):
+    self.root_agent = root_agent
+    self._agents: list[BaseAgent] = []
+    """The agents in depth-first pre-order."""
+    self._positions: dict[int, int] = {}
+    """The position of each agent in `_agents`, keyed by id."""
+    self._subtree_ends: list[int] = []
+    """The position after the last descendant of each agent."""
+    self._positions_by_name: dict[str, list[int]] = {}
+    self._transfer_targets: dict[int, list[BaseAgent]] = {}
+    self._is_transferable: dict[int, bool] = {}
+    self._add(root_agent)
+
+  def _add(self, agent: BaseAgent) -> None:
+    from .llm_agent import LlmAgent
+
+    position = len(self._agents)
+    self._agents.append(agent)
+    self._subtree_ends.append(position + 1)
+    self._positions[id(agent)] = position
+    self._positions_by_name.setdefault(agent.name, []).append(position)
+    if isinstance(agent, LlmAgent):
+      self._transfer_targets[id(agent)] = compute_transfer_targets(agent)
+    self._is_transferable[id(agent)] = (
+        compute_is_transferable_across_agent_tree(agent)
+    )
+    for sub_agent in agent.sub_agents:
+      self._add(sub_agent)
+    self._subtree_ends[position] = len(self._agents)
+
+  def contains(self, agent: BaseAgent) -> bool:
+    position = self._positions.get(id(agent))
+    return position is not None and self._agents[position] is agent
+
+  def find_agent(self, agent: BaseAgent, name: str) -> Optional[BaseAgent]:
+    """Finds the agent with the name in the agent and its descendants.
+
+    Like a depth-first search, returns the first matching agent in pre-order.
+    """
+    return self._find_in_subtree(agent, name, include_agent=True)
+
+  def find_sub_agent(self, agent: BaseAgent, name: str) -> Optional[BaseAgent]:
+    """Finds the agent with the name in the agent's descendants."""
+    return self._find_in_subtree(agent, name, include_agent=False)
+
+  def _find_in_subtree(
+      self, agent: BaseAgent, name: str, include_agent: bool
+  ) -> Optional[BaseAgent]:
+    position = self._positions[id(agent)]
+    start = position if include_agent else position + 1
+    for match_position in self._positions_by_name.get(name, ()):
+      if start <= match_position < self._subtree_ends[position]:
+        return self._agents[match_position]
+    return None
+
+  def get_transfer_targets(self, agent: BaseAgent) -> list[BaseAgent]:
+    return list(self._transfer_targets[id(agent)])
+
+  def is_transferable_across_agent_tree(self, agent: BaseAgent) -> bool:
+    return self._is_transferable[id(agent)]
+
+
+def freeze(agent: BaseAgent) -> AgentTree:
+  """Builds the lookup tables of the agent's tree, and attaches them to it."""
+  root_agent = agent
+  while root_agent.parent_agent is not None:
+    root_agent = root_agent.parent_agent
+  agent_tree = AgentTree(root_agent)
+  for tree_agent in agent_tree._agents:
+    tree_agent._agent_tree = agent_tree
+  return agent_tree
@@ -30,10 +30,12 @@ from pydantic import BaseModel
 from pydantic import ConfigDict
 from pydantic import Field
 from pydantic import field_validator
+from pydantic import PrivateAttr
 from typing_extensions import override
 from typing_extensions import TypeAlias
 
 from ..events.event import Event
+from ._agent_tree import AgentTree
 from .callback_context import CallbackContext
 
 if TYPE_CHECKING:
@@ -92,6 +94,13 @@ class BaseAgent(BaseModel):
   sub_agents: list[BaseAgent] = Field(default_factory=list)
   """The sub-agents of this agent."""
 
+  _agent_tree: Optional[AgentTree] = PrivateAttr(default=None)
+  """The lookup tables of the agent tree, set when the tree is frozen.
+
+  The agent tree is frozen when a Runner is created for it, and must not be
+  changed afterwards.
+  """
+
   before_agent_callback: Optional[BeforeAgentCallback] = None
   """Callback or list of callbacks to be invoked before the agent run.
 
@@ -209,6 +218,8 @@ class BaseAgent(BaseModel):
   @property
   def root_agent(self) -> BaseAgent:
     """Gets the root agent of this agent."""
+    if agent_tree := self._get_agent_tree():
+      return agent_tree.root_agent
     root_agent = self
     while root_agent.parent_agent is not None:
       root_agent = root_agent.parent_agent
@@ -223,6 +234,8 @@ class BaseAgent(BaseModel):
     Returns:
       The agent with the matching name, or None if no such agent is found.
     """
+    if agent_tree := self._get_agent_tree():
+      return agent_tree.find_agent(self, name)
     if self.name == name:
       return self
     return self.find_sub_agent(name)
@@ -236,11 +249,20 @@ class BaseAgent(BaseModel):
     Returns:
       The agent with the matching name, or None if no such agent is found.
     """
+    if agent_tree := self._get_agent_tree():
+      return agent_tree.find_sub_agent(self, name)
     for sub_agent in self.sub_agents:
       if result := sub_agent.find_agent(name):
         return result
     return None
 
+  def _get_agent_tree(self) -> Optional[AgentTree]:
+    """Returns the lookup tables of this agent's tree, if it is frozen."""
+    agent_tree = self._agent_tree
+    if agent_tree is not None and agent_tree.contains(self):
+      return agent_tree
+    return None
+
   def _create_invocation_context(
       self, parent_context: InvocationContext
   ) -> InvocationContext:
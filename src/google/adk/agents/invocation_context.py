@@ -14,6 +14,7 @@
 
 from __future__ import annotations
 
+from typing import Any
 from typing import Optional
 import uuid
 
@@ -156,6 +157,11 @@ class InvocationContext(BaseModel):
   of this invocation.
   """
 
+  _contents_builders: dict[tuple[str, str, Optional[str]], Any] = {}
+  """The incremental LLM request contents builders of this invocation, keyed by
+  session id, agent name and branch.
+  """
+
   def increment_llm_call_count(
       self,
   ):
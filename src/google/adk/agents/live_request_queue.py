@@ -12,7 +12,13 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from __future__ import annotations
+
 import asyncio
+import collections
+from enum import Enum
+import time
+from typing import Callable
 from typing import Optional
 
 from google.genai import types
@@ -34,10 +40,88 @@ class LiveRequest(BaseModel):
   """If set, close the queue. queue.shutdown() is only supported in Python 3.13+."""
 
 
+class OverflowPolicy(Enum):
+  """What a bounded LiveRequestQueue does with a request when it is full."""
+
+  BLOCK = 'block'
+  """`send_async` waits for space, and the other send methods raise
+  `asyncio.QueueFull`."""
+  DROP_OLDEST = 'drop_oldest'
+  """The oldest queued blob is dropped to make space. Content and close
+  requests are never dropped: if no blob is queued, the request is handled as
+  with `BLOCK`."""
+  COALESCE_AUDIO = 'coalesce_audio'
+  """An audio blob is appended to the newest queued request if that is an
+  audio blob of the same mime type. Otherwise the request is handled as with
+  `DROP_OLDEST`."""
+
+
+class LiveRequestQueueMetrics(BaseModel):
+  """A snapshot of the metrics of a LiveRequestQueue."""
+
+  depth: int
+  """The number of queued requests."""
+  max_depth: int
+  """The max number of queued requests so far."""
+  num_sent: int
+  """The number of requests sent to the queue."""
+  num_received: int
+  """The number of requests received from the queue."""
+  num_dropped: int
+  """The number of requests dropped because the queue was full."""
+  num_coalesced: int
+  """The number of blobs appended to a queued blob because the queue was
+  full."""
+  average_latency_secs: float
+  """The average time received requests were queued, in seconds."""
+  max_latency_secs: float
+  """The max time a received request was queued, in seconds."""
+
+
+class _RequestQueue(asyncio.Queue):
+  """An asyncio queue from which any request can be removed.
+
+  A removed request is always replaced right away, so waiting puts are not
+  woken up.
+  """
+
+  def remove_first(
+      self, predicate: Callable[[LiveRequest], bool]
+  ) -> Optional[tuple[int, LiveRequest]]:
+    """Removes the oldest request matching the predicate.
+
+    Returns:
+      The position and the removed request, or None if no request matched.
+    """
+    for position, req in enumerate(self._queue):
+      if predicate(req):
+        del self._queue[position]
+        return position, req
+    return None
+
+  def put_past_max_size(self, req: LiveRequest) -> None:
+    """Puts a request without waiting, even if the queue is full."""
+    self._put(req)
+    self._unfinished_tasks += 1
+    self._finished.clear()
+    self._wakeup_next(self._getters)
+
+
 class LiveRequestQueue:
   """Queue used to send LiveRequest in a live(bidirectional streaming) way."""
 
-  def __init__(self):
+  def __init__(
+      self,
+      *,
+      max_size: Optional[int] = None,
+      overflow_policy: OverflowPolicy = OverflowPolicy.BLOCK,
+  ):
+    """Initializes the LiveRequestQueue.
+
+    Args:
+      max_size: The max number of queued requests, or None for no limit.
+      overflow_policy: What to do with a request when the queue is full.
+    """
     # Ensure there's an event loop available in this thread
     try:
       asyncio.get_running_loop()
@@ -46,20 +130,179 @@ class LiveRequestQueue:
       loop = asyncio.new_event_loop()
       asyncio.set_event_loop(loop)
 
+    self.max_size = max_size
+    self.overflow_policy = overflow_policy
     # Now create the queue (it will use the event loop we just ensured exists)
-    self._queue = asyncio.Queue()
+    self._queue = _RequestQueue(maxsize=max_size or 0)
+    self._enqueued_at: collections.deque[float] = collections.deque()
+    """The time each queued request was sent, the oldest first."""
+    self._newest_request: Optional[LiveRequest] = None
+    """The newest queued request, or None if it was received."""
+    self._coalesced_data: Optional[bytearray] = None
+    """The audio data coalesced into the newest queued request, if any.
+
+    The data is set on the request once, when it is received or another request
+    is queued after it, rather than copied for every coalesced blob.
+    """
+    self._max_depth = 0
+    self._num_sent = 0
+    self._num_received = 0
+    self._num_dropped = 0
+    self._num_coalesced = 0
+    self._total_latency_secs = 0.0
+    self._max_latency_secs = 0.0
 
   def close(self):
-    self._queue.put_nowait(LiveRequest(close=True))
+    """Closes the queue.
+
+    Closing never blocks. If the queue is full, the oldest queued blob is
+    dropped to make space. If no blob is queued, the close request is queued
+    past the max size, as content requests are never dropped.
+    """
+    req = LiveRequest(close=True)
+    if self._queue.full() and not self._drop_oldest_blob():
+      self._queue.put_past_max_size(req)
+      self._on_put(req)
+      return
+    self._put_nowait(req)
 
   def send_content(self, content: types.Content):
-    self._queue.put_nowait(LiveRequest(content=content))
+    self.send(LiveRequest(content=content))
 
   def send_realtime(self, blob: types.Blob):
-    self._queue.put_nowait(LiveRequest(blob=blob))
+    self.send(LiveRequest(blob=blob))
 
   def send(self, req: LiveRequest):
-    self._queue.put_nowait(req)
+    """Sends a request without waiting.
+
+    Raises:
+      asyncio.QueueFull: If the queue is full, and the overflow policy is
+        `OverflowPolicy.BLOCK` or no blob can be dropped to make space.
+    """
+    if self._queue.full():
+      if self.overflow_policy == OverflowPolicy.BLOCK:
+        raise asyncio.QueueFull()
+      if (
+          self.overflow_policy == OverflowPolicy.COALESCE_AUDIO
+          and self._coalesce(req)
+      ):
+        return
+      if not self._drop_oldest_blob():
+        raise asyncio.QueueFull()
+    self._put_nowait(req)
+
+  async def send_async(self, req: LiveRequest):
+    """Sends a request, waiting for space if it can't be made otherwise.
+
+    With the BLOCK overflow policy, or if no blob can be dropped, e.g. if the
+    queue is full of content requests, this waits for space.
+    """
+    if self.overflow_policy != OverflowPolicy.BLOCK:
+      try:
+        self.send(req)
+        return
+      except asyncio.QueueFull:
+        pass
+    await self._queue.put(req)
+    self._on_put(req)
 
   async def get(self) -> LiveRequest:
-    return await self._queue.get()
+    return self._on_get(await self._queue.get())
+
+  def get_nowait(self) -> LiveRequest:
+    """Gets a request without waiting.
+
+    Raises:
+      asyncio.QueueEmpty: If the queue is empty.
+    """
+    return self._on_get(self._queue.get_nowait())
+
+  def _on_get(self, req: LiveRequest) -> LiveRequest:
+    self._num_received += 1
+    if self._enqueued_at:
+      latency_secs = time.monotonic() - self._enqueued_at.popleft()
+      self._total_latency_secs += latency_secs
+      self._max_latency_secs = max(self._max_latency_secs, latency_secs)
+    if req is self._newest_request:
+      self._set_coalesced_data()
+      self._newest_request = None
+    return req
+
+  def get_metrics(self) -> LiveRequestQueueMetrics:
+    """Returns a snapshot of the queue depth and latency metrics."""
+    return LiveRequestQueueMetrics(
+        depth=self._queue.qsize(),
+        max_depth=self._max_depth,
+        num_sent=self._num_sent,
+        num_received=self._num_received,
+        num_dropped=self._num_dropped,
+        num_coalesced=self._num_coalesced,
+        average_latency_secs=(
+            self._total_latency_secs / self._num_received
+            if self._num_received
+            else 0.0
+        ),
+        max_latency_secs=self._max_latency_secs,
+    )
+
+  def _put_nowait(self, req: LiveRequest):
+    self._queue.put_nowait(req)
+    self._on_put(req)
+
+  def _on_put(self, req: LiveRequest):
+    self._set_coalesced_data()
+    self._enqueued_at.append(time.monotonic())
+    self._newest_request = req
+    self._num_sent += 1
+    self._max_depth = max(self._max_depth, self._queue.qsize())
+
+  def _drop_oldest_blob(self) -> bool:
+    """Drops the oldest queued blob.
+
+    Content and close requests are never dropped, as e.g. a dropped function
+    response would leave the model waiting for it.
+
+    Returns:
+      Whether a blob was dropped.
+    """
+    removed = self._queue.remove_first(lambda req: req.blob is not None)
+    if removed is None:
+      return False
+    position, req = removed
+    if position < len(self._enqueued_at):
+      del self._enqueued_at[position]
+    if req is self._newest_request:
+      self._coalesced_data = None
+      self._newest_request = None
+    self._num_dropped += 1
+    return True
+
+  def _coalesce(self, req: LiveRequest) -> bool:
+    """Appends an audio blob to the newest queued blob, if possible."""
+    newest_request = self._newest_request
+    if (
+        not newest_request
+        or not req.blob
+        or not newest_request.blob
+        or not req.blob.mime_type
+        or not req.blob.mime_type.startswith('audio/')
+        or req.blob.mime_type != newest_request.blob.mime_type
+    ):
+      return False
+    if self._coalesced_data is None:
+      self._coalesced_data = bytearray(newest_request.blob.data or b'')
+    if req.blob.data:
+      self._coalesced_data += req.blob.data
+    self._num_sent += 1
+    self._num_coalesced += 1
+    return True
+
+  def _set_coalesced_data(self):
+    """Sets the coalesced audio data on the newest queued request."""
+    if self._coalesced_data is None:
+      return
+    self._newest_request.blob = types.Blob(
+        data=bytes(self._coalesced_data),
+        mime_type=self._newest_request.blob.mime_type,
+    )
+    self._coalesced_data = None
@@ -29,6 +29,7 @@ from pydantic import BaseModel
 from pydantic import Field
 from pydantic import field_validator
 from pydantic import model_validator
+from pydantic import PrivateAttr
 from typing_extensions import override
 from typing_extensions import TypeAlias
 
@@ -104,12 +105,29 @@ ExamplesUnion = Union[list[Example], BaseExampleProvider]
 
 
 async def _convert_tool_union_to_tools(
-    tool_union: ToolUnion, ctx: ReadonlyContext
+    tool_union: ToolUnion,
+    ctx: ReadonlyContext,
+    function_tools: Optional[dict[int, FunctionTool]] = None,
 ) -> list[BaseTool]:
+  """Converts a tool union to tools.
+
+  Args:
+    tool_union: The tool union to convert.
+    ctx: The context to get the tools of toolsets with.
+    function_tools: The function tools of earlier conversions, keyed by the id
+      of their function, to reuse and add to. If None, plain functions are
+      wrapped in new function tools.
+  """
   if isinstance(tool_union, BaseTool):
     return [tool_union]
   if isinstance(tool_union, Callable):
-    return [FunctionTool(func=tool_union)]
+    if function_tools is None:
+      return [FunctionTool(func=tool_union)]
+    function_tool = function_tools.get(id(tool_union))
+    if function_tool is None or function_tool.func is not tool_union:
+      function_tool = FunctionTool(func=tool_union)
+      function_tools[id(tool_union)] = function_tool
+    return [function_tool]
 
   return await tool_union.get_tools(ctx)
 
@@ -138,6 +156,10 @@ class LlmAgent(BaseAgent):
   tools: list[ToolUnion] = Field(default_factory=list)
   """Tools available to this agent."""
 
+  _function_tools: dict[int, FunctionTool] = PrivateAttr(default_factory=dict)
+  """The function tools wrapping the plain functions in `tools`, keyed by the
+  id of their function, so that they are created once."""
+
   generate_content_config: Optional[types.GenerateContentConfig] = None
   """The additional content generation configurations.
 
@@ -293,7 +315,7 @@ class LlmAgent(BaseAgent):
     if isinstance(self.model, BaseLlm):
       return self.model
     elif self.model:  # model is non-empty str
-      return LLMRegistry.new_llm(self.model)
+      return LLMRegistry.get_llm(self.model)
     else:  # find model from ancestors.
       ancestor_agent = self.parent_agent
       while ancestor_agent is not None:
@@ -359,7 +381,19 @@ class LlmAgent(BaseAgent):
     """
     resolved_tools = []
     for tool_union in self.tools:
-      resolved_tools.extend(await _convert_tool_union_to_tools(tool_union, ctx))
+      resolved_tools.extend(
+          await _convert_tool_union_to_tools(
+              tool_union, ctx, self._function_tools
+          )
+      )
+    if len(self._function_tools) > len(self.tools):
+      # Drops the function tools of the functions removed from `tools`.
+      tool_ids = {id(tool_union) for tool_union in self.tools}
+      self._function_tools = {
+          func_id: function_tool
+          for func_id, function_tool in self._function_tools.items()
+          if func_id in tool_ids
+      }
     return resolved_tools
 
   @property
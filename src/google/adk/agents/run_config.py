@@ -31,6 +31,39 @@ class StreamingMode(Enum):
   BIDI = 'bidi'
 
 
+class EventWriteBehindConfig(BaseModel):
+  """Configs for storing the events of a run in batches, behind the run."""
+
+  model_config = ConfigDict(
+      extra='forbid',
+  )
+  """The pydantic model config."""
+
+  flush_interval_secs: float = 0.2
+  """The longest time that an event waits to be stored with later events."""
+
+  max_batch_size: int = 20
+  """The most events that are stored in one call to the session service."""
+
+  max_pending_events: int = 100
+  """The most events that are queued to be stored, before the run waits."""
+
+
+class RealtimeInputCoalescingConfig(BaseModel):
+  """Configs for sending consecutive realtime blobs to the model as one."""
+
+  model_config = ConfigDict(
+      extra='forbid',
+  )
+  """The pydantic model config."""
+
+  max_bytes: int = 3200
+  """The size at which coalesced blobs are sent, 100ms of 16kHz 16-bit PCM."""
+
+  max_delay_secs: float = 0.1
+  """The longest time that a blob waits to be sent with later blobs."""
+
+
 class RunConfig(BaseModel):
   """Configs for runtime behavior of agents."""
 
@@ -78,6 +111,39 @@ class RunConfig(BaseModel):
     - Less than or equal to 0: This allows for unbounded number of llm calls.
   """
 
+  max_concurrent_function_calls: int = 1
+  """
+  A limit on the number of function calls from one model response that are
+  executed concurrently, including their before and after tool callbacks.
+
+  Valid Values:
+    - 1 (default): The function calls are executed one after another.
+    - More than 1: Up to this many function calls are executed concurrently.
+    - Less than or equal to 0: All function calls are executed concurrently.
+
+  The function responses are always in the order of the function calls.
+  """
+
+  event_write_behind: Optional[EventWriteBehindConfig] = None
+  """
+  Whether to store the events of the run behind the run, in batches.
+
+  If set, the events are applied to the in-memory session and yielded right
+  away, and stored with `BaseSessionService.append_events` in the background,
+  in order. All events are stored before the run finishes. If not set
+  (default), each event is stored before it is yielded.
+  """
+
+  realtime_input_coalescing: Optional[RealtimeInputCoalescingConfig] = None
+  """
+  Whether to coalesce consecutive realtime blobs of a live run.
+
+  If set, consecutive blobs of the same mime type from the live request queue
+  are concatenated, and sent to the model and cached for transcription as one
+  blob, once they reach `max_bytes` or `max_delay_secs` after the first blob.
+  If not set (default), each blob is sent as soon as it is received.
+  """
+
   @field_validator('max_llm_calls', mode='after')
   @classmethod
   def validate_max_llm_calls(cls, value: int) -> int:
@@ -0,0 +1,256 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""An artifact service implementation using the local filesystem."""
+
+import asyncio
+import collections
+import json
+import logging
+import mmap
+import os
+import shutil
+from typing import Any
+from typing import Optional
+import urllib.parse
+import uuid
+
+from google.genai import types
+from typing_extensions import override
+
+from .base_artifact_service import BaseArtifactService
+
+logger = logging.getLogger("google_adk." + __name__)
+
+_MANIFEST_FILE_NAME = "manifest.json"
+
+_MAX_CACHED_MANIFESTS = 1000
+"""The max number of manifests kept in memory."""
+
+
+def _quote(name: str) -> str:
+  """Quotes a name so that it is a single, safe path component."""
+  if not name:
+    raise ValueError("Artifact path components must not be empty.")
+  quoted = urllib.parse.quote(name, safe="")
+  if quoted in (".", ".."):
+    quoted = quoted.replace(".", "%2E")
+  return quoted
+
+
+def _write_file(path: str, data: bytes) -> None:
+  """Writes a file atomically, so readers never see a partial file."""
+  temp_path = f"{path}.{uuid.uuid4().hex}.tmp"
+  with open(temp_path, "wb") as f:
+    f.write(data)
+  os.replace(temp_path, path)
+
+
+def _read_file(path: str) -> bytes:
+  """Reads a file through a memory map, copying its content only once."""
+  with open(path, "rb") as f:
+    if not os.fstat(f.fileno()).st_size:
+      return b""
+    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+      return mapped[:]
+
+
+class FileArtifactService(BaseArtifactService):
+  """An artifact service implementation using the local filesystem.
+
+  Each version of an artifact is written atomically to its own file under
+  `root_dir/<app_name>/<user_id>/session-<session_id>/<filename>/`, or under
+  `root_dir/<app_name>/<user_id>/user/<filename>/` for user artifacts. Each of
+  these session and user directories has a manifest with the filenames and
+  the mime type of each version of its artifacts, so listing does not scan
+  the directories. Loads read the version files through a memory map, so
+  their content is only copied once.
+
+  The service assumes it is the only writer of `root_dir`.
+  """
+
+  def __init__(self, root_dir: str):
+    """Initializes the FileArtifactService.
+
+    Args:
+        root_dir: The directory the artifacts are stored in.
+    """
+    self.root_dir = os.path.abspath(root_dir)
+    self._manifests: collections.OrderedDict[str, dict[str, dict[str, Any]]] = (
+        collections.OrderedDict()
+    )
+    """The cached manifests, keyed by their directory."""
+
+  def _file_has_user_namespace(self, filename: str) -> bool:
+    """Checks if the filename has a user namespace.
+
+    Args:
+        filename: The filename to check.
+
+    Returns:
+        True if the filename has a user namespace (starts with "user:"),
+        False otherwise.
+    """
+    return filename.startswith("user:")
+
+  def _scope_dir(
+      self, app_name: str, user_id: str, session_id: Optional[str]
+  ) -> str:
+    """Returns the directory of the session, or of the user if None."""
+    return os.path.join(
+        self.root_dir,
+        _quote(app_name),
+        _quote(user_id),
+        "user" if session_id is None else "session-" + _quote(session_id),
+    )
+
+  def _artifact_scope_dir(
+      self, app_name: str, user_id: str, session_id: str, filename: str
+  ) -> str:
+    if self._file_has_user_namespace(filename):
+      return self._scope_dir(app_name, user_id, None)
+    return self._scope_dir(app_name, user_id, session_id)
+
+  def _get_manifest(self, scope_dir: str) -> dict[str, dict[str, Any]]:
+    """Returns the manifest of a directory, keyed by filename."""
+    if scope_dir in self._manifests:
+      self._manifests.move_to_end(scope_dir)
+      return self._manifests[scope_dir]
+    try:
+      with open(os.path.join(scope_dir, _MANIFEST_FILE_NAME), "rb") as f:
+        manifest = json.load(f)
+    except FileNotFoundError:
+      manifest = {}
+    self._manifests[scope_dir] = manifest
+    if len(self._manifests) > _MAX_CACHED_MANIFESTS:
+      self._manifests.popitem(last=False)
+    return manifest
+
+  def _write_manifest(
+      self, scope_dir: str, manifest: dict[str, dict[str, Any]]
+  ) -> None:
+    _write_file(
+        os.path.join(scope_dir, _MANIFEST_FILE_NAME),
+        json.dumps(manifest).encode(),
+    )
+
+  @override
+  async def save_artifact(
+      self,
+      *,
+      app_name: str,
+      user_id: str,
+      session_id: str,
+      filename: str,
+      artifact: types.Part,
+  ) -> int:
+    if not artifact.inline_data:
+      raise ValueError("FileArtifactService only saves inline_data artifacts.")
+    scope_dir = self._artifact_scope_dir(
+        app_name, user_id, session_id, filename
+    )
+    artifact_dir = os.path.join(scope_dir, _quote(filename))
+    os.makedirs(artifact_dir, exist_ok=True)
+    temp_path = os.path.join(artifact_dir, f"{uuid.uuid4().hex}.tmp")
+
+    def write_temp_file():
+      with open(temp_path, "wb") as f:
+        f.write(artifact.inline_data.data or b"")
+
+    await asyncio.to_thread(write_temp_file)
+
+    # The version is assigned and published without awaiting, so concurrent
+    # saves get distinct versions.
+    manifest = self._get_manifest(scope_dir)
+    entry = manifest.setdefault(filename, {"mime_types": []})
+    version = len(entry["mime_types"])
+    os.makedirs(artifact_dir, exist_ok=True)
+    os.replace(temp_path, os.path.join(artifact_dir, str(version)))
+    entry["mime_types"].append(artifact.inline_data.mime_type)
+    self._write_manifest(scope_dir, manifest)
+    return version
+
+  @override
+  async def load_artifact(
+      self,
+      *,
+      app_name: str,
+      user_id: str,
+      session_id: str,
+      filename: str,
+      version: Optional[int] = None,
+  ) -> Optional[types.Part]:
+    scope_dir = self._artifact_scope_dir(
+        app_name, user_id, session_id, filename
+    )
+    entry = self._get_manifest(scope_dir).get(filename)
+    if not entry or not entry["mime_types"]:
+      return None
+    if version is None:
+      version = len(entry["mime_types"]) - 1
+    if not 0 <= version < len(entry["mime_types"]):
+      return None
+    mime_type = entry["mime_types"][version]
+    path = os.path.join(scope_dir, _quote(filename), str(version))
+    try:
+      data = await asyncio.to_thread(_read_file, path)
+    except FileNotFoundError:
+      # The artifact was deleted while it was read.
+      return None
+    return types.Part.from_bytes(data=data, mime_type=mime_type)
+
+  @override
+  async def list_artifact_keys(
+      self, *, app_name: str, user_id: str, session_id: str
+  ) -> list[str]:
+    filenames = list(
+        self._get_manifest(self._scope_dir(app_name, user_id, session_id))
+    )
+    filenames.extend(
+        self._get_manifest(self._scope_dir(app_name, user_id, None))
+    )
+    return sorted(filenames)
+
+  @override
+  async def delete_artifact(
+      self, *, app_name: str, user_id: str, session_id: str, filename: str
+  ) -> None:
+    scope_dir = self._artifact_scope_dir(
+        app_name, user_id, session_id, filename
+    )
+    manifest = self._get_manifest(scope_dir)
+    if manifest.pop(filename, None) is None:
+      return
+    self._write_manifest(scope_dir, manifest)
+    # The directory is moved away first, so that a new save of the artifact
+    # does not write into the directory being removed.
+    artifact_dir = os.path.join(scope_dir, _quote(filename))
+    deleted_dir = f"{artifact_dir}.{uuid.uuid4().hex}.deleted"
+    try:
+      os.replace(artifact_dir, deleted_dir)
+    except FileNotFoundError:
+      return
+    await asyncio.to_thread(shutil.rmtree, deleted_dir, ignore_errors=True)
+
+  @override
+  async def list_versions(
+      self, *, app_name: str, user_id: str, session_id: str, filename: str
+  ) -> list[int]:
+    scope_dir = self._artifact_scope_dir(
+        app_name, user_id, session_id, filename
+    )
+    entry = self._get_manifest(scope_dir).get(filename)
+    if not entry:
+      return []
+    return list(range(len(entry["mime_types"])))
@@ -14,9 +14,17 @@
 
 """An artifact service implementation using Google Cloud Storage (GCS)."""
 
+import asyncio
+import collections
+import concurrent.futures
+import functools
 import logging
+from typing import Any
+from typing import Callable
 from typing import Optional
+from typing import TypeVar
 
+from google.api_core import exceptions
 from google.cloud import storage
 from google.genai import types
 from typing_extensions import override
@@ -25,20 +33,71 @@ from .base_artifact_service import BaseArtifactService
 
 logger = logging.getLogger("google_adk." + __name__)
 
+_T = TypeVar("_T")
+
+_MAX_SAVE_ATTEMPTS = 5
+"""The max attempts to save an artifact while other writers save it too."""
+
+_MAX_DELETE_BATCH_SIZE = 100
+"""The max number of blobs deleted in one batch request."""
+
+_MAX_CACHED_VERSIONS = 10000
+"""The max number of artifacts whose latest version is cached."""
+
 
 class GcsArtifactService(BaseArtifactService):
-  """An artifact service implementation using Google Cloud Storage (GCS)."""
+  """An artifact service implementation using Google Cloud Storage (GCS).
+
+  The blocking storage calls run in a bounded thread pool, so they do not
+  block the event loop. The latest version of each artifact is cached when it
+  is saved or listed, so that saving an artifact or loading its latest version
+  does not list all its versions.
+
+  A version is only saved if its blob does not exist yet, so versions saved
+  by other writers are never overwritten. Loading the latest version may still
+  return an older version if another writer saved a newer one since it was
+  cached.
+  """
 
-  def __init__(self, bucket_name: str, **kwargs):
+  def __init__(
+      self,
+      bucket_name: str,
+      *,
+      max_workers: int = 8,
+      storage_client: Optional[storage.Client] = None,
+      **kwargs,
+  ):
     """Initializes the GcsArtifactService.
 
     Args:
         bucket_name: The name of the bucket to use.
+        max_workers: The max number of concurrent blocking storage calls.
+        storage_client: The storage client to use, e.g. a local fake. If not
+          set, a client is created with `kwargs`.
         **kwargs: Keyword arguments to pass to the Google Cloud Storage client.
     """
     self.bucket_name = bucket_name
-    self.storage_client = storage.Client(**kwargs)
+    self.storage_client = storage_client or storage.Client(**kwargs)
     self.bucket = self.storage_client.bucket(self.bucket_name)
+    self._executor = concurrent.futures.ThreadPoolExecutor(
+        max_workers=max_workers, thread_name_prefix="gcs_artifact_service"
+    )
+    self._latest_versions: collections.OrderedDict[str, int] = (
+        collections.OrderedDict()
+    )
+    """The latest version of each artifact, keyed by its blob name prefix."""
+
+  async def close(self) -> None:
+    """Shuts down the thread pool of the blocking storage calls."""
+    self._executor.shutdown(wait=False)
+
+  async def _run(
+      self, func: Callable[..., _T], *args: Any, **kwargs: Any
+  ) -> _T:
+    """Runs a blocking storage call in the thread pool."""
+    return await asyncio.get_running_loop().run_in_executor(
+        self._executor, functools.partial(func, *args, **kwargs)
+    )
 
   def _file_has_user_namespace(self, filename: str) -> bool:
     """Checks if the filename has a user namespace.
@@ -76,6 +135,40 @@ class GcsArtifactService(BaseArtifactService):
       return f"{app_name}/{user_id}/user/{filename}/{version}"
     return f"{app_name}/{user_id}/{session_id}/{filename}/{version}"
 
+  def _set_latest_version(self, prefix: str, version: Optional[int]) -> None:
+    """Caches the latest version of an artifact, or removes it if None."""
+    if version is None:
+      self._latest_versions.pop(prefix, None)
+      return
+    self._latest_versions[prefix] = version
+    self._latest_versions.move_to_end(prefix)
+    if len(self._latest_versions) > _MAX_CACHED_VERSIONS:
+      self._latest_versions.popitem(last=False)
+
+  def _list_blob_names(self, prefix: str) -> list[str]:
+    """Lists the names of the blobs with the prefix. Blocking."""
+    return [
+        blob.name
+        for blob in self.storage_client.list_blobs(self.bucket, prefix=prefix)
+    ]
+
+  async def _list_versions(self, prefix: str) -> list[int]:
+    """Lists the versions of an artifact and caches the latest one."""
+    blob_names = await self._run(self._list_blob_names, prefix)
+    versions = []
+    for blob_name in blob_names:
+      _, _, _, _, version = blob_name.split("/")
+      versions.append(int(version))
+    self._set_latest_version(prefix, max(versions, default=None))
+    return versions
+
+  async def _get_latest_version(self, prefix: str) -> Optional[int]:
+    """Returns the latest version of an artifact, from the cache if cached."""
+    if prefix in self._latest_versions:
+      self._latest_versions.move_to_end(prefix)
+      return self._latest_versions[prefix]
+    return max(await self._list_versions(prefix), default=None)
+
   @override
   async def save_artifact(
       self,
@@ -86,26 +179,37 @@ class GcsArtifactService(BaseArtifactService):
       filename: str,
       artifact: types.Part,
   ) -> int:
-    versions = await self.list_versions(
-        app_name=app_name,
-        user_id=user_id,
-        session_id=session_id,
-        filename=filename,
-    )
-    version = 0 if not versions else max(versions) + 1
-
-    blob_name = self._get_blob_name(
-        app_name, user_id, session_id, filename, version
-    )
-    blob = self.bucket.blob(blob_name)
+    prefix = self._get_blob_name(app_name, user_id, session_id, filename, "")
+    for _ in range(_MAX_SAVE_ATTEMPTS):
+      latest_version = await self._get_latest_version(prefix)
+      version = 0 if latest_version is None else latest_version + 1
 
-    blob.upload_from_string(
-        data=artifact.inline_data.data,
-        content_type=artifact.inline_data.mime_type,
+      blob = self.bucket.blob(prefix + str(version))
+      try:
+        await self._run(
+            blob.upload_from_string,
+            data=artifact.inline_data.data,
+            content_type=artifact.inline_data.mime_type,
+            if_generation_match=0,
+        )
+      except exceptions.PreconditionFailed:
+        # Another writer saved this version, so the versions are listed again.
+        logger.debug("Version %s of %s already exists.", version, prefix)
+        self._set_latest_version(prefix, None)
+        continue
+      except Exception:
+        self._set_latest_version(prefix, None)
+        raise
+      # Concurrent saves may have cached a later version already.
+      self._set_latest_version(
+          prefix, max(version, self._latest_versions.get(prefix, version))
+      )
+      return version
+    raise RuntimeError(
+        f"Failed to save a new version of {prefix} after"
+        f" {_MAX_SAVE_ATTEMPTS} attempts."
     )
 
-    return version
-
   @override
   async def load_artifact(
       self,
@@ -116,23 +220,29 @@ class GcsArtifactService(BaseArtifactService):
       filename: str,
       version: Optional[int] = None,
   ) -> Optional[types.Part]:
+    prefix = self._get_blob_name(app_name, user_id, session_id, filename, "")
+    if version is not None:
+      return await self._download(prefix + str(version))
+
+    is_cached = prefix in self._latest_versions
+    version = await self._get_latest_version(prefix)
     if version is None:
-      versions = await self.list_versions(
-          app_name=app_name,
-          user_id=user_id,
-          session_id=session_id,
-          filename=filename,
-      )
-      if not versions:
-        return None
-      version = max(versions)
+      return None
+    try:
+      return await self._download(prefix + str(version))
+    except exceptions.NotFound:
+      if not is_cached:
+        raise
+    # The cached version was deleted by another writer.
+    self._set_latest_version(prefix, None)
+    version = await self._get_latest_version(prefix)
+    if version is None:
+      return None
+    return await self._download(prefix + str(version))
 
-    blob_name = self._get_blob_name(
-        app_name, user_id, session_id, filename, version
-    )
+  async def _download(self, blob_name: str) -> Optional[types.Part]:
     blob = self.bucket.blob(blob_name)
-
-    artifact_bytes = blob.download_as_bytes()
+    artifact_bytes = await self._run(blob.download_as_bytes)
     if not artifact_bytes:
       return None
     artifact = types.Part.from_bytes(
@@ -147,19 +257,13 @@ class GcsArtifactService(BaseArtifactService):
     filenames = set()
 
     session_prefix = f"{app_name}/{user_id}/{session_id}/"
-    session_blobs = self.storage_client.list_blobs(
-        self.bucket, prefix=session_prefix
-    )
-    for blob in session_blobs:
-      _, _, _, filename, _ = blob.name.split("/")
-      filenames.add(filename)
-
     user_namespace_prefix = f"{app_name}/{user_id}/user/"
-    user_namespace_blobs = self.storage_client.list_blobs(
-        self.bucket, prefix=user_namespace_prefix
+    session_blob_names, user_namespace_blob_names = await asyncio.gather(
+        self._run(self._list_blob_names, session_prefix),
+        self._run(self._list_blob_names, user_namespace_prefix),
     )
-    for blob in user_namespace_blobs:
-      _, _, _, filename, _ = blob.name.split("/")
+    for blob_name in session_blob_names + user_namespace_blob_names:
+      _, _, _, filename, _ = blob_name.split("/")
       filenames.add(filename)
 
     return sorted(list(filenames))
@@ -168,28 +272,25 @@ class GcsArtifactService(BaseArtifactService):
   async def delete_artifact(
       self, *, app_name: str, user_id: str, session_id: str, filename: str
   ) -> None:
-    versions = await self.list_versions(
-        app_name=app_name,
-        user_id=user_id,
-        session_id=session_id,
-        filename=filename,
-    )
-    for version in versions:
-      blob_name = self._get_blob_name(
-          app_name, user_id, session_id, filename, version
+    prefix = self._get_blob_name(app_name, user_id, session_id, filename, "")
+    versions = await self._list_versions(prefix)
+    self._set_latest_version(prefix, None)
+    blob_names = [prefix + str(version) for version in versions]
+    for i in range(0, len(blob_names), _MAX_DELETE_BATCH_SIZE):
+      await self._run(
+          self._delete_blobs, blob_names[i : i + _MAX_DELETE_BATCH_SIZE]
       )
-      blob = self.bucket.blob(blob_name)
-      blob.delete()
     return
 
+  def _delete_blobs(self, blob_names: list[str]) -> None:
+    """Deletes the blobs in one batch request. Blocking."""
+    with self.storage_client.batch():
+      for blob_name in blob_names:
+        self.bucket.blob(blob_name).delete()
+
   @override
   async def list_versions(
       self, *, app_name: str, user_id: str, session_id: str, filename: str
   ) -> list[int]:
     prefix = self._get_blob_name(app_name, user_id, session_id, filename, "")
-    blobs = self.storage_client.list_blobs(self.bucket, prefix=prefix)
-    versions = []
-    for blob in blobs:
-      _, _, _, _, version = blob.name.split("/")
-      versions.append(int(version))
-    return versions
+    return await self._list_versions(prefix)
@@ -20,6 +20,7 @@ from typing import Optional
 from google.genai import types
 from pydantic import BaseModel
 from pydantic import Field
+from pydantic import PrivateAttr
 from typing_extensions import override
 
 from .base_artifact_service import BaseArtifactService
@@ -27,10 +28,28 @@ from .base_artifact_service import BaseArtifactService
 logger = logging.getLogger("google_adk." + __name__)
 
 
+def _artifact_size(artifact: types.Part) -> int:
+  if artifact.inline_data and artifact.inline_data.data:
+    return len(artifact.inline_data.data)
+  if artifact.text:
+    return len(artifact.text)
+  return 0
+
+
 class InMemoryArtifactService(BaseArtifactService, BaseModel):
-  """An in-memory implementation of the artifact service."""
+  """An in-memory implementation of the artifact service.
+
+  If `max_size_bytes` is set, the least recently used artifacts, with all
+  their versions, are evicted when the artifacts use more memory.
+  """
 
   artifacts: dict[str, list[types.Part]] = Field(default_factory=dict)
+  max_size_bytes: Optional[int] = None
+  """The max total size of the artifacts, or None for no limit."""
+
+  _sizes: dict[str, int] = PrivateAttr(default_factory=dict)
+  """The total size of the versions of each artifact, keyed by path."""
+  _total_size: int = PrivateAttr(default=0)
 
   def _file_has_user_namespace(self, filename: str) -> bool:
     """Checks if the filename has a user namespace.
@@ -62,6 +81,21 @@ class InMemoryArtifactService(BaseArtifactService, BaseModel):
       return f"{app_name}/{user_id}/user/{filename}"
     return f"{app_name}/{user_id}/{session_id}/{filename}"
 
+  def _touch(self, path: str) -> None:
+    """Marks the artifact as the most recently used one."""
+    if self.max_size_bytes is not None:
+      self.artifacts[path] = self.artifacts.pop(path)
+
+  def _evict(self, path_to_keep: str) -> None:
+    """Evicts the least recently used artifacts until they fit."""
+    while self._total_size > self.max_size_bytes:
+      path = next(iter(self.artifacts))
+      if path == path_to_keep:
+        return
+      self.artifacts.pop(path)
+      self._total_size -= self._sizes.pop(path, 0)
+      logger.debug("Evicted artifact %s.", path)
+
   @override
   async def save_artifact(
       self,
@@ -77,6 +111,12 @@ class InMemoryArtifactService(BaseArtifactService, BaseModel):
       self.artifacts[path] = []
     version = len(self.artifacts[path])
     self.artifacts[path].append(artifact)
+    if self.max_size_bytes is not None:
+      size = _artifact_size(artifact)
+      self._sizes[path] = self._sizes.get(path, 0) + size
+      self._total_size += size
+      self._touch(path)
+      self._evict(path)
     return version
 
   @override
@@ -93,6 +133,7 @@ class InMemoryArtifactService(BaseArtifactService, BaseModel):
     versions = self.artifacts.get(path)
     if not versions:
       return None
+    self._touch(path)
     if version is None:
       version = -1
     return versions[version]
@@ -121,6 +162,7 @@ class InMemoryArtifactService(BaseArtifactService, BaseModel):
     if not self.artifacts.get(path):
       return None
     self.artifacts.pop(path, None)
+    self._total_size -= self._sizes.pop(path, 0)
 
   @override
   async def list_versions(
@@ -15,6 +15,7 @@
 from __future__ import annotations
 
 from typing import AsyncGenerator
+from typing import Optional
 from typing import TYPE_CHECKING
 
 from typing_extensions import override
@@ -26,6 +27,7 @@ from ..flows.llm_flows import functions
 from ..flows.llm_flows._base_llm_processor import BaseLlmRequestProcessor
 from ..flows.llm_flows.functions import REQUEST_EUC_FUNCTION_CALL_NAME
 from ..models.llm_request import LlmRequest
+from ..sessions._event_index import EventIndex
 from .auth_handler import AuthHandler
 from .auth_tool import AuthConfig
 from .auth_tool import AuthToolArguments
@@ -49,78 +51,77 @@ class _AuthLlmRequestProcessor(BaseLlmRequestProcessor):
     events = invocation_context.session.events
     if not events:
       return
+    event_index = invocation_context.session.get_event_index()
+
+    # look for last event authored by user
+    user_event_index = event_index.get_last_author_index('user')
+    if user_event_index is None:
+      return
+    responses = events[user_event_index].get_function_responses()
+    if not responses:
+      return
 
     request_euc_function_call_ids = set()
-    for k in range(len(events) - 1, -1, -1):
-      event = events[k]
-      # look for first event authored by user
-      if not event.author or event.author != 'user':
+    for function_call_response in responses:
+      if function_call_response.name != REQUEST_EUC_FUNCTION_CALL_NAME:
         continue
-      responses = event.get_function_responses()
-      if not responses:
-        return
-
-      for function_call_response in responses:
-        if function_call_response.name != REQUEST_EUC_FUNCTION_CALL_NAME:
-          continue
-        # found the function call response for the system long running request euc
-        # function call
-        request_euc_function_call_ids.add(function_call_response.id)
-        auth_config = AuthConfig.model_validate(function_call_response.response)
-        AuthHandler(auth_config=auth_config).parse_and_store_auth_response(
-            state=invocation_context.session.state
-        )
-      break
+      # found the function call response for the system long running request euc
+      # function call
+      request_euc_function_call_ids.add(function_call_response.id)
+      auth_config = AuthConfig.model_validate(function_call_response.response)
+      AuthHandler(auth_config=auth_config).parse_and_store_auth_response(
+          state=invocation_context.session.state
+      )
 
     if not request_euc_function_call_ids:
       return
 
-    for i in range(len(events) - 2, -1, -1):
-      event = events[i]
-      # looking for the system long running request euc function call
-      function_calls = event.get_function_calls()
-      if not function_calls:
-        continue
-
-      tools_to_resume = set()
-
-      for function_call in function_calls:
-        if function_call.id not in request_euc_function_call_ids:
-          continue
-        args = AuthToolArguments.model_validate(function_call.args)
+    # looking for the system long running request euc function call
+    i = _last_function_call_index(
+        event_index, request_euc_function_call_ids, len(events) - 1
+    )
+    if i is None:
+      return
 
-        tools_to_resume.add(args.function_call_id)
-      if not tools_to_resume:
+    tools_to_resume = set()
+    for function_call in events[i].get_function_calls():
+      if function_call.id not in request_euc_function_call_ids:
         continue
+      args = AuthToolArguments.model_validate(function_call.args)
+      tools_to_resume.add(args.function_call_id)
 
-      # found the the system long running request euc function call
-      # looking for original function call that requests euc
-      for j in range(i - 1, -1, -1):
-        event = events[j]
-        function_calls = event.get_function_calls()
-        if not function_calls:
-          continue
-
-        if any([
-            function_call.id in tools_to_resume
-            for function_call in function_calls
-        ]):
-          if function_response_event := await functions.handle_function_calls_async(
-              invocation_context,
-              event,
-              {
-                  tool.name: tool
-                  for tool in await agent.canonical_tools(
-                      ReadonlyContext(invocation_context)
-                  )
-              },
-              # there could be parallel function calls that require auth
-              # auth response would be a dict keyed by function call id
-              tools_to_resume,
-          ):
-            yield function_response_event
-          return
+    # found the the system long running request euc function call
+    # looking for original function call that requests euc
+    j = _last_function_call_index(event_index, tools_to_resume, i)
+    if j is None:
       return
+    if function_response_event := await functions.handle_function_calls_async(
+        invocation_context,
+        events[j],
+        {
+            tool.name: tool
+            for tool in await agent.canonical_tools(
+                ReadonlyContext(invocation_context)
+            )
+        },
+        # there could be parallel function calls that require auth
+        # auth response would be a dict keyed by function call id
+        tools_to_resume,
+    ):
+      yield function_response_event
+
+
+def _last_function_call_index(
+    event_index: EventIndex, function_call_ids: set[str], end: int
+) -> Optional[int]:
+  """Returns the position of the last event before `end` calling any of ids."""
+  indices = [
+      index
+      for function_call_id in function_call_ids
+      for index in event_index.get_function_call_indices(function_call_id)
+      if index < end
+  ]
+  return max(indices) if indices else None
 
 
 request_processor = _AuthLlmRequestProcessor()
@@ -427,6 +427,7 @@ def fast_api_common_options():
             """Optional. The database URL to store the session.
           - Use 'agentengine://<agent_engine_resource_id>' to connect to Agent Engine sessions.
           - Use 'sqlite://<path_to_sqlite_file>' to connect to a SQLite DB.
+          - Use an asyncio driver, e.g. 'sqlite+aiosqlite://<path_to_sqlite_file>' or 'postgresql+asyncpg://...', to access the DB without blocking the server.
           - See https://docs.sqlalchemy.org/en/20/core/engines.html#backend-specific-urls for more details on supported DB URLs."""
         ),
     )
@@ -435,7 +436,8 @@ def fast_api_common_options():
         type=str,
         help=(
             "Optional. The artifact storage URI to store the artifacts,"
-            " supported URIs: gs://<bucket name> for GCS artifact service."
+            " supported URIs: gs://<bucket name> for GCS artifact service,"
+            " file://<directory> for local file artifact service."
         ),
         default=None,
     )
@@ -571,6 +573,17 @@ def cli_web(
     default=os.getcwd(),
 )
 @fast_api_common_options()
+@click.option(
+    "--workers",
+    type=click.IntRange(min=1),
+    default=1,
+    show_default=True,
+    help=(
+        "Optional. The number of worker processes. With more than one, each"
+        " worker runs its own agents and services, and the requests of a"
+        " session always go to the same worker. Auto reload is disabled."
+    ),
+)
 def cli_api_server(
     agents_dir: str,
     session_db_url: str = "",
@@ -581,6 +594,7 @@ def cli_api_server(
     port: int = 8000,
     trace_to_cloud: bool = False,
     reload: bool = True,
+    workers: int = 1,
 ):
   """Starts a FastAPI server for agents.
 
@@ -593,6 +607,23 @@ def cli_api_server(
   """
   logs.setup_adk_logger(getattr(logging, log_level.upper()))
 
+  if workers > 1:
+    from .multi_worker import run_multi_worker_server
+
+    run_multi_worker_server(
+        num_workers=workers,
+        host=host,
+        port=port,
+        log_level=getattr(logging, log_level.upper()),
+        agents_dir=agents_dir,
+        session_db_url=session_db_url,
+        artifact_storage_uri=artifact_storage_uri,
+        allow_origins=list(allow_origins) if allow_origins else None,
+        web=False,
+        trace_to_cloud=trace_to_cloud,
+    )
+    return
+
   config = uvicorn.Config(
       get_fast_api_app(
           agents_dir=agents_dir,
@@ -706,7 +737,8 @@ def cli_api_server(
     type=str,
     help=(
         "Optional. The artifact storage URI to store the artifacts, supported"
-        " URIs: gs://<bucket name> for GCS artifact service."
+        " URIs: gs://<bucket name> for GCS artifact service, file://<directory>"
+        " for local file artifact service."
     ),
     default=None,
 )
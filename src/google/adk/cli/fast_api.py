@@ -55,6 +55,7 @@ from ..agents.live_request_queue import LiveRequest
 from ..agents.live_request_queue import LiveRequestQueue
 from ..agents.llm_agent import Agent
 from ..agents.run_config import StreamingMode
+from ..artifacts.file_artifact_service import FileArtifactService
 from ..artifacts.gcs_artifact_service import GcsArtifactService
 from ..artifacts.in_memory_artifact_service import InMemoryArtifactService
 from ..errors.not_found_error import NotFoundError
@@ -69,6 +70,8 @@ from ..evaluation.local_eval_sets_manager import LocalEvalSetsManager
 from ..events.event import Event
 from ..memory.in_memory_memory_service import InMemoryMemoryService
 from ..runners import Runner
+from ..sessions.async_database_session_service import AsyncDatabaseSessionService
+from ..sessions.async_database_session_service import is_async_db_url
 from ..sessions.database_session_service import DatabaseSessionService
 from ..sessions.in_memory_session_service import InMemorySessionService
 from ..sessions.session import Session
@@ -81,59 +84,48 @@ from .utils import create_empty_state
 from .utils import envs
 from .utils import evals
 from .utils.agent_loader import AgentLoader
+from .utils.span_store import DEFAULT_MAX_AGE_SECS
+from .utils.span_store import DEFAULT_MAX_SPANS
+from .utils.span_store import SpanStore
 
 logger = logging.getLogger("google_adk." + __name__)
 
 _EVAL_SET_FILE_EXTENSION = ".evalset.json"
 
 
-class ApiServerSpanExporter(export.SpanExporter):
+class InMemoryExporter(export.SpanExporter):
+  """Exports finished spans to a span store for the trace endpoints."""
 
-  def __init__(self, trace_dict):
-    self.trace_dict = trace_dict
+  def __init__(self, span_store: SpanStore):
+    super().__init__()
+    self.span_store = span_store
 
+  @override
   def export(
       self, spans: typing.Sequence[ReadableSpan]
   ) -> export.SpanExportResult:
     for span in spans:
+      session_id = None
+      event_id = None
+      event_attributes = None
+      if span.name == "call_llm":
+        session_id = span.attributes.get("gcp.vertex.agent.session_id", None)
       if (
           span.name == "call_llm"
           or span.name == "send_data"
           or span.name.startswith("execute_tool")
       ):
-        attributes = dict(span.attributes)
-        attributes["trace_id"] = span.get_span_context().trace_id
-        attributes["span_id"] = span.get_span_context().span_id
-        if attributes.get("gcp.vertex.agent.event_id", None):
-          self.trace_dict[attributes["gcp.vertex.agent.event_id"]] = attributes
-    return export.SpanExportResult.SUCCESS
-
-  def force_flush(self, timeout_millis: int = 30000) -> bool:
-    return True
-
-
-class InMemoryExporter(export.SpanExporter):
-
-  def __init__(self, trace_dict):
-    super().__init__()
-    self._spans = []
-    self.trace_dict = trace_dict
-
-  @override
-  def export(
-      self, spans: typing.Sequence[ReadableSpan]
-  ) -> export.SpanExportResult:
-    for span in spans:
-      trace_id = span.context.trace_id
-      if span.name == "call_llm":
-        attributes = dict(span.attributes)
-        session_id = attributes.get("gcp.vertex.agent.session_id", None)
-        if session_id:
-          if session_id not in self.trace_dict:
-            self.trace_dict[session_id] = [trace_id]
-          else:
-            self.trace_dict[session_id] += [trace_id]
-    self._spans.extend(spans)
+        event_id = span.attributes.get("gcp.vertex.agent.event_id", None)
+        if event_id:
+          event_attributes = dict(span.attributes)
+          event_attributes["trace_id"] = span.get_span_context().trace_id
+          event_attributes["span_id"] = span.get_span_context().span_id
+      self.span_store.add(
+          span,
+          session_id=session_id,
+          event_id=event_id,
+          event_attributes=event_attributes,
+      )
     return export.SpanExportResult.SUCCESS
 
   @override
@@ -141,13 +133,10 @@ class InMemoryExporter(export.SpanExporter):
     return True
 
   def get_finished_spans(self, session_id: str):
-    trace_ids = self.trace_dict.get(session_id, None)
-    if trace_ids is None or not trace_ids:
-      return []
-    return [x for x in self._spans if x.context.trace_id in trace_ids]
+    return self.span_store.get_session_spans(session_id)
 
   def clear(self):
-    self._spans.clear()
+    self.span_store.clear()
 
 
 class AgentRunRequest(common.BaseModel):
@@ -199,17 +188,17 @@ def get_fast_api_app(
     web: bool,
     trace_to_cloud: bool = False,
     lifespan: Optional[Lifespan[FastAPI]] = None,
+    max_trace_spans: int = DEFAULT_MAX_SPANS,
+    max_trace_age_secs: Optional[float] = DEFAULT_MAX_AGE_SECS,
 ) -> FastAPI:
-  # InMemory tracing dict.
-  trace_dict: dict[str, Any] = {}
-  session_trace_dict: dict[str, Any] = {}
-
-  # Set up tracing in the FastAPI server.
-  provider = TracerProvider()
-  provider.add_span_processor(
-      export.SimpleSpanProcessor(ApiServerSpanExporter(trace_dict))
+  # Set up tracing in the FastAPI server. The spans served by the trace
+  # endpoints are kept in memory, up to `max_trace_spans` spans for up to
+  # `max_trace_age_secs` seconds.
+  span_store = SpanStore(
+      max_spans=max_trace_spans, max_age_secs=max_trace_age_secs
   )
-  memory_exporter = InMemoryExporter(session_trace_dict)
+  provider = TracerProvider()
+  memory_exporter = InMemoryExporter(span_store)
   provider.add_span_processor(export.SimpleSpanProcessor(memory_exporter))
   if trace_to_cloud:
     envs.load_dotenv_for_agent("", agents_dir)
@@ -272,6 +261,8 @@ def get_fast_api_app(
           os.environ["GOOGLE_CLOUD_PROJECT"],
           os.environ["GOOGLE_CLOUD_LOCATION"],
       )
+    elif is_async_db_url(session_db_url):
+      session_service = AsyncDatabaseSessionService(db_url=session_db_url)
     else:
       session_service = DatabaseSessionService(db_url=session_db_url)
   else:
@@ -282,6 +273,10 @@ def get_fast_api_app(
     if artifact_storage_uri.startswith("gs://"):
       gcs_bucket = artifact_storage_uri.split("://")[1]
       artifact_service = GcsArtifactService(bucket_name=gcs_bucket)
+    elif artifact_storage_uri.startswith("file://"):
+      artifact_service = FileArtifactService(
+          root_dir=artifact_storage_uri.split("://")[1]
+      )
     else:
       raise click.ClickException(
           "Unsupported artifact storage URI: %s" % artifact_storage_uri
@@ -292,6 +287,10 @@ def get_fast_api_app(
   # initialize Agent Loader
   agent_loader = AgentLoader(agents_dir)
 
+  @app.get("/health")
+  def health() -> dict[str, str]:
+    return {"status": "ok"}
+
   @app.get("/list-apps")
   def list_apps() -> list[str]:
     base_path = Path.cwd() / agents_dir
@@ -311,7 +310,7 @@ def get_fast_api_app(
 
   @app.get("/debug/trace/{event_id}")
   def get_trace_dict(event_id: str) -> Any:
-    event_dict = trace_dict.get(event_id, None)
+    event_dict = span_store.get_event_attributes(event_id)
     if event_dict is None:
       raise HTTPException(status_code=404, detail="Trace not found")
     return event_dict
@@ -753,6 +752,7 @@ def get_fast_api_app(
             user_id=req.user_id,
             session_id=req.session_id,
             new_message=req.new_message,
+            session=session,
         )
     ]
     logger.info("Generated %s events in agent run: %s", len(events), events)
@@ -779,6 +779,7 @@ def get_fast_api_app(
             session_id=req.session_id,
             new_message=req.new_message,
             run_config=RunConfig(streaming_mode=stream_mode),
+            session=session,
         ):
           # Format as SSE data
           sse_event = event.model_dump_json(exclude_none=True, by_alias=True)
@@ -886,7 +887,9 @@ def get_fast_api_app(
         while True:
           data = await websocket.receive_text()
           # Validate and send the received message to the live queue.
-          live_request_queue.send(LiveRequest.model_validate_json(data))
+          await live_request_queue.send_async(
+              LiveRequest.model_validate_json(data)
+          )
       except ValidationError as ve:
         logger.error("Validation error in process_messages: %s", ve)
 
@@ -919,7 +922,9 @@ def get_fast_api_app(
 
   async def _get_runner_async(app_name: str) -> Runner:
     """Returns the runner for the given app."""
-    envs.load_dotenv_for_agent(os.path.basename(app_name), agents_dir)
+    envs.load_dotenv_for_agent_if_changed(
+        os.path.basename(app_name), agents_dir
+    )
     if app_name in runner_dict:
       return runner_dict[app_name]
     root_agent = agent_loader.load_agent(app_name)
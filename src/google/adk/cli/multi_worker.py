@@ -0,0 +1,461 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Serves the API server from multiple worker processes.
+
+Each worker process runs its own API server app, with its own runners and
+services, on a local port. A router accepts the requests and forwards them to
+the workers. All the requests of a session go to the same worker, so that
+in-memory sessions, artifacts and traces keep working. Workers that exit are
+restarted, and `/health` reports the health of each worker.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from contextlib import asynccontextmanager
+import itertools
+import json
+import logging
+import multiprocessing
+import os
+import re
+import socket
+import time
+from typing import Any
+from typing import Optional
+import uuid
+import zlib
+
+from fastapi import FastAPI
+from fastapi import Request
+from fastapi import WebSocket
+from fastapi import WebSocketDisconnect
+from fastapi.responses import JSONResponse
+from fastapi.responses import Response
+from fastapi.responses import StreamingResponse
+import httpx
+from starlette.background import BackgroundTask
+import uvicorn
+from websockets.asyncio.client import connect as websocket_connect
+from websockets.exceptions import WebSocketException
+
+logger = logging.getLogger("google_adk." + __name__)
+
+_HOST = "127.0.0.1"
+
+_SESSION_PATH_RE = re.compile(r"^/apps/[^/]+/users/[^/]+/sessions/([^/]+)")
+_SESSIONS_PATH_RE = re.compile(r"^/apps/[^/]+/users/[^/]+/sessions/?$")
+_TRACE_SESSION_PATH_RE = re.compile(r"^/debug/trace/session/([^/]+)$")
+_TRACE_EVENT_PATH_RE = re.compile(r"^/debug/trace/([^/]+)$")
+
+_HOP_BY_HOP_HEADERS = frozenset([
+    "connection",
+    "host",
+    "keep-alive",
+    "proxy-authenticate",
+    "proxy-authorization",
+    "te",
+    "trailer",
+    "transfer-encoding",
+    "upgrade",
+])
+
+_HTTP_METHODS = ["GET", "POST", "PUT", "PATCH", "DELETE", "OPTIONS", "HEAD"]
+
+
+def _run_worker(
+    sock: socket.socket, app_kwargs: dict[str, Any], log_level: int
+):
+  """Runs an API server app in a worker process, on the socket of the worker."""
+  from .fast_api import get_fast_api_app
+  from .utils import logs
+
+  logs.setup_adk_logger(log_level)
+  server = uvicorn.Server(
+      uvicorn.Config(get_fast_api_app(**app_kwargs), log_level=log_level)
+  )
+  server.run(sockets=[sock])
+
+
+def _bind_socket() -> socket.socket:
+  """Binds a socket to a free local port, for a worker to serve on."""
+  sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+  sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+  sock.bind((_HOST, 0))
+  return sock
+
+
+class _Worker:
+  """A worker process and its state."""
+
+  def __init__(self, index: int):
+    self.index = index
+    self.socket: Optional[socket.socket] = None
+    """The socket the worker serves on. It's bound by the router and kept open
+    across restarts, so that no other process can take its port."""
+    self.port: Optional[int] = None
+    self.process: Optional[multiprocessing.process.BaseProcess] = None
+    self.restarts = 0
+
+  @property
+  def url(self) -> str:
+    return f"http://{_HOST}:{self.port}"
+
+  def is_alive(self) -> bool:
+    return self.process is not None and self.process.is_alive()
+
+
+class WorkerPool:
+  """Starts, restarts and stops the worker processes."""
+
+  def __init__(
+      self,
+      num_workers: int,
+      app_kwargs: dict[str, Any],
+      *,
+      log_level: int = logging.INFO,
+  ):
+    """Initializes the worker pool.
+
+    Args:
+      num_workers: The number of worker processes.
+      app_kwargs: The keyword arguments of `get_fast_api_app` for each worker.
+        They must be picklable.
+      log_level: The log level of the workers.
+    """
+    self.workers = [_Worker(index) for index in range(num_workers)]
+    self._app_kwargs = app_kwargs
+    self._log_level = log_level
+    # Workers are spawned, not forked, so they do not inherit the router's
+    # threads and event loop.
+    self._context = multiprocessing.get_context("spawn")
+    self._round_robin = itertools.cycle(self.workers)
+
+  def _start_worker(self, worker: _Worker) -> None:
+    if worker.socket is None:
+      worker.socket = _bind_socket()
+      worker.port = worker.socket.getsockname()[1]
+    worker.process = self._context.Process(
+        target=_run_worker,
+        args=(worker.socket, self._app_kwargs, self._log_level),
+        name=f"adk_worker_{worker.index}",
+        daemon=True,
+    )
+    worker.process.start()
+    logger.info(
+        "Started worker %s (pid %s) on port %s.",
+        worker.index,
+        worker.process.pid,
+        worker.port,
+    )
+
+  def start(self) -> None:
+    for worker in self.workers:
+      self._start_worker(worker)
+
+  def restart_exited_workers(self) -> None:
+    for worker in self.workers:
+      if worker.process is not None and not worker.is_alive():
+        logger.warning(
+            "Worker %s exited with code %s, restarting it. Its in-memory"
+            " sessions are lost.",
+            worker.index,
+            worker.process.exitcode,
+        )
+        worker.restarts += 1
+        self._start_worker(worker)
+
+  def stop(self, timeout_secs: float = 10.0) -> None:
+    for worker in self.workers:
+      if worker.is_alive():
+        worker.process.terminate()
+    deadline = time.monotonic() + timeout_secs
+    for worker in self.workers:
+      if worker.process is None:
+        continue
+      worker.process.join(max(0.0, deadline - time.monotonic()))
+      if worker.process.is_alive():
+        worker.process.kill()
+        worker.process.join()
+    for worker in self.workers:
+      if worker.socket is not None:
+        worker.socket.close()
+        worker.socket = None
+
+  def get_session_worker(self, session_id: str) -> _Worker:
+    """Returns the worker of a session, which is stable across restarts."""
+    return self.workers[zlib.crc32(session_id.encode()) % len(self.workers)]
+
+  def get_next_worker(self) -> _Worker:
+    return next(self._round_robin)
+
+
+def _get_session_id(path: str, body: bytes) -> Optional[str]:
+  """Returns the session id of a request, from its path or JSON body."""
+  if match := _SESSION_PATH_RE.match(path) or _TRACE_SESSION_PATH_RE.match(
+      path
+  ):
+    return match.group(1)
+  if not body.startswith(b"{"):
+    return None
+  try:
+    session_id = json.loads(body).get("session_id")
+  except ValueError:
+    return None
+  return session_id if isinstance(session_id, str) else None
+
+
+def _filter_headers(
+    headers: list[tuple[bytes, bytes]],
+) -> list[tuple[bytes, bytes]]:
+  return [
+      (name, value)
+      for name, value in headers
+      if name.decode("latin-1").lower() not in _HOP_BY_HOP_HEADERS
+  ]
+
+
+def create_router_app(
+    worker_pool: WorkerPool,
+    *,
+    in_memory_sessions: bool = True,
+    startup_timeout_secs: float = 60.0,
+    health_check_interval_secs: float = 1.0,
+) -> FastAPI:
+  """Creates the app that forwards requests to the workers.
+
+  Args:
+    worker_pool: The workers, which are started with the app.
+    in_memory_sessions: Whether each worker has its own sessions. If so,
+      sessions are created with an id chosen by the router, so that they are
+      created on the worker of that id, and listing sessions lists the
+      sessions of all workers.
+    startup_timeout_secs: How long to wait for the workers to be healthy.
+    health_check_interval_secs: How often exited workers are restarted.
+
+  Returns:
+    The router app.
+  """
+  client: Optional[httpx.AsyncClient] = None
+
+  async def is_healthy(worker: _Worker) -> bool:
+    if not worker.is_alive():
+      return False
+    try:
+      response = await client.get(f"{worker.url}/health", timeout=2.0)
+    except httpx.HTTPError:
+      return False
+    return response.status_code == 200
+
+  async def wait_until_healthy() -> None:
+    deadline = time.monotonic() + startup_timeout_secs
+    for worker in worker_pool.workers:
+      while not await is_healthy(worker):
+        if not worker.is_alive():
+          raise RuntimeError(
+              f"Worker {worker.index} exited with code"
+              f" {worker.process.exitcode} on startup."
+          )
+        if time.monotonic() > deadline:
+          raise RuntimeError(f"Worker {worker.index} did not start in time.")
+        await asyncio.sleep(0.1)
+
+  async def supervise() -> None:
+    while True:
+      await asyncio.sleep(health_check_interval_secs)
+      worker_pool.restart_exited_workers()
+
+  @asynccontextmanager
+  async def lifespan(app: FastAPI):
+    nonlocal client
+    client = httpx.AsyncClient(timeout=None)
+    worker_pool.start()
+    supervisor = None
+    try:
+      await wait_until_healthy()
+      logger.info("%s workers are ready.", len(worker_pool.workers))
+      supervisor = asyncio.create_task(supervise())
+      yield
+    finally:
+      if supervisor:
+        supervisor.cancel()
+      await client.aclose()
+      worker_pool.stop()
+
+  app = FastAPI(lifespan=lifespan)
+
+  @app.get("/health")
+  async def health() -> JSONResponse:
+    healthy = await asyncio.gather(
+        *[is_healthy(worker) for worker in worker_pool.workers]
+    )
+    workers = [
+        {
+            "index": worker.index,
+            "pid": worker.process.pid if worker.process else None,
+            "port": worker.port,
+            "alive": worker.is_alive(),
+            "healthy": is_worker_healthy,
+            "restarts": worker.restarts,
+        }
+        for worker, is_worker_healthy in zip(worker_pool.workers, healthy)
+    ]
+    return JSONResponse(
+        {"status": "ok" if all(healthy) else "degraded", "workers": workers},
+        status_code=200 if all(healthy) else 503,
+    )
+
+  async def forward(
+      worker: _Worker, request: Request, path: str, body: bytes
+  ) -> Response:
+    upstream_request = client.build_request(
+        request.method,
+        httpx.URL(worker.url + path, query=request.url.query.encode()),
+        headers=_filter_headers(request.headers.raw),
+        content=body,
+    )
+    try:
+      upstream_response = await client.send(upstream_request, stream=True)
+    except httpx.TransportError as e:
+      logger.warning("Worker %s is unavailable: %s", worker.index, e)
+      return JSONResponse({"detail": "Worker unavailable"}, status_code=503)
+    # Responses are streamed, so that server-sent events are not buffered.
+    response = StreamingResponse(
+        upstream_response.aiter_raw(),
+        status_code=upstream_response.status_code,
+        background=BackgroundTask(upstream_response.aclose),
+    )
+    response.raw_headers = _filter_headers(upstream_response.headers.raw)
+    return response
+
+  async def get_all(request: Request, path: str) -> list[httpx.Response]:
+    return await asyncio.gather(*[
+        client.get(
+            httpx.URL(worker.url + path, query=request.url.query.encode())
+        )
+        for worker in worker_pool.workers
+    ])
+
+  @app.api_route("/{path:path}", methods=_HTTP_METHODS)
+  async def route(request: Request) -> Response:
+    path = request.url.path
+    body = await request.body()
+
+    if request.method == "GET" and _TRACE_EVENT_PATH_RE.match(path):
+      # Traces are kept by the worker that ran the event.
+      for response in await get_all(request, path):
+        if response.status_code != 404:
+          return Response(
+              response.content,
+              status_code=response.status_code,
+              media_type=response.headers.get("content-type"),
+          )
+      return JSONResponse({"detail": "Trace not found"}, status_code=404)
+
+    if in_memory_sessions and _SESSIONS_PATH_RE.match(path):
+      if request.method == "GET":
+        sessions = []
+        for response in await get_all(request, path):
+          if response.status_code != 200:
+            return Response(
+                response.content,
+                status_code=response.status_code,
+                media_type=response.headers.get("content-type"),
+            )
+          sessions.extend(response.json())
+        return JSONResponse(sessions)
+      if request.method == "POST":
+        path = f"{path.rstrip('/')}/{uuid.uuid4()}"
+
+    session_id = _get_session_id(path, body)
+    worker = (
+        worker_pool.get_session_worker(session_id)
+        if session_id
+        else worker_pool.get_next_worker()
+    )
+    return await forward(worker, request, path, body)
+
+  @app.websocket("/run_live")
+  async def run_live(websocket: WebSocket) -> None:
+    session_id = websocket.query_params.get("session_id", "")
+    worker = worker_pool.get_session_worker(session_id)
+    url = f"ws://{_HOST}:{worker.port}/run_live?{websocket.url.query}"
+    await websocket.accept()
+    try:
+      async with websocket_connect(url) as upstream:
+
+        async def forward_to_worker():
+          try:
+            while True:
+              await upstream.send(await websocket.receive_text())
+          except WebSocketDisconnect:
+            pass
+
+        async def forward_to_client():
+          async for message in upstream:
+            if isinstance(message, bytes):
+              await websocket.send_bytes(message)
+            else:
+              await websocket.send_text(message)
+
+        tasks = [
+            asyncio.create_task(forward_to_worker()),
+            asyncio.create_task(forward_to_client()),
+        ]
+        try:
+          await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+          for task in tasks:
+            task.cancel()
+        close_code = upstream.close_code or 1000
+        close_reason = upstream.close_reason or ""
+    except (OSError, WebSocketException) as e:
+      logger.warning("Worker %s is unavailable: %s", worker.index, e)
+      close_code, close_reason = 1011, "Worker unavailable"
+    try:
+      await websocket.close(code=close_code, reason=close_reason)
+    except RuntimeError:
+      # The client already closed the connection.
+      pass
+
+  return app
+
+
+def run_multi_worker_server(
+    *,
+    num_workers: int,
+    host: str,
+    port: int,
+    log_level: int = logging.INFO,
+    **app_kwargs: Any,
+) -> None:
+  """Serves the API server from `num_workers` worker processes.
+
+  Args:
+    num_workers: The number of worker processes, e.g. the number of cores.
+    host: The binding host of the router.
+    port: The port of the router.
+    log_level: The log level of the router and the workers.
+    **app_kwargs: The keyword arguments of `get_fast_api_app`.
+  """
+  worker_pool = WorkerPool(num_workers, app_kwargs, log_level=log_level)
+  app = create_router_app(
+      worker_pool,
+      in_memory_sessions=not app_kwargs.get("session_db_url"),
+  )
+  logger.info(
+      "Serving from %s workers, router pid %s.", num_workers, os.getpid()
+  )
+  uvicorn.run(app, host=host, port=port, log_level=log_level)
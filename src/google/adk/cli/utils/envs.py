@@ -14,11 +14,19 @@
 
 import logging
 import os
+import threading
+from typing import Optional
 
 from dotenv import load_dotenv
 
 logger = logging.getLogger(__file__)
 
+_lock = threading.Lock()
+_dotenv_file_paths: dict[tuple[str, str, str], str] = {}
+"""The .env file found for each agent, keyed by the load arguments."""
+_last_loaded_dotenv: Optional[tuple[str, float]] = None
+"""The path and modification time of the last loaded .env file."""
+
 
 def _walk_to_root_until_found(folder, filename) -> str:
   checkpath = os.path.join(folder, filename)
@@ -36,14 +44,22 @@ def load_dotenv_for_agent(
     agent_name: str, agent_parent_folder: str, filename: str = '.env'
 ):
   """Loads the .env file for the agent module."""
+  global _last_loaded_dotenv
 
   # Gets the folder of agent_module as starting_folder
   starting_folder = os.path.abspath(
       os.path.join(agent_parent_folder, agent_name)
   )
   dotenv_file_path = _walk_to_root_until_found(starting_folder, filename)
+  with _lock:
+    _dotenv_file_paths[(agent_name, agent_parent_folder, filename)] = (
+        dotenv_file_path
+    )
   if dotenv_file_path:
+    mtime = _get_mtime(dotenv_file_path)
     load_dotenv(dotenv_file_path, override=True, verbose=True)
+    with _lock:
+      _last_loaded_dotenv = (dotenv_file_path, mtime)
     logger.info(
         'Loaded %s file for %s at %s',
         filename,
@@ -52,3 +68,33 @@ def load_dotenv_for_agent(
     )
   else:
     logger.info('No %s file found for %s', filename, agent_name)
+
+
+def _get_mtime(path: str) -> float:
+  try:
+    return os.stat(path).st_mtime
+  except OSError:
+    return -1.0
+
+
+def load_dotenv_for_agent_if_changed(
+    agent_name: str, agent_parent_folder: str, filename: str = '.env'
+):
+  """Loads the .env file for the agent module, unless it is already loaded.
+
+  The file is loaded again if it changed since it was loaded, or if another
+  .env file was loaded since, so that the environment is the agent's. While
+  the loaded file is unchanged, this only checks its modification time.
+  """
+  key = (agent_name, agent_parent_folder, filename)
+  with _lock:
+    dotenv_file_path = _dotenv_file_paths.get(key)
+    last_loaded_dotenv = _last_loaded_dotenv
+  # Agents without a .env file are looked up again, in case one was added.
+  if (
+      dotenv_file_path
+      and last_loaded_dotenv
+      and last_loaded_dotenv == (dotenv_file_path, _get_mtime(dotenv_file_path))
+  ):
+    return
+  load_dotenv_for_agent(agent_name, agent_parent_folder, filename)
@@ -0,0 +1,163 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""A bounded in-memory store of finished spans for the trace endpoints."""
+
+from __future__ import annotations
+
+import collections
+import threading
+import time
+from typing import Any
+from typing import NamedTuple
+from typing import Optional
+
+from opentelemetry.sdk.trace import ReadableSpan
+
+DEFAULT_MAX_SPANS = 10000
+"""The default max number of stored spans."""
+
+DEFAULT_MAX_AGE_SECS = 3600.0
+"""The default max age of stored spans, in seconds."""
+
+
+class _StoredSpan(NamedTuple):
+  span: ReadableSpan
+  stored_at: float
+  event_id: Optional[str]
+  event_attributes: Optional[dict[str, Any]]
+
+
+class SpanStore:
+  """Stores finished spans, indexed by trace, session and event.
+
+  The oldest spans are evicted when there are more than `max_spans` spans, or
+  when they are older than `max_age_secs`. Lookups only touch the returned
+  spans, however many spans are stored.
+  """
+
+  def __init__(
+      self,
+      *,
+      max_spans: int = DEFAULT_MAX_SPANS,
+      max_age_secs: Optional[float] = DEFAULT_MAX_AGE_SECS,
+  ):
+    """Initializes the span store.
+
+    Args:
+      max_spans: The max number of stored spans.
+      max_age_secs: The max age of stored spans in seconds, or None to keep
+        spans until they are evicted by `max_spans`.
+    """
+    self.max_spans = max_spans
+    self.max_age_secs = max_age_secs
+    self._lock = threading.Lock()
+    self._spans: collections.deque[_StoredSpan] = collections.deque()
+    """All stored spans, the oldest first."""
+    self._spans_by_trace: dict[int, collections.deque[ReadableSpan]] = {}
+    self._trace_ids_by_session: dict[str, dict[int, None]] = {}
+    """The trace ids of each session, in the order they were added."""
+    self._session_ids_by_trace: dict[int, set[str]] = {}
+    self._event_attributes: dict[str, dict[str, Any]] = {}
+    """The attributes of the span of each event, keyed by event id."""
+
+  def add(
+      self,
+      span: ReadableSpan,
+      *,
+      session_id: Optional[str] = None,
+      event_id: Optional[str] = None,
+      event_attributes: Optional[dict[str, Any]] = None,
+  ) -> None:
+    """Stores a finished span.
+
+    Args:
+      span: The span.
+      session_id: The session of the span's trace, if known.
+      event_id: The event the span belongs to, if any.
+      event_attributes: The attributes returned for the event.
+    """
+    trace_id = span.context.trace_id
+    if event_id:
+      event_attributes = event_attributes or {}
+    with self._lock:
+      self._spans.append(
+          _StoredSpan(span, time.monotonic(), event_id, event_attributes)
+      )
+      if trace_id not in self._spans_by_trace:
+        self._spans_by_trace[trace_id] = collections.deque()
+      self._spans_by_trace[trace_id].append(span)
+      if session_id:
+        self._trace_ids_by_session.setdefault(session_id, {})[trace_id] = None
+        self._session_ids_by_trace.setdefault(trace_id, set()).add(session_id)
+      if event_id:
+        self._event_attributes[event_id] = event_attributes
+      self._evict()
+
+  def _evict(self) -> None:
+    """Evicts the spans that are over the limits. Called with the lock held."""
+    min_stored_at = (
+        None
+        if self.max_age_secs is None
+        else time.monotonic() - self.max_age_secs
+    )
+    while self._spans and (
+        len(self._spans) > self.max_spans
+        or (
+            min_stored_at is not None
+            and self._spans[0].stored_at < min_stored_at
+        )
+    ):
+      span, _, event_id, event_attributes = self._spans.popleft()
+      trace_id = span.context.trace_id
+      # Spans are stored in order, so the oldest span of a trace is first.
+      trace_spans = self._spans_by_trace[trace_id]
+      trace_spans.popleft()
+      if not trace_spans:
+        del self._spans_by_trace[trace_id]
+        for session_id in self._session_ids_by_trace.pop(trace_id, ()):
+          trace_ids = self._trace_ids_by_session[session_id]
+          del trace_ids[trace_id]
+          if not trace_ids:
+            del self._trace_ids_by_session[session_id]
+      # The event attributes may have been replaced by a later span.
+      if event_id and self._event_attributes.get(event_id) is event_attributes:
+        del self._event_attributes[event_id]
+
+  def get_session_spans(self, session_id: str) -> list[ReadableSpan]:
+    """Returns the spans of the traces of a session, oldest trace first."""
+    with self._lock:
+      self._evict()
+      spans = []
+      for trace_id in self._trace_ids_by_session.get(session_id, ()):
+        spans.extend(self._spans_by_trace.get(trace_id, ()))
+      return spans
+
+  def get_event_attributes(self, event_id: str) -> Optional[dict[str, Any]]:
+    """Returns the span attributes of an event, or None if not stored."""
+    with self._lock:
+      self._evict()
+      return self._event_attributes.get(event_id)
+
+  def __len__(self) -> int:
+    with self._lock:
+      return len(self._spans)
+
+  def clear(self) -> None:
+    with self._lock:
+      self._spans.clear()
+      self._spans_by_trace.clear()
+      self._trace_ids_by_session.clear()
+      self._session_ids_by_trace.clear()
+      self._event_attributes.clear()
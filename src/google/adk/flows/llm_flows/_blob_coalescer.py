@@ -0,0 +1,74 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import time
+from typing import Optional
+
+from google.genai import types
+
+
+class BlobCoalescer:
+  """Concatenates consecutive realtime blobs of the same mime type.
+
+  The data is appended to one growing buffer, so a coalesced blob of n blobs
+  costs one copy of the data instead of n concatenations. A coalesced blob
+  should be flushed once it `is_full`, or once `get_remaining_delay_secs`
+  reaches zero.
+  """
+
+  def __init__(self, *, max_bytes: int, max_delay_secs: float):
+    self._max_bytes = max_bytes
+    self._max_delay_secs = max_delay_secs
+    self._buffer = bytearray()
+    self._mime_type: Optional[str] = None
+    self._first_added_at: Optional[float] = None
+    """When the first pending blob was added, or None if none is pending."""
+
+  @property
+  def pending(self) -> bool:
+    """Whether there are blobs that were not flushed."""
+    return self._first_added_at is not None
+
+  def can_add(self, blob: types.Blob) -> bool:
+    """Whether the blob can be coalesced with the pending blobs."""
+    return not self.pending or blob.mime_type == self._mime_type
+
+  def add(self, blob: types.Blob) -> None:
+    """Adds a blob. The pending blobs must be flushed first if not `can_add`."""
+    if not self.pending:
+      self._mime_type = blob.mime_type
+      self._first_added_at = time.monotonic()
+    if blob.data:
+      self._buffer += blob.data
+
+  def is_full(self) -> bool:
+    return len(self._buffer) >= self._max_bytes
+
+  def get_remaining_delay_secs(self) -> float:
+    """Returns how long the pending blobs can wait to be flushed."""
+    if self._first_added_at is None:
+      return self._max_delay_secs
+    return max(
+        0.0, self._first_added_at + self._max_delay_secs - time.monotonic()
+    )
+
+  def flush(self) -> types.Blob:
+    """Returns the pending blobs as one blob, and clears them."""
+    blob = types.Blob(data=bytes(self._buffer), mime_type=self._mime_type)
+    self._buffer.clear()
+    self._mime_type = None
+    self._first_added_at = None
+    return blob
@@ -21,6 +21,7 @@ from typing import AsyncGenerator
 
 from typing_extensions import override
 
+from ...agents import _agent_tree
 from ...agents.invocation_context import InvocationContext
 from ...events.event import Event
 from ...models.llm_request import LlmRequest
@@ -56,9 +57,8 @@ class _AgentTransferLlmRequestProcessor(BaseLlmRequestProcessor):
         )
     ])
 
-    transfer_to_agent_tool = FunctionTool(func=transfer_to_agent)
     tool_context = ToolContext(invocation_context)
-    await transfer_to_agent_tool.process_llm_request(
+    await _transfer_to_agent_tool.process_llm_request(
         tool_context=tool_context, llm_request=llm_request
     )
 
@@ -68,6 +68,9 @@ class _AgentTransferLlmRequestProcessor(BaseLlmRequestProcessor):
 
 request_processor = _AgentTransferLlmRequestProcessor()
 
+_transfer_to_agent_tool = FunctionTool(func=transfer_to_agent)
+"""The transfer tool, shared so that its declaration is built once."""
+
 
 def _build_target_agents_info(target_agent: BaseAgent) -> str:
   return f"""
@@ -111,22 +114,6 @@ _TRANSFER_TO_AGENT_FUNCTION_NAME = transfer_to_agent.__name__
 
 
 def _get_transfer_targets(agent: LlmAgent) -> list[BaseAgent]:
-  from ...agents.llm_agent import LlmAgent
-
-  result = []
-  result.extend(agent.sub_agents)
-
-  if not agent.parent_agent or not isinstance(agent.parent_agent, LlmAgent):
-    return result
-
-  if not agent.disallow_transfer_to_parent:
-    result.append(agent.parent_agent)
-
-  if not agent.disallow_transfer_to_peers:
-    result.extend([
-        peer_agent
-        for peer_agent in agent.parent_agent.sub_agents
-        if peer_agent.name != agent.name
-    ])
-
-  return result
+  if agent_tree := agent._get_agent_tree():
+    return agent_tree.get_transfer_targets(agent)
+  return _agent_tree.compute_transfer_targets(agent)
@@ -30,6 +30,7 @@ from . import functions
 from ...agents.base_agent import BaseAgent
 from ...agents.callback_context import CallbackContext
 from ...agents.invocation_context import InvocationContext
+from ...agents.live_request_queue import LiveRequest
 from ...agents.live_request_queue import LiveRequestQueue
 from ...agents.readonly_context import ReadonlyContext
 from ...agents.run_config import StreamingMode
@@ -42,6 +43,7 @@ from ...telemetry import trace_call_llm
 from ...telemetry import trace_send_data
 from ...telemetry import tracer
 from ...tools.tool_context import ToolContext
+from ._blob_coalescer import BlobCoalescer
 
 if TYPE_CHECKING:
   from ...agents.llm_agent import LlmAgent
@@ -126,7 +128,9 @@ class BaseLlmFlow(ABC):
           # send back the function response
           if event.get_function_responses():
             logger.debug('Sending back last function response event: %s', event)
-            invocation_context.live_request_queue.send_content(event.content)
+            await invocation_context.live_request_queue.send_async(
+                LiveRequest(content=event.content)
+            )
           if (
               event.content
               and event.content.parts
@@ -165,48 +169,100 @@ class BaseLlmFlow(ABC):
       invocation_context: InvocationContext,
   ):
     """Sends data to model."""
+    coalescing_config = invocation_context.run_config.realtime_input_coalescing
+    blob_coalescer = (
+        BlobCoalescer(
+            max_bytes=coalescing_config.max_bytes,
+            max_delay_secs=coalescing_config.max_delay_secs,
+        )
+        if coalescing_config
+        else None
+    )
     while True:
       live_request_queue = invocation_context.live_request_queue
-      try:
-        # Streamlit's execution model doesn't preemptively yield to the event
-        # loop. Therefore, we must explicitly introduce timeouts to allow the
-        # event loop to process events.
-        # TODO: revert back(remove timeout) once we move off streamlit.
-        live_request = await asyncio.wait_for(
-            live_request_queue.get(), timeout=0.25
-        )
-        # duplicate the live_request to all the active streams
-        logger.debug(
-            'Sending live request %s to active streams: %s',
-            live_request,
-            invocation_context.active_streaming_tools,
+      if blob_coalescer and blob_coalescer.pending:
+        # Waits for more blobs only until the coalesced blob is due.
+        if not blob_coalescer.get_remaining_delay_secs():
+          await self._send_realtime(
+              llm_connection, invocation_context, blob_coalescer.flush()
+          )
+          continue
+        try:
+          live_request = live_request_queue.get_nowait()
+        except asyncio.QueueEmpty:
+          try:
+            live_request = await asyncio.wait_for(
+                live_request_queue.get(),
+                timeout=blob_coalescer.get_remaining_delay_secs(),
+            )
+          except asyncio.TimeoutError:
+            await self._send_realtime(
+                llm_connection, invocation_context, blob_coalescer.flush()
+            )
+            continue
+      else:
+        # Waits for the next request without polling, so idle sessions do not
+        # wake up the event loop.
+        live_request = await live_request_queue.get()
+      # duplicate the live_request to all the active streams
+      logger.debug(
+          'Sending live request %s to active streams: %s',
+          live_request,
+          invocation_context.active_streaming_tools,
+      )
+      if invocation_context.active_streaming_tools:
+        for active_streaming_tool in (
+            invocation_context.active_streaming_tools
+        ).values():
+          if active_streaming_tool.stream:
+            active_streaming_tool.stream.send(live_request)
+      await asyncio.sleep(0)
+      if (
+          blob_coalescer
+          and blob_coalescer.pending
+          and not (
+              live_request.blob and blob_coalescer.can_add(live_request.blob)
+          )
+      ):
+        # Sends the coalesced blob first, to keep the requests in order.
+        await self._send_realtime(
+            llm_connection, invocation_context, blob_coalescer.flush()
         )
-        if invocation_context.active_streaming_tools:
-          for active_streaming_tool in (
-              invocation_context.active_streaming_tools
-          ).values():
-            if active_streaming_tool.stream:
-              active_streaming_tool.stream.send(live_request)
-        await asyncio.sleep(0)
-      except asyncio.TimeoutError:
-        continue
       if live_request.close:
         await llm_connection.close()
         return
       if live_request.blob:
-        # Cache audio data here for transcription
-        if not invocation_context.transcription_cache:
-          invocation_context.transcription_cache = []
-        if not invocation_context.run_config.input_audio_transcription:
-          # if the live model's input transcription is not enabled, then
-          # we use our onwn audio transcriber to achieve that.
-          invocation_context.transcription_cache.append(
-              TranscriptionEntry(role='user', data=live_request.blob)
+        if not blob_coalescer:
+          await self._send_realtime(
+              llm_connection, invocation_context, live_request.blob
           )
-        await llm_connection.send_realtime(live_request.blob)
+        else:
+          blob_coalescer.add(live_request.blob)
+          if blob_coalescer.is_full():
+            await self._send_realtime(
+                llm_connection, invocation_context, blob_coalescer.flush()
+            )
       if live_request.content:
         await llm_connection.send_content(live_request.content)
 
+  async def _send_realtime(
+      self,
+      llm_connection: BaseLlmConnection,
+      invocation_context: InvocationContext,
+      blob: types.Blob,
+  ):
+    """Sends a realtime blob to the model, and caches it for transcription."""
+    # Cache audio data here for transcription
+    if not invocation_context.transcription_cache:
+      invocation_context.transcription_cache = []
+    if not invocation_context.run_config.input_audio_transcription:
+      # if the live model's input transcription is not enabled, then
+      # we use our onwn audio transcriber to achieve that.
+      invocation_context.transcription_cache.append(
+          TranscriptionEntry(role='user', data=blob)
+      )
+    await llm_connection.send_realtime(blob)
+
   async def _receive_from_model(
       self,
       llm_connection: BaseLlmConnection,
@@ -25,6 +25,7 @@ from typing_extensions import override
 from ...agents.invocation_context import InvocationContext
 from ...events.event import Event
 from ...models.llm_request import LlmRequest
+from ...sessions._event_index import EventIndex
 from ._base_llm_processor import BaseLlmRequestProcessor
 from .functions import remove_client_function_call_id
 from .functions import REQUEST_EUC_FUNCTION_CALL_NAME
@@ -44,11 +45,9 @@ class _ContentLlmRequestProcessor(BaseLlmRequestProcessor):
       return
 
     if agent.include_contents != 'none':
-      llm_request.contents = _get_contents(
-          invocation_context.branch,
-          invocation_context.session.events,
-          agent.name,
-      )
+      llm_request.contents = _get_contents_builder(
+          invocation_context, agent.name
+      ).build(invocation_context.session.events)
 
     # Maintain async generator behavior
     if False:  # Ensures it behaves as a generator
@@ -58,18 +57,96 @@ class _ContentLlmRequestProcessor(BaseLlmRequestProcessor):
 request_processor = _ContentLlmRequestProcessor()
 
 
+class _ContentsBuilder:
+  """Incrementally builds the contents of a session for one agent and branch.
+
+  Gives the same result as `_get_contents`, but remembers the events it has
+  already seen: only the events appended since the last build are filtered and
+  converted, and the converted contents are reused across builds. Events are
+  expected to be immutable once appended to the session.
+  """
+
+  def __init__(self, current_branch: Optional[str], agent_name: str = ''):
+    self._current_branch = current_branch
+    self._agent_name = agent_name
+    self._num_events = 0
+    self._last_event: Optional[Event] = None
+    self._filtered_events: list[Event] = []
+    # Converted contents keyed by the id of the filtered events. The filtered
+    # events are kept alive by `_filtered_events`, so the ids are stable.
+    self._contents: dict[int, types.Content] = {}
+    self._event_index = EventIndex()
+
+  def build(self, events: list[Event]) -> list[types.Content]:
+    """Returns the contents for the given events of the session."""
+    if len(events) < self._num_events or (
+        self._num_events
+        and events[self._num_events - 1] is not self._last_event
+    ):
+      # The events are not an extension of the events seen so far.
+      self._num_events = 0
+      self._last_event = None
+      self._filtered_events = []
+      self._contents = {}
+
+    for event in events[self._num_events :]:
+      filtered_event = _filter_event(
+          self._current_branch, self._agent_name, event
+      )
+      if filtered_event:
+        self._filtered_events.append(filtered_event)
+        self._contents[id(filtered_event)] = _to_request_content(filtered_event)
+    if events:
+      self._num_events = len(events)
+      self._last_event = events[-1]
+
+    event_index = self._event_index.update(self._filtered_events)
+    result_events = _rearrange_events_for_latest_function_response(
+        self._filtered_events, event_index
+    )
+    result_events = _rearrange_events_for_async_function_responses_in_history(
+        result_events,
+        event_index if result_events is self._filtered_events else None,
+    )
+    contents = []
+    for event in result_events:
+      content = self._contents.get(id(event))
+      if content is None:
+        # Merged function response events are new on every build.
+        contents.append(_to_request_content(event))
+      else:
+        # Later request processors may modify the contents and their parts, so
+        # hand out copies that share only the nested values.
+        contents.append(
+            content.model_copy(
+                update={'parts': [part.model_copy() for part in content.parts]}
+            )
+        )
+    return contents
+
+
+def _get_contents_builder(
+    invocation_context: InvocationContext, agent_name: str
+) -> _ContentsBuilder:
+  """Returns the contents builder of the invocation for the agent."""
+  key = (
+      invocation_context.session.id,
+      agent_name,
+      invocation_context.branch,
+  )
+  builders = invocation_context._contents_builders
+  if key not in builders:
+    builders[key] = _ContentsBuilder(invocation_context.branch, agent_name)
+  return builders[key]
+
+
 def _rearrange_events_for_async_function_responses_in_history(
     events: list[Event],
+    event_index: Optional[EventIndex] = None,
 ) -> list[Event]:
   """Rearrange the async function_response events in the history."""
-
-  function_call_id_to_response_events_index: dict[str, list[Event]] = {}
-  for i, event in enumerate(events):
-    function_responses = event.get_function_responses()
-    if function_responses:
-      for function_response in function_responses:
-        function_call_id = function_response.id
-        function_call_id_to_response_events_index[function_call_id] = i
+  if event_index is None:
+    event_index = EventIndex().update(events)
 
   result_events: list[Event] = []
   for event in events:
@@ -80,11 +157,12 @@ def _rearrange_events_for_async_function_responses_in_history(
 
       function_response_events_indices = set()
       for function_call in event.get_function_calls():
-        function_call_id = function_call.id
-        if function_call_id in function_call_id_to_response_events_index:
-          function_response_events_indices.add(
-              function_call_id_to_response_events_index[function_call_id]
-          )
+        # The last response event of the function call, if any.
+        response_indices = event_index.get_function_response_indices(
+            function_call.id
+        )
+        if response_indices:
+          function_response_events_indices.add(response_indices[-1])
       result_events.append(event)
       if not function_response_events_indices:
         continue
@@ -107,6 +185,7 @@ def _rearrange_events_for_async_function_responses_in_history(
 
 def _rearrange_events_for_latest_function_response(
     events: list[Event],
+    event_index: Optional[EventIndex] = None,
 ) -> list[Event]:
   """Rearrange the events for the latest function_response.
 
@@ -116,6 +195,7 @@ def _rearrange_events_for_latest_function_response(
 
   Args:
     events: A list of events.
+    event_index: The index of the events, if already built.
 
   Returns:
     A list of events with the latest function_response rearranged.
@@ -140,9 +220,14 @@ def _rearrange_events_for_latest_function_response(
       if function_call.id in function_responses_ids:
         return events
 
+  if event_index is None:
+    event_index = EventIndex().update(events)
+
   function_call_event_idx = -1
   # look for corresponding function call event reversely
-  for idx in range(len(events) - 2, -1, -1):
+  for idx in reversed(event_index.get_function_call_event_indices()):
+    if idx > len(events) - 2:
+      continue
     event = events[idx]
     function_calls = event.get_function_calls()
     if function_calls:
@@ -166,15 +251,15 @@ def _rearrange_events_for_latest_function_response(
   # collect all function response between last function response event
   # and function call event
 
-  function_response_events: list[Event] = []
-  for idx in range(function_call_event_idx + 1, len(events) - 1):
-    event = events[idx]
-    function_responses = event.get_function_responses()
-    if function_responses and any([
-        function_response.id in function_responses_ids
-        for function_response in function_responses
-    ]):
-      function_response_events.append(event)
+  function_response_events_indices = {
+      idx
+      for function_response_id in function_responses_ids
+      for idx in event_index.get_function_response_indices(function_response_id)
+      if function_call_event_idx < idx < len(events) - 1
+  }
+  function_response_events = [
+      events[idx] for idx in sorted(function_response_events_indices)
+  ]
   function_response_events.append(events[-1])
 
   result_events = events[: function_call_event_idx + 1]
@@ -202,27 +287,9 @@ def _get_contents(
   # Parse the events, leaving the contents and the function calls and
   # responses from the current agent.
   for event in events:
-    if (
-        not event.content
-        or not event.content.role
-        or not event.content.parts
-        or event.content.parts[0].text == ''
-    ):
-      # Skip events without content, or generated neither by user nor by model
-      # or has empty text.
-      # E.g. events purely for mutating session states.
-      continue
-    if not _is_event_belongs_to_branch(current_branch, event):
-      # Skip events not belong to current branch.
-      continue
-    if _is_auth_event(event):
-      # skip auth event
-      continue
-    filtered_events.append(
-        _convert_foreign_event(event)
-        if _is_other_agent_reply(agent_name, event)
-        else event
-    )
+    filtered_event = _filter_event(current_branch, agent_name, event)
+    if filtered_event:
+      filtered_events.append(filtered_event)
 
   result_events = _rearrange_events_for_latest_function_response(
       filtered_events
@@ -232,12 +299,42 @@ def _get_contents(
   )
   contents = []
   for event in result_events:
-    content = copy.deepcopy(event.content)
-    remove_client_function_call_id(content)
-    contents.append(content)
+    contents.append(_to_request_content(event))
   return contents
 
 
+def _filter_event(
+    current_branch: Optional[str], agent_name: str, event: Event
+) -> Optional[Event]:
+  """Returns the event to include in the contents, or None to skip it."""
+  if (
+      not event.content
+      or not event.content.role
+      or not event.content.parts
+      or event.content.parts[0].text == ''
+  ):
+    # Skip events without content, or generated neither by user nor by model
+    # or has empty text.
+    # E.g. events purely for mutating session states.
+    return None
+  if not _is_event_belongs_to_branch(current_branch, event):
+    # Skip events not belong to current branch.
+    return None
+  if _is_auth_event(event):
+    # skip auth event
+    return None
+  if _is_other_agent_reply(agent_name, event):
+    return _convert_foreign_event(event)
+  return event
+
+
+def _to_request_content(event: Event) -> types.Content:
+  """Copies the content of the event for the LLM request."""
+  content = copy.deepcopy(event.content)
+  remove_client_function_call_id(content)
+  return content
+
+
 def _is_other_agent_reply(current_agent_name: str, event: Event) -> bool:
   """Whether the event is a reply from another agent."""
   return bool(
@@ -21,6 +21,8 @@ import inspect
 import logging
 from typing import Any
 from typing import AsyncGenerator
+from typing import Awaitable
+from typing import Callable
 from typing import cast
 from typing import Optional
 import uuid
@@ -29,6 +31,7 @@ from google.genai import types
 
 from ...agents.active_streaming_tool import ActiveStreamingTool
 from ...agents.invocation_context import InvocationContext
+from ...agents.live_request_queue import LiveRequest
 from ...auth.auth_tool import AuthToolArguments
 from ...events.event import Event
 from ...events.event_actions import EventActions
@@ -136,12 +139,15 @@ async def handle_function_calls_async(
   if not isinstance(agent, LlmAgent):
     return
 
-  function_calls = function_call_event.get_function_calls()
+  function_calls = [
+      function_call
+      for function_call in function_call_event.get_function_calls()
+      if not filters or function_call.id in filters
+  ]
 
-  function_response_events: list[Event] = []
-  for function_call in function_calls:
-    if filters and function_call.id not in filters:
-      continue
+  async def execute_function_call(
+      function_call: types.FunctionCall,
+  ) -> Optional[Event]:
     tool, tool_context = _get_tool_and_context(
         invocation_context,
         function_call_event,
@@ -185,7 +191,7 @@ async def handle_function_calls_async(
       if tool.is_long_running:
         # Allow long running function to return None to not provide function response.
         if not function_response:
-          continue
+          return None
 
       # Builds the function response event.
       function_response_event = __build_response_event(
@@ -196,7 +202,11 @@ async def handle_function_calls_async(
           args=function_args,
           function_response_event=function_response_event,
       )
-      function_response_events.append(function_response_event)
+      return function_response_event
+
+  function_response_events = await _execute_function_calls(
+      invocation_context, function_calls, execute_function_call
+  )
 
   if not function_response_events:
     return None
@@ -227,8 +237,9 @@ async def handle_function_calls_live(
   agent = cast(LlmAgent, invocation_context.agent)
   function_calls = function_call_event.get_function_calls()
 
-  function_response_events: list[Event] = []
-  for function_call in function_calls:
+  async def execute_function_call(
+      function_call: types.FunctionCall,
+  ) -> Optional[Event]:
     tool, tool_context = _get_tool_and_context(
         invocation_context, function_call_event, function_call, tools_dict
     )
@@ -279,7 +290,7 @@ async def handle_function_calls_live(
       if tool.is_long_running:
         # Allow async function to return None to not provide function response.
         if not function_response:
-          continue
+          return None
 
       # Builds the function response event.
       function_response_event = __build_response_event(
@@ -291,7 +302,11 @@ async def handle_function_calls_live(
           response_event_id=function_response_event.id,
           function_response=function_response,
       )
-      function_response_events.append(function_response_event)
+      return function_response_event
+
+  function_response_events = await _execute_function_calls(
+      invocation_context, function_calls, execute_function_call
+  )
 
   if not function_response_events:
     return None
@@ -310,6 +325,56 @@ async def handle_function_calls_live(
   return merged_event
 
 
+async def _execute_function_calls(
+    invocation_context: InvocationContext,
+    function_calls: list[types.FunctionCall],
+    execute_function_call: Callable[
+        [types.FunctionCall], Awaitable[Optional[Event]]
+    ],
+) -> list[Event]:
+  """Executes the function calls and returns their function response events.
+
+  The function calls are executed one after another, unless
+  `RunConfig.max_concurrent_function_calls` allows running them concurrently.
+  Either way, the returned events are in the order of the function calls.
+  """
+  max_concurrent_function_calls = (
+      invocation_context.run_config.max_concurrent_function_calls
+      if invocation_context.run_config
+      else 1
+  )
+  if max_concurrent_function_calls == 1 or len(function_calls) <= 1:
+    function_response_events = [
+        await execute_function_call(function_call)
+        for function_call in function_calls
+    ]
+  else:
+    semaphore = asyncio.Semaphore(
+        max_concurrent_function_calls
+        if max_concurrent_function_calls > 0
+        else len(function_calls)
+    )
+
+    async def execute_with_limit(
+        function_call: types.FunctionCall,
+    ) -> Optional[Event]:
+      async with semaphore:
+        return await execute_function_call(function_call)
+
+    tasks = [
+        asyncio.create_task(execute_with_limit(function_call))
+        for function_call in function_calls
+    ]
+    try:
+      function_response_events = await asyncio.gather(*tasks)
+    except BaseException:
+      # Do not leave the other function calls running in the background.
+      for task in tasks:
+        task.cancel()
+      raise
+  return [event for event in function_response_events if event]
+
+
 async def _process_function_live_helper(
     tool, tool_context, function_call, function_args, invocation_context
 ):
@@ -375,7 +440,9 @@ async def _process_function_live_helper(
                   )
               ],
           )
-          invocation_context.live_request_queue.send_content(updated_content)
+          await invocation_context.live_request_queue.send_async(
+              LiveRequest(content=updated_content)
+          )
       except asyncio.CancelledError:
         raise  # Re-raise to properly propagate the cancellation
 
@@ -498,16 +565,16 @@ def merge_parallel_function_response_events(
   # Use the first event as the "base" for common attributes
   base_event = function_response_events[0]
 
-  # Merge actions from all events
-
+  # Merge actions from all events. The dict fields, e.g. state_delta, are
+  # merged key by key, and later events only override the other fields when
+  # they set them, so no function call loses the actions of another.
   merged_actions = EventActions()
-  merged_requested_auth_configs = {}
   for event in function_response_events:
-    merged_requested_auth_configs.update(event.actions.requested_auth_configs)
-    merged_actions = merged_actions.model_copy(
-        update=event.actions.model_dump()
-    )
-  merged_actions.requested_auth_configs = merged_requested_auth_configs
+    for field_name, value in event.actions:
+      if isinstance(value, dict):
+        getattr(merged_actions, field_name).update(value)
+      elif value is not None:
+        setattr(merged_actions, field_name, value)
   # Create the new merged event
   merged_event = Event(
       invocation_id=Event.new_id(),
@@ -33,3 +33,14 @@ except ImportError:
       ' VertexAiRagMemoryService please install it. If not, you can ignore this'
       ' warning.'
   )
+
+try:
+  from .vector_memory_service import HashingEmbedder
+  from .vector_memory_service import VectorMemoryService
+
+  __all__.extend(['HashingEmbedder', 'VectorMemoryService'])
+except ImportError:
+  logger.debug(
+      'NumPy is not installed. If you want to use the VectorMemoryService'
+      ' please install it. If not, you can ignore this warning.'
+  )
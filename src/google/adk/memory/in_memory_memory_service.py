@@ -15,7 +15,11 @@
 
 from __future__ import annotations
 
+from collections import Counter
+import heapq
+import math
 import re
+from typing import Optional
 from typing import TYPE_CHECKING
 
 from typing_extensions import override
@@ -29,66 +33,167 @@ if TYPE_CHECKING:
   from ..events.event import Event
   from ..sessions.session import Session
 
+# BM25 parameters for term frequency saturation and length normalization.
+_BM25_K1 = 1.2
+_BM25_B = 0.75
+
 
 def _user_key(app_name: str, user_id: str):
   return f'{app_name}/{user_id}'
 
 
-def _extract_words_lower(text: str) -> set[str]:
+def _extract_words_lower(text: str) -> list[str]:
   """Extracts words from a string and converts them to lowercase."""
-  return set([word.lower() for word in re.findall(r'[A-Za-z]+', text)])
+  return [word.lower() for word in re.findall(r'[A-Za-z]+', text)]
+
+
+class _IndexedEvent:
+  """An event in the index, with the frequencies of its words."""
+
+  __slots__ = ('event', 'term_frequencies', 'length')
+
+  def __init__(self, event: Event, words: list[str]):
+    self.event = event
+    self.term_frequencies = Counter(words)
+    self.length = len(words)
+
+
+class _UserIndex:
+  """An inverted index of the events of a user, from words to events."""
+
+  def __init__(self):
+    self._next_event_key = 0
+    self._events: dict[int, _IndexedEvent] = {}
+    """Keys are the event keys, in the order the events were added."""
+    self._session_event_keys: dict[str, list[int]] = {}
+    self._session_event_ids: dict[str, list[str]] = {}
+    self._postings: dict[str, dict[int, int]] = {}
+    """Keys are words, event keys. Values are the word counts in the events."""
+    self._total_length = 0
+
+  def add_session(self, session_id: str, events: list[Event]) -> None:
+    """Indexes the events of the session, replacing its earlier events."""
+    indexed_ids = self._session_event_ids.get(session_id, [])
+    event_ids = [event.id for event in events]
+    if event_ids[: len(indexed_ids)] != indexed_ids:
+      # The events are not an extension of the indexed events.
+      self._remove_session(session_id)
+      indexed_ids = []
+    event_keys = self._session_event_keys.setdefault(session_id, [])
+    for event in events[len(indexed_ids) :]:
+      words = _extract_words_lower(
+          ' '.join([part.text for part in event.content.parts if part.text])
+      )
+      event_keys.append(self._add_event(_IndexedEvent(event, words)))
+    self._session_event_ids[session_id] = event_ids
+
+  def _add_event(self, indexed_event: _IndexedEvent) -> int:
+    event_key = self._next_event_key
+    self._next_event_key += 1
+    self._events[event_key] = indexed_event
+    self._total_length += indexed_event.length
+    for word, count in indexed_event.term_frequencies.items():
+      self._postings.setdefault(word, {})[event_key] = count
+    return event_key
+
+  def _remove_session(self, session_id: str) -> None:
+    for event_key in self._session_event_keys.pop(session_id, []):
+      indexed_event = self._events.pop(event_key)
+      self._total_length -= indexed_event.length
+      for word in indexed_event.term_frequencies:
+        postings = self._postings[word]
+        del postings[event_key]
+        if not postings:
+          del self._postings[word]
+    self._session_event_ids.pop(session_id, None)
+
+  def search(self, words: set[str], top_k: Optional[int]) -> list[Event]:
+    """Returns the events matching any of the words, best BM25 score first."""
+    if not self._events:
+      return []
+    num_events = len(self._events)
+    average_length = self._total_length / num_events or 1
+    scores: dict[int, float] = {}
+    for word in words:
+      postings = self._postings.get(word)
+      if not postings:
+        continue
+      idf = math.log(
+          1 + (num_events - len(postings) + 0.5) / (len(postings) + 0.5)
+      )
+      for event_key, count in postings.items():
+        length = self._events[event_key].length
+        scores[event_key] = scores.get(event_key, 0.0) + idf * (
+            count
+            * (_BM25_K1 + 1)
+            / (
+                count
+                + _BM25_K1 * (1 - _BM25_B + _BM25_B * length / average_length)
+            )
+        )
+
+    # Ties are broken by the order the events were added.
+    def sort_key(event_key: int) -> tuple[float, int]:
+      return (-scores[event_key], event_key)
+
+    if top_k is None:
+      event_keys = sorted(scores, key=sort_key)
+    else:
+      event_keys = heapq.nsmallest(top_k, scores, key=sort_key)
+    return [self._events[event_key].event for event_key in event_keys]
 
 
 class InMemoryMemoryService(BaseMemoryService):
   """An in-memory memory service for prototyping purpose only.
 
-  Uses keyword matching instead of semantic search.
+  Uses keyword matching instead of semantic search. The words of the events
+  are indexed when a session is added, and the matching events are ranked
+  with BM25.
   """
 
-  def __init__(self):
-    self._session_events: dict[str, dict[str, list[Event]]] = {}
-    """Keys are app_name/user_id, session_id. Values are session event lists."""
+  def __init__(self, *, top_k: Optional[int] = 10):
+    """Initializes the memory service.
+
+    Args:
+      top_k: The max number of memories returned by a search, the best
+        matching ones. If None, all matching memories are returned.
+    """
+    self._top_k = top_k
+    self._user_indexes: dict[str, _UserIndex] = {}
+    """Keys are app_name/user_id."""
 
   @override
   async def add_session_to_memory(self, session: Session):
     user_key = _user_key(session.app_name, session.user_id)
-    self._session_events[user_key] = self._session_events.get(
-        _user_key(session.app_name, session.user_id), {}
+    if user_key not in self._user_indexes:
+      self._user_indexes[user_key] = _UserIndex()
+    self._user_indexes[user_key].add_session(
+        session.id,
+        [
+            event
+            for event in session.events
+            if event.content and event.content.parts
+        ],
     )
-    self._session_events[user_key][session.id] = [
-        event
-        for event in session.events
-        if event.content and event.content.parts
-    ]
 
   @override
   async def search_memory(
       self, *, app_name: str, user_id: str, query: str
   ) -> SearchMemoryResponse:
     user_key = _user_key(app_name, user_id)
-    if user_key not in self._session_events:
+    if user_key not in self._user_indexes:
       return SearchMemoryResponse()
 
-    words_in_query = set(query.lower().split())
+    words_in_query = set(_extract_words_lower(query))
     response = SearchMemoryResponse()
-
-    for session_events in self._session_events[user_key].values():
-      for event in session_events:
-        if not event.content or not event.content.parts:
-          continue
-        words_in_event = _extract_words_lower(
-            ' '.join([part.text for part in event.content.parts if part.text])
-        )
-        if not words_in_event:
-          continue
-
-        if any(query_word in words_in_event for query_word in words_in_query):
-          response.memories.append(
-              MemoryEntry(
-                  content=event.content,
-                  author=event.author,
-                  timestamp=_utils.format_timestamp(event.timestamp),
-              )
+    for event in self._user_indexes[user_key].search(
+        words_in_query, self._top_k
+    ):
+      response.memories.append(
+          MemoryEntry(
+              content=event.content,
+              author=event.author,
+              timestamp=_utils.format_timestamp(event.timestamp),
           )
-
+      )
     return response
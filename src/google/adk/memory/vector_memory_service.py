@@ -0,0 +1,318 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import hashlib
+import inspect
+import json
+import os
+import re
+from typing import Any
+from typing import Awaitable
+from typing import Callable
+from typing import Optional
+from typing import Sequence
+from typing import TYPE_CHECKING
+from typing import Union
+
+import numpy as np
+from typing_extensions import override
+
+from . import _utils
+from .base_memory_service import BaseMemoryService
+from .base_memory_service import SearchMemoryResponse
+from .memory_entry import MemoryEntry
+
+if TYPE_CHECKING:
+  from ..events.event import Event
+  from ..sessions.session import Session
+
+Embeddings = Union[np.ndarray, Sequence[Sequence[float]]]
+
+EmbeddingFunction = Callable[
+    [list[str]], Union[Embeddings, Awaitable[Embeddings]]
+]
+"""Returns one embedding per text. May be sync or async."""
+
+_MIN_CAPACITY = 64
+
+
+class HashingEmbedder:
+  """A deterministic embedder that hashes words into a fixed-size vector.
+
+  It needs no model, so it is meant for tests and prototyping: texts sharing
+  words get similar embeddings, but synonyms do not.
+  """
+
+  def __init__(self, dimension: int = 256):
+    self.dimension = dimension
+
+  def __call__(self, texts: list[str]) -> np.ndarray:
+    embeddings = np.zeros((len(texts), self.dimension), dtype=np.float32)
+    for i, text in enumerate(texts):
+      for word in re.findall(r'\w+', text.lower()):
+        digest = hashlib.blake2b(word.encode(), digest_size=8).digest()
+        value = int.from_bytes(digest, 'little')
+        sign = 1.0 if value & 1 else -1.0
+        embeddings[i, (value >> 1) % self.dimension] += sign
+    return embeddings
+
+
+def _user_key(app_name: str, user_id: str):
+  return f'{app_name}/{user_id}'
+
+
+def _normalize(embeddings: np.ndarray) -> np.ndarray:
+  norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+  return embeddings / np.where(norms == 0, 1, norms)
+
+
+class _UserStore:
+  """The embeddings and memory entries of a user.
+
+  The embeddings are the rows of one contiguous matrix, normalized so that
+  the dot product is the cosine similarity. The matrix grows by doubling, so
+  appends are amortized.
+  """
+
+  def __init__(
+      self,
+      app_name: str,
+      user_id: str,
+      embeddings: Optional[np.ndarray] = None,
+      records: Optional[list[dict[str, Any]]] = None,
+  ):
+    self.app_name = app_name
+    self.user_id = user_id
+    self.embeddings = embeddings
+    self.records = records or []
+    """The memory entries, one per row, with their session and event ids."""
+    self.event_ids = {
+        (record['session_id'], record['event_id']) for record in self.records
+    }
+
+  def append(self, embeddings: np.ndarray, records: list[dict[str, Any]]):
+    num_rows = len(self.records)
+    needed = num_rows + len(records)
+    if self.embeddings is None:
+      self.embeddings = np.empty(
+          (max(_MIN_CAPACITY, needed), embeddings.shape[1]), dtype=np.float32
+      )
+    elif self.embeddings.shape[1] != embeddings.shape[1]:
+      raise ValueError(
+          f'Embedding dimension {embeddings.shape[1]} does not match the'
+          f' stored dimension {self.embeddings.shape[1]}.'
+      )
+    elif (
+        needed > self.embeddings.shape[0] or not self.embeddings.flags.writeable
+    ):
+      # Grows the matrix, which also copies memory-mapped rows to memory.
+      capacity = max(_MIN_CAPACITY, needed, 2 * self.embeddings.shape[0])
+      grown = np.empty((capacity, self.embeddings.shape[1]), dtype=np.float32)
+      grown[:num_rows] = self.embeddings[:num_rows]
+      self.embeddings = grown
+    self.embeddings[num_rows:needed] = _normalize(embeddings)
+    self.records.extend(records)
+    self.event_ids.update(
+        (record['session_id'], record['event_id']) for record in records
+    )
+
+  def search(self, query_embedding: np.ndarray, top_k: int) -> list[int]:
+    """Returns the rows most similar to the query, the most similar first.
+
+    Rows that are not similar at all, with a score of 0 or less, are skipped.
+    """
+    num_rows = len(self.records)
+    if not num_rows or self.embeddings is None:
+      return []
+    scores = self.embeddings[:num_rows] @ query_embedding
+    if top_k < num_rows:
+      rows = np.argpartition(-scores, top_k - 1)[:top_k]
+    else:
+      rows = np.arange(num_rows)
+    rows = rows[scores[rows] > 0]
+    # Ties are broken by the order the events were added.
+    return rows[np.lexsort((rows, -scores[rows]))].tolist()
+
+
+class VectorMemoryService(BaseMemoryService):
+  """A local memory service that searches events by embedding similarity.
+
+  The text of each event is embedded once, when its session is added, with
+  the given embedding function. Searches embed the query and return the most
+  similar events by cosine similarity, computed in one matrix product.
+
+  Stored events are kept when a session is added again: only its new events
+  are embedded. The store can be saved to a directory with `save`, and is
+  loaded from it on creation, without embedding the events again.
+  """
+
+  def __init__(
+      self,
+      embedding_function: EmbeddingFunction,
+      *,
+      storage_dir: Optional[str] = None,
+      mmap: bool = True,
+      top_k: int = 10,
+  ):
+    """Initializes the memory service.
+
+    Args:
+      embedding_function: Returns one embedding per text, e.g. a
+        `HashingEmbedder` or a call to an embedding model. May be async.
+      storage_dir: The directory the store is saved to and loaded from.
+      mmap: Whether the embeddings loaded from `storage_dir` are memory-mapped
+        instead of read into memory.
+      top_k: The max number of memories returned by a search.
+    """
+    self._embedding_function = embedding_function
+    self._storage_dir = storage_dir
+    self._top_k = top_k
+    self._user_stores: dict[str, _UserStore] = {}
+    """Keys are app_name/user_id."""
+    if storage_dir and os.path.isdir(storage_dir):
+      self._load(storage_dir, mmap)
+
+  async def _embed(self, texts: list[str]) -> np.ndarray:
+    embeddings = self._embedding_function(texts)
+    if inspect.isawaitable(embeddings):
+      embeddings = await embeddings
+    embeddings = np.asarray(embeddings, dtype=np.float32)
+    if embeddings.ndim != 2 or embeddings.shape[0] != len(texts):
+      raise ValueError(
+          f'Expected {len(texts)} embeddings, got an array of shape'
+          f' {embeddings.shape}.'
+      )
+    return embeddings
+
+  @override
+  async def add_session_to_memory(self, session: Session):
+    user_key = _user_key(session.app_name, session.user_id)
+    if user_key not in self._user_stores:
+      self._user_stores[user_key] = _UserStore(
+          session.app_name, session.user_id
+      )
+    user_store = self._user_stores[user_key]
+
+    texts = []
+    records = []
+    for event in session.events:
+      if (session.id, event.id) in user_store.event_ids:
+        continue
+      text = _event_text(event)
+      if not text:
+        continue
+      texts.append(text)
+      records.append({
+          'session_id': session.id,
+          'event_id': event.id,
+          'memory': MemoryEntry(
+              content=event.content,
+              author=event.author,
+              timestamp=_utils.format_timestamp(event.timestamp),
+          ),
+      })
+    if texts:
+      user_store.append(await self._embed(texts), records)
+
+  @override
+  async def search_memory(
+      self, *, app_name: str, user_id: str, query: str
+  ) -> SearchMemoryResponse:
+    user_store = self._user_stores.get(_user_key(app_name, user_id))
+    if not user_store or not user_store.records:
+      return SearchMemoryResponse()
+
+    query_embedding = _normalize(await self._embed([query]))[0]
+    if not query_embedding.any():
+      return SearchMemoryResponse()
+    rows = user_store.search(query_embedding, self._top_k)
+    return SearchMemoryResponse(
+        memories=[user_store.records[row]['memory'] for row in rows]
+    )
+
+  def save(self) -> None:
+    """Saves the store to `storage_dir`."""
+    if not self._storage_dir:
+      raise ValueError('No storage_dir to save the memory to.')
+    os.makedirs(self._storage_dir, exist_ok=True)
+    for user_key, user_store in self._user_stores.items():
+      if user_store.embeddings is None:
+        continue
+      path = os.path.join(self._storage_dir, _file_name(user_key))
+      records = [
+          {
+              'session_id': record['session_id'],
+              'event_id': record['event_id'],
+              'memory': record['memory'].model_dump(mode='json'),
+          }
+          for record in user_store.records
+      ]
+      # Files are replaced atomically, so an interrupted save keeps the old
+      # files. The records are written last, since they tell the row count.
+      _replace_file(
+          path + '.npy',
+          lambda f: np.save(f, user_store.embeddings[: len(records)]),
+      )
+      _replace_file(
+          path + '.json',
+          lambda f: f.write(
+              json.dumps({
+                  'app_name': user_store.app_name,
+                  'user_id': user_store.user_id,
+                  'records': records,
+              }).encode()
+          ),
+      )
+
+  def _load(self, storage_dir: str, mmap: bool) -> None:
+    for file_name in sorted(os.listdir(storage_dir)):
+      if not file_name.endswith('.json'):
+        continue
+      path = os.path.join(storage_dir, file_name[: -len('.json')])
+      with open(path + '.json', 'rb') as f:
+        data = json.load(f)
+      records = [
+          {
+              'session_id': record['session_id'],
+              'event_id': record['event_id'],
+              'memory': MemoryEntry.model_validate(record['memory']),
+          }
+          for record in data['records']
+      ]
+      embeddings = np.load(path + '.npy', mmap_mode='r' if mmap else None)
+      if embeddings.shape[0] < len(records):
+        raise ValueError(f'The embeddings in {path}.npy are incomplete.')
+      user_key = _user_key(data['app_name'], data['user_id'])
+      self._user_stores[user_key] = _UserStore(
+          data['app_name'], data['user_id'], embeddings, records
+      )
+
+
+def _event_text(event: Event) -> str:
+  if not event.content or not event.content.parts:
+    return ''
+  return ' '.join([part.text for part in event.content.parts if part.text])
+
+
+def _file_name(user_key: str) -> str:
+  return hashlib.sha256(user_key.encode()).hexdigest()[:32]
+
+
+def _replace_file(path: str, write: Callable[[Any], Any]) -> None:
+  temp_path = path + '.tmp'
+  with open(temp_path, 'wb') as f:
+    write(f)
+  os.replace(temp_path, path)
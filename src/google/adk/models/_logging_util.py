@@ -0,0 +1,68 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Utilities for logging LLM requests and responses.
+
+Request and response logs are only built if their log level is enabled. At
+DEBUG level they are logged in full. At INFO level each logged value is
+truncated to `MAX_LOG_VALUE_CHARS` characters, only the last
+`MAX_LOG_CONTENTS` contents of a request are logged, and streamed response
+chunks are only logged if they end the response or have function calls.
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import Any
+from typing import Optional
+from typing import TypeVar
+
+_T = TypeVar('_T')
+
+MAX_LOG_VALUE_CHARS = 2000
+"""The max length of a logged value at INFO level."""
+
+MAX_LOG_CONTENTS = 20
+"""The max number of logged request contents at INFO level."""
+
+
+def get_log_limits(
+    logger: logging.Logger,
+) -> tuple[Optional[int], Optional[int]]:
+  """Returns the max length of logged values and max number of contents.
+
+  Both are None (unlimited) if the logger is enabled for DEBUG level.
+  """
+  if logger.isEnabledFor(logging.DEBUG):
+    return None, None
+  return MAX_LOG_VALUE_CHARS, MAX_LOG_CONTENTS
+
+
+def truncate(value: Any, max_chars: Optional[int]) -> str:
+  """Returns the value as a string of at most about `max_chars` characters."""
+  text = str(value)
+  if max_chars is None or len(text) <= max_chars:
+    return text
+  return f'{text[:max_chars]}... ({len(text) - max_chars} more characters)'
+
+
+def last_values(
+    values: list[_T], max_values: Optional[int]
+) -> tuple[list[_T], list[str]]:
+  """Returns the last `max_values` values, and the log of the omitted ones."""
+  if max_values is None or len(values) <= max_values:
+    return values, []
+  return values[len(values) - max_values :], [
+      f'({len(values) - max_values} earlier values omitted)'
+  ]
@@ -35,6 +35,7 @@ from google.genai import types
 from pydantic import BaseModel
 from typing_extensions import override
 
+from . import _logging_util
 from .base_llm import BaseLlm
 from .llm_response import LlmResponse
 
@@ -135,10 +136,14 @@ def content_block_to_part(
 def message_to_generate_content_response(
     message: anthropic_types.Message,
 ) -> LlmResponse:
-  logger.info(
-      "Claude response: %s",
-      message.model_dump_json(indent=2, exclude_none=True),
-  )
+  if logger.isEnabledFor(logging.INFO):
+    max_chars, _ = _logging_util.get_log_limits(logger)
+    logger.info(
+        "Claude response: %s",
+        _logging_util.truncate(
+            message.model_dump_json(indent=2, exclude_none=True), max_chars
+        ),
+    )
 
   return LlmResponse(
       content=types.Content(
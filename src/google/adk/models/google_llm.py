@@ -22,12 +22,14 @@ import os
 import sys
 from typing import AsyncGenerator
 from typing import cast
+from typing import Optional
 from typing import TYPE_CHECKING
 
 from google.genai import Client
 from google.genai import types
 from typing_extensions import override
 
+from . import _logging_util
 from .. import version
 from ..utils.variant_utils import GoogleLLMVariant
 from .base_llm import BaseLlm
@@ -92,7 +94,10 @@ class Gemini(BaseLlm):
         self._api_backend,
         stream,
     )
-    logger.info(_build_request_log(llm_request))
+    if logger.isEnabledFor(logging.INFO):
+      logger.info(
+          _build_request_log(llm_request, *_logging_util.get_log_limits(logger))
+      )
 
     if stream:
       responses = await self.api_client.aio.models.generate_content_stream(
@@ -110,7 +115,7 @@ class Gemini(BaseLlm):
       # previous partial content. The only difference is bidi rely on
       # complete_turn flag to detect end while sse depends on finish_reason.
       async for response in responses:
-        logger.info(_build_response_log(response))
+        _log_response(response, is_chunk=True)
         llm_response = LlmResponse.create(response)
         usage_metadata = llm_response.usage_metadata
         if (
@@ -164,7 +169,7 @@ class Gemini(BaseLlm):
           contents=llm_request.contents,
           config=llm_request.config,
       )
-      logger.info(_build_response_log(response))
+      _log_response(response)
       yield LlmResponse.create(response)
 
   @cached_property
@@ -249,6 +254,27 @@ class Gemini(BaseLlm):
       llm_request.config.labels = None
 
 
+def _log_response(
+    resp: types.GenerateContentResponse, is_chunk: bool = False
+) -> None:
+  """Logs the response, if INFO level is enabled.
+
+  At INFO level, streamed chunks are only logged if they end the response or
+  have function calls.
+  """
+  if not logger.isEnabledFor(logging.INFO):
+    return
+  max_chars, _ = _logging_util.get_log_limits(logger)
+  if (
+      is_chunk
+      and max_chars is not None
+      and not resp.function_calls
+      and not (resp.candidates and resp.candidates[0].finish_reason)
+  ):
+    return
+  logger.info(_build_response_log(resp, max_chars))
+
+
 def _build_function_declaration_log(
     func_decl: types.FunctionDeclaration,
 ) -> str:
@@ -264,36 +290,48 @@ def _build_function_declaration_log(
   return f'{func_decl.name}: {param_str} {return_str}'
 
 
-def _build_request_log(req: LlmRequest) -> str:
+def _build_request_log(
+    req: LlmRequest,
+    max_chars: Optional[int] = None,
+    max_contents: Optional[int] = None,
+) -> str:
   function_decls: list[types.FunctionDeclaration] = cast(
       list[types.FunctionDeclaration],
       req.config.tools[0].function_declarations if req.config.tools else [],
   )
   function_logs = (
       [
-          _build_function_declaration_log(func_decl)
+          _logging_util.truncate(
+              _build_function_declaration_log(func_decl), max_chars
+          )
           for func_decl in function_decls
       ]
       if function_decls
       else []
   )
-  contents_logs = [
-      content.model_dump_json(
-          exclude_none=True,
-          exclude={
-              'parts': {
-                  i: _EXCLUDED_PART_FIELD for i in range(len(content.parts))
-              }
-          },
+  contents, contents_logs = _logging_util.last_values(
+      req.contents, max_contents
+  )
+  contents_logs = contents_logs + [
+      _logging_util.truncate(
+          content.model_dump_json(
+              exclude_none=True,
+              exclude={
+                  'parts': {
+                      i: _EXCLUDED_PART_FIELD for i in range(len(content.parts))
+                  }
+              },
+          ),
+          max_chars,
       )
-      for content in req.contents
+      for content in contents
   ]
 
   return f"""
 LLM Request:
 -----------------------------------------------------------
 System Instruction:
-{req.config.system_instruction}
+{_logging_util.truncate(req.config.system_instruction, max_chars)}
 -----------------------------------------------------------
 Contents:
 {_NEW_LINE.join(contents_logs)}
@@ -304,23 +342,27 @@ Functions:
 """
 
 
-def _build_response_log(resp: types.GenerateContentResponse) -> str:
+def _build_response_log(
+    resp: types.GenerateContentResponse, max_chars: Optional[int] = None
+) -> str:
   function_calls_text = []
   if function_calls := resp.function_calls:
     for func_call in function_calls:
       function_calls_text.append(
-          f'name: {func_call.name}, args: {func_call.args}'
+          _logging_util.truncate(
+              f'name: {func_call.name}, args: {func_call.args}', max_chars
+          )
       )
   return f"""
 LLM Response:
 -----------------------------------------------------------
 Text:
-{resp.text}
+{_logging_util.truncate(resp.text, max_chars)}
 -----------------------------------------------------------
 Function calls:
 {_NEW_LINE.join(function_calls_text)}
 -----------------------------------------------------------
 Raw response:
-{resp.model_dump_json(exclude_none=True)}
+{_logging_util.truncate(resp.model_dump_json(exclude_none=True), max_chars)}
 -----------------------------------------------------------
 """
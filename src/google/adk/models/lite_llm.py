@@ -658,7 +658,8 @@ class LiteLlm(BaseLlm):
     """
 
     self._maybe_append_user_content(llm_request)
-    logger.debug(_build_request_log(llm_request))
+    if logger.isEnabledFor(logging.DEBUG):
+      logger.debug(_build_request_log(llm_request))
 
     messages, tools, response_format = _get_completion_inputs(llm_request)
 
@@ -16,10 +16,13 @@
 
 from __future__ import annotations
 
+import asyncio
 from functools import lru_cache
 import logging
+import os
 import re
 from typing import TYPE_CHECKING
+import weakref
 
 if TYPE_CHECKING:
   from .base_llm import BaseLlm
@@ -34,6 +37,41 @@ Key is the regex that matches the model name.
 Value is the class that implements the model.
 """
 
+_CLIENT_ENV_VARS = (
+    'GOOGLE_API_KEY',
+    'GEMINI_API_KEY',
+    'GOOGLE_GENAI_USE_VERTEXAI',
+    'GOOGLE_CLOUD_PROJECT',
+    'GOOGLE_CLOUD_LOCATION',
+    'GOOGLE_APPLICATION_CREDENTIALS',
+    'GOOGLE_GEMINI_BASE_URL',
+    'GOOGLE_VERTEX_BASE_URL',
+)
+"""The environment variables the API clients of LLMs are configured from."""
+
+_llm_instances: weakref.WeakKeyDictionary[
+    asyncio.AbstractEventLoop, dict[tuple[str, ...], BaseLlm]
+] = weakref.WeakKeyDictionary()
+"""Shared LLM instances.
+
+Key is the event loop the instances are used in, since the API clients of the
+instances hold connection pools that are bound to an event loop.
+Value is a dict from the model name and the client configuration in the
+environment to the LLM instance. The configuration is part of the key because
+e.g. `adk web` loads the `.env` of each agent into the environment, so agents
+with the same model may need differently configured clients.
+"""
+
+
+def _drop_llms_of_closed_loops() -> None:
+  """Drops the instances of closed event loops, e.g. of past `asyncio.run`s.
+
+  The idle connections of their clients keep their loop alive, so the weak keys
+  alone are never released.
+  """
+  for loop in [loop for loop in _llm_instances if loop.is_closed()]:
+    del _llm_instances[loop]
+
 
 class LLMRegistry:
   """Registry for LLMs."""
@@ -51,6 +89,36 @@ class LLMRegistry:
 
     return LLMRegistry.resolve(model)(model=model)
 
+  @staticmethod
+  def get_llm(model: str) -> BaseLlm:
+    """Gets the shared LLM instance of the model.
+
+    Unlike `new_llm`, the instance is reused by all callers in the running
+    event loop, so its API client and connections are reused across LLM calls
+    and invocations. Instances are only shared while the client configuration
+    in the environment, e.g. the API key or the project, is unchanged.
+    Outside of a running event loop, a new instance is returned.
+
+    Args:
+        model: The model name.
+
+    Returns:
+        The LLM instance.
+    """
+
+    try:
+      loop = asyncio.get_running_loop()
+    except RuntimeError:
+      return LLMRegistry.new_llm(model)
+
+    if loop not in _llm_instances:
+      _drop_llms_of_closed_loops()
+    llms = _llm_instances.setdefault(loop, {})
+    key = (model, *(os.environ.get(name) for name in _CLIENT_ENV_VARS))
+    if key not in llms:
+      llms[key] = LLMRegistry.new_llm(model)
+    return llms[key]
+
   @staticmethod
   def _register(model_name_regex: str, llm_cls: type[BaseLlm]):
     """Registers a new LLM class.
@@ -69,6 +137,9 @@ class LLMRegistry:
       )
 
     _llm_registry_dict[model_name_regex] = llm_cls
+    # Instances of the previously registered classes must not be reused.
+    LLMRegistry.resolve.cache_clear()
+    _llm_instances.clear()
 
   @staticmethod
   def register(llm_cls: type[BaseLlm]):
@@ -25,6 +25,7 @@ import warnings
 
 from google.genai import types
 
+from .agents import _agent_tree
 from .agents.active_streaming_tool import ActiveStreamingTool
 from .agents.base_agent import BaseAgent
 from .agents.invocation_context import InvocationContext
@@ -38,6 +39,7 @@ from .code_executors.built_in_code_executor import BuiltInCodeExecutor
 from .events.event import Event
 from .memory.base_memory_service import BaseMemoryService
 from .memory.in_memory_memory_service import InMemoryMemoryService
+from .sessions._event_write_buffer import EventWriteBuffer
 from .sessions.base_session_service import BaseSessionService
 from .sessions.in_memory_session_service import InMemorySessionService
 from .sessions.session import Session
@@ -93,6 +95,8 @@ class Runner:
     """
     self.app_name = app_name
     self.agent = agent
+    # Freezes the agent tree, so agent lookups do not walk the tree.
+    _agent_tree.freeze(agent)
     self.artifact_service = artifact_service
     self.session_service = session_service
     self.memory_service = memory_service
@@ -159,6 +163,7 @@ class Runner:
       session_id: str,
       new_message: types.Content,
       run_config: RunConfig = RunConfig(),
+      session: Optional[Session] = None,
   ) -> AsyncGenerator[Event, None]:
     """Main entry method to run the agent in this runner.
 
@@ -167,16 +172,28 @@ class Runner:
       session_id: The session ID of the session.
       new_message: A new message to append to the session.
       run_config: The run config for the agent.
+      session: The session, if the caller just got it from the session
+        service, so that it is not loaded again.
 
     Yields:
       The events generated by the agent.
     """
     with tracer.start_as_current_span('invocation'):
-      session = await self.session_service.get_session(
-          app_name=self.app_name, user_id=user_id, session_id=session_id
-      )
-      if not session:
-        raise ValueError(f'Session not found: {session_id}')
+      if session is None:
+        session = await self.session_service.get_session(
+            app_name=self.app_name, user_id=user_id, session_id=session_id
+        )
+        if not session:
+          raise ValueError(f'Session not found: {session_id}')
+      elif (
+          session.app_name != self.app_name
+          or session.user_id != user_id
+          or session.id != session_id
+      ):
+        raise ValueError(
+            f'The session {session.id} does not match the user_id and'
+            ' session_id.'
+        )
 
       invocation_context = self._new_invocation_context(
           session,
@@ -194,10 +211,40 @@ class Runner:
         )
 
       invocation_context.agent = self._find_agent_to_run(session, root_agent)
-      async for event in invocation_context.agent.run_async(invocation_context):
-        if not event.partial:
-          await self.session_service.append_event(session=session, event=event)
-        yield event
+      if not run_config.event_write_behind:
+        async for event in invocation_context.agent.run_async(
+            invocation_context
+        ):
+          if not event.partial:
+            await self.session_service.append_event(
+                session=session, event=event
+            )
+          yield event
+        return
+
+      write_buffer = EventWriteBuffer(
+          self.session_service,
+          session,
+          flush_interval_secs=run_config.event_write_behind.flush_interval_secs,
+          max_batch_size=run_config.event_write_behind.max_batch_size,
+          max_pending_events=run_config.event_write_behind.max_pending_events,
+      )
+      try:
+        async for event in invocation_context.agent.run_async(
+            invocation_context
+        ):
+          if not event.partial:
+            await write_buffer.append_event(event)
+          yield event
+      except BaseException:
+        # Flushes the buffered events, but keeps the original error if the
+        # flush fails too.
+        try:
+          await write_buffer.close()
+        except Exception:
+          logger.exception('Failed to flush the buffered events.')
+        raise
+      await write_buffer.close()
 
   async def _append_new_message_to_session(
       self,
@@ -343,16 +390,20 @@ class Runner:
     Returns:
       The agent of the last message in the session or the root agent.
     """
-    for event in filter(lambda e: e.author != 'user', reversed(session.events)):
-      if event.author == root_agent.name:
+    event_index = session.get_event_index()
+    # The authors of the last events are checked first, each author once.
+    for author in event_index.get_authors():
+      if author == 'user':
+        continue
+      if author == root_agent.name:
         # Found root agent.
         return root_agent
-      if not (agent := root_agent.find_sub_agent(event.author)):
+      if not (agent := root_agent.find_sub_agent(author)):
         # Agent not found, continue looking.
         logger.warning(
             'Event from an unknown agent: %s, event id: %s',
-            event.author,
-            event.id,
+            author,
+            session.events[event_index.get_last_author_index(author)].id,
         )
         continue
       if self._is_transferable_across_agent_tree(agent):
@@ -372,15 +423,9 @@ class Runner:
     Returns:
         True if the agent can transfer, False otherwise.
     """
-    agent = agent_to_run
-    while agent:
-      if not isinstance(agent, LlmAgent):
-        # Only LLM-based Agent can provider agent transfer capability.
-        return False
-      if agent.disallow_transfer_to_parent:
-        return False
-      agent = agent.parent_agent
-    return True
+    if agent_tree := agent_to_run._get_agent_tree():
+      return agent_tree.is_transferable_across_agent_tree(agent_to_run)
+    return _agent_tree.compute_is_transferable_across_agent_tree(agent_to_run)
 
   def _new_invocation_context(
       self,
@@ -39,3 +39,13 @@ except ImportError:
       'DatabaseSessionService require sqlalchemy>=2.0, please ensure it is'
       ' installed correctly.'
   )
+
+try:
+  from .async_database_session_service import AsyncDatabaseSessionService
+
+  __all__.append('AsyncDatabaseSessionService')
+except ImportError:
+  logger.debug(
+      'AsyncDatabaseSessionService require sqlalchemy>=2.0 with asyncio'
+      ' support, please ensure it is installed correctly.'
+  )
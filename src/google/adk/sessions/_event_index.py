@@ -0,0 +1,111 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from __future__ import annotations
+
+from typing import Optional
+
+from ..events.event import Event
+
+
+class EventIndex:
+  """An index of a list of events, updated as events are appended.
+
+  Maps function call ids to the positions of the events with the function
+  calls and responses, and authors to the positions of their last events.
+  `update` only indexes the events appended since the last update, and
+  rebuilds the index if the events are not an extension of the indexed ones.
+  Events are expected to be immutable once appended.
+  """
+
+  def __init__(self):
+    self._reset()
+
+  def _reset(self) -> None:
+    self._num_events = 0
+    self._last_event: Optional[Event] = None
+    self._function_call_event_indices: list[int] = []
+    self._function_call_indices: dict[Optional[str], list[int]] = {}
+    self._function_response_indices: dict[Optional[str], list[int]] = {}
+    self._last_author_indices: dict[str, int] = {}
+
+  def __eq__(self, other: object) -> bool:
+    # The index is derived from the events, which are compared on their own.
+    return isinstance(other, EventIndex)
+
+  def update(self, events: list[Event]) -> EventIndex:
+    """Indexes the events appended since the last update."""
+    if len(events) < self._num_events or (
+        self._num_events
+        and events[self._num_events - 1] is not self._last_event
+    ):
+      self._reset()
+
+    for i in range(self._num_events, len(events)):
+      event = events[i]
+      self._last_author_indices[event.author] = i
+      if not event.content or not event.content.parts:
+        continue
+      for part in event.content.parts:
+        if part.function_call:
+          _add_index(self._function_call_indices, part.function_call.id, i)
+          if (
+              not self._function_call_event_indices
+              or self._function_call_event_indices[-1] != i
+          ):
+            self._function_call_event_indices.append(i)
+        if part.function_response:
+          _add_index(
+              self._function_response_indices, part.function_response.id, i
+          )
+    if events:
+      self._num_events = len(events)
+      self._last_event = events[-1]
+    return self
+
+  def get_function_call_event_indices(self) -> list[int]:
+    """Returns the ascending positions of the events with function calls."""
+    return self._function_call_event_indices
+
+  def get_function_call_indices(
+      self, function_call_id: Optional[str]
+  ) -> list[int]:
+    """Returns the ascending positions of the events calling the function."""
+    return self._function_call_indices.get(function_call_id, [])
+
+  def get_function_response_indices(
+      self, function_call_id: Optional[str]
+  ) -> list[int]:
+    """Returns the ascending positions of the events with the response."""
+    return self._function_response_indices.get(function_call_id, [])
+
+  def get_last_author_index(self, author: str) -> Optional[int]:
+    """Returns the position of the last event of the author, if any."""
+    return self._last_author_indices.get(author)
+
+  def get_authors(self) -> list[str]:
+    """Returns the authors of the events, the most recent author first."""
+    return sorted(
+        self._last_author_indices,
+        key=self._last_author_indices.__getitem__,
+        reverse=True,
+    )
+
+
+def _add_index(
+    indices: dict[Optional[str], list[int]], key: Optional[str], index: int
+) -> None:
+  positions = indices.setdefault(key, [])
+  # An event may have several parts with the same function call id.
+  if not positions or positions[-1] != index:
+    positions.append(index)
@@ -0,0 +1,127 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Optional
+
+from ..events.event import Event
+from .base_session_service import BaseSessionService
+from .session import Session
+
+logger = logging.getLogger('google_adk.' + __name__)
+
+
+class EventWriteBuffer:
+  """Persists the events of a session in batches, behind the invocation.
+
+  Events are applied to the in-memory session right away, and stored by a
+  background task through `BaseSessionService.append_events`. A batch is
+  stored once it reaches `max_batch_size` events, or `flush_interval_secs`
+  after its first event. Batches are stored one at a time, in order.
+  `append_event` waits while `max_pending_events` events are queued, and
+  `close` stores all remaining events.
+  """
+
+  def __init__(
+      self,
+      session_service: BaseSessionService,
+      session: Session,
+      *,
+      flush_interval_secs: float,
+      max_batch_size: int,
+      max_pending_events: int,
+  ):
+    self._session_service = session_service
+    self._session = session
+    # The events are stored through a copy of the session, so that the
+    # session service does not apply them to the in-memory session again.
+    self._storage_session = session.model_copy(
+        update={'events': list(session.events), 'state': dict(session.state)}
+    )
+    self._flush_interval_secs = flush_interval_secs
+    self._max_batch_size = max(1, max_batch_size)
+    self._queue: asyncio.Queue[Optional[Event]] = asyncio.Queue(
+        maxsize=max(1, max_pending_events)
+    )
+    self._error: Optional[BaseException] = None
+    self._task = asyncio.create_task(self._run())
+
+  async def append_event(self, event: Event) -> Event:
+    """Applies the event to the session and queues it to be stored.
+
+    Raises:
+      The error of storing an earlier batch, if any.
+    """
+    if self._error:
+      raise self._error
+    await BaseSessionService.append_event(
+        self._session_service, session=self._session, event=event
+    )
+    if not event.partial:
+      await self._queue.put(event)
+    return event
+
+  async def close(self) -> None:
+    """Stores all queued events and stops the background task.
+
+    Raises:
+      The error of storing a batch, if any.
+    """
+    if not self._task.done():
+      await self._queue.put(None)
+      await asyncio.shield(self._task)
+    self._session.last_update_time = self._storage_session.last_update_time
+    if self._error:
+      raise self._error
+
+  async def _run(self) -> None:
+    loop = asyncio.get_running_loop()
+    closed = False
+    while not closed:
+      event = await self._queue.get()
+      if event is None:
+        break
+      batch = [event]
+      deadline = loop.time() + self._flush_interval_secs
+      while len(batch) < self._max_batch_size:
+        if self._queue.empty():
+          timeout = deadline - loop.time()
+          if timeout <= 0:
+            break
+          try:
+            event = await asyncio.wait_for(self._queue.get(), timeout)
+          except asyncio.TimeoutError:
+            break
+        else:
+          event = self._queue.get_nowait()
+        if event is None:
+          closed = True
+          break
+        batch.append(event)
+
+      if self._error:
+        # Later events are dropped, since storing them would break the order.
+        continue
+      try:
+        await self._session_service.append_events(self._storage_session, batch)
+      except Exception as e:  # pylint: disable=broad-exception-caught
+        logger.error(
+            'Failed to store %d events to session %s: %s',
+            len(batch),
+            self._session.id,
+            e,
+        )
+        self._error = e
@@ -97,8 +97,22 @@ class BaseSessionService(abc.ABC):
       return event
     self.__update_session_state(session, event)
     session.events.append(event)
+    # Indexes the event right away, so lookups do not scan the events.
+    session.get_event_index()
     return event
 
+  async def append_events(
+      self, session: Session, events: list[Event]
+  ) -> list[Event]:
+    """Appends events to a session object, in order.
+
+    Session services backed by remote storage should override this to store
+    the events with fewer round trips than one `append_event` per event.
+    """
+    for event in events:
+      await self.append_event(session=session, event=event)
+    return events
+
   def __update_session_state(self, session: Session, event: Event) -> None:
     """Updates the session state based on the event."""
     if not event.actions or not event.actions.state_delta:
@@ -22,12 +22,19 @@ from typing import Optional
 import uuid
 
 from google.genai import types
+from sqlalchemy import and_
 from sqlalchemy import Boolean
+from sqlalchemy import cast
 from sqlalchemy import delete
 from sqlalchemy import Dialect
 from sqlalchemy import ForeignKeyConstraint
 from sqlalchemy import func
+from sqlalchemy import Row
+from sqlalchemy import select
+from sqlalchemy import Select
 from sqlalchemy import Text
+from sqlalchemy import update
+from sqlalchemy import Update
 from sqlalchemy.dialects import mysql
 from sqlalchemy.dialects import postgresql
 from sqlalchemy.engine import create_engine
@@ -67,6 +74,7 @@ class DynamicJSON(TypeDecorator):
   """A JSON-like type that uses JSONB on PostgreSQL and TEXT with JSON serialization for other databases."""
 
   impl = Text  # Default implementation is TEXT
+  cache_ok = True
 
   def load_dialect_impl(self, dialect: Dialect):
     if dialect.name == "postgresql":
@@ -516,72 +524,205 @@ class DatabaseSessionService(BaseSessionService):
 
   @override
   async def append_event(self, session: Session, event: Event) -> Event:
-    logger.info(f"Append event: {event} to session {session.id}")
+    await self.append_events(session, [event])
+    return event
 
-    if event.partial:
-      return event
+  @override
+  async def append_events(
+      self, session: Session, events: list[Event]
+  ) -> list[Event]:
+    for event in events:
+      logger.info(f"Append event: {event} to session {session.id}")
+    events_to_store = [event for event in events if not event.partial]
+    if not events_to_store:
+      return events
+
+    # 1. Read the stored states, only if they need to be merged in Python
+    # 2. Update the session, conditional on it not being stale
+    # 3. Update the app and user states with the state delta
+    # 4. Store the events to table, all in one transaction
+    app_state_delta, user_state_delta, session_state_delta = (
+        _extract_events_state_delta(events_to_store)
+    )
 
-    # 1. Check if timestamp is stale
-    # 2. Update session attributes based on event config
-    # 3. Store event to table
     with self.database_session_factory() as session_factory:
-      storage_session = session_factory.get(
-          StorageSession, (session.app_name, session.user_id, session.id)
+      dialect = session_factory.get_bind().dialect
+
+      row = None
+      if dialect.name != "postgresql" and (
+          app_state_delta or user_state_delta or session_state_delta
+      ):
+        # Fetch all states in one query, to merge the deltas into them.
+        row = session_factory.execute(_select_states(session)).one_or_none()
+        if row is None:
+          raise ValueError(f"Session {session.id} not found.")
+      app_state, user_state, session_state = _merge_state_deltas(
+          dialect.name,
+          row,
+          app_state_delta,
+          user_state_delta,
+          session_state_delta,
       )
 
-      if storage_session.update_time.timestamp() > session.last_update_time:
-        raise ValueError(
-            "The last_update_time provided in the session object"
-            f" {datetime.fromtimestamp(session.last_update_time):'%Y-%m-%d %H:%M:%S'} is"
-            " earlier than the update_time in the storage_session"
-            f" {storage_session.update_time:'%Y-%m-%d %H:%M:%S'}. Please check"
-            " if it is a stale session."
-        )
-
-      # Fetch states from storage
-      storage_app_state = session_factory.get(
-          StorageAppState, (session.app_name)
-      )
-      storage_user_state = session_factory.get(
-          StorageUserState, (session.app_name, session.user_id)
+      # The session is only updated if it is not stale, which replaces a
+      # separate read of the stored update time.
+      update_session = _update_session(
+          session, session_state if session_state_delta else None
       )
+      if dialect.update_returning:
+        update_time = session_factory.execute(
+            update_session.returning(StorageSession.update_time)
+        ).scalar_one_or_none()
+      else:
+        result = session_factory.execute(update_session)
+        update_time = (
+            session_factory.scalar(_select_update_time(session))
+            if result.rowcount
+            else None
+        )
+      if update_time is None:
+        raise _stale_session_error(
+            session, session_factory.scalar(_select_update_time(session))
+        )
 
-      app_state = storage_app_state.state if storage_app_state else {}
-      user_state = storage_user_state.state if storage_user_state else {}
-      session_state = storage_session.state
-
-      # Extract state delta
-      app_state_delta = {}
-      user_state_delta = {}
-      session_state_delta = {}
-      if event.actions:
-        if event.actions.state_delta:
-          app_state_delta, user_state_delta, session_state_delta = (
-              _extract_state_delta(event.actions.state_delta)
-          )
-
-      # Merge state and update storage
       if app_state_delta:
-        app_state.update(app_state_delta)
-        storage_app_state.state = app_state
+        session_factory.execute(_update_app_state(session, app_state))
       if user_state_delta:
-        user_state.update(user_state_delta)
-        storage_user_state.state = user_state
-      if session_state_delta:
-        session_state.update(session_state_delta)
-        storage_session.state = session_state
+        session_factory.execute(_update_user_state(session, user_state))
 
-      session_factory.add(StorageEvent.from_event(session, event))
+      session_factory.add_all(
+          [StorageEvent.from_event(session, event) for event in events_to_store]
+      )
 
       session_factory.commit()
-      session_factory.refresh(storage_session)
 
       # Update timestamp with commit time
-      session.last_update_time = storage_session.update_time.timestamp()
+      session.last_update_time = update_time.timestamp()
 
     # Also update the in-memory session
-    await super().append_event(session=session, event=event)
-    return event
+    for event in events_to_store:
+      await super().append_event(session=session, event=event)
+    return events
+
+
+def _session_key(session: Session) -> tuple[Any, ...]:
+  """Returns the where clauses selecting the stored session."""
+  return (
+      StorageSession.app_name == session.app_name,
+      StorageSession.user_id == session.user_id,
+      StorageSession.id == session.id,
+  )
+
+
+def _select_states(session: Session) -> Select:
+  """Returns the query of the session, app and user states of the session."""
+  return (
+      select(
+          StorageSession.state,
+          StorageAppState.state,
+          StorageUserState.state,
+      )
+      .outerjoin(
+          StorageAppState,
+          StorageAppState.app_name == StorageSession.app_name,
+      )
+      .outerjoin(
+          StorageUserState,
+          and_(
+              StorageUserState.app_name == StorageSession.app_name,
+              StorageUserState.user_id == StorageSession.user_id,
+          ),
+      )
+      .where(*_session_key(session))
+  )
+
+
+def _select_update_time(session: Session) -> Select:
+  return select(StorageSession.update_time).where(*_session_key(session))
+
+
+def _merge_state_deltas(
+    dialect_name: str,
+    row: Optional[Row],
+    app_state_delta: dict[str, Any],
+    user_state_delta: dict[str, Any],
+    session_state_delta: dict[str, Any],
+) -> tuple[Any, Any, Any]:
+  """Returns the new app, user and session states to store.
+
+  On PostgreSQL these are SQL expressions merging the deltas into the stored
+  JSONB values, so that only the changed keys are sent. Otherwise they are the
+  states of the given row of `_select_states` with the deltas applied.
+  """
+  if dialect_name == "postgresql":
+    return (
+        _jsonb_merge(StorageAppState.state, app_state_delta),
+        _jsonb_merge(StorageUserState.state, user_state_delta),
+        _jsonb_merge(StorageSession.state, session_state_delta),
+    )
+  session_state, app_state, user_state = row if row else (None, None, None)
+  return (
+      {**(app_state or {}), **app_state_delta},
+      {**(user_state or {}), **user_state_delta},
+      {**(session_state or {}), **session_state_delta},
+  )
+
+
+def _jsonb_merge(column: Any, state_delta: dict[str, Any]) -> Any:
+  """Returns the SQL expression merging the state delta into a JSONB column."""
+  return func.coalesce(column, cast({}, postgresql.JSONB)).op("||")(
+      cast(state_delta, postgresql.JSONB)
+  )
+
+
+def _update_session(session: Session, state: Optional[Any]) -> Update:
+  """Returns the update of the session, if it is not stale."""
+  stmt = (
+      update(StorageSession)
+      .where(
+          *_session_key(session),
+          StorageSession.update_time
+          <= datetime.fromtimestamp(session.last_update_time),
+      )
+      .values(update_time=func.now())
+  )
+  if state is not None:
+    stmt = stmt.values(state=state)
+  return stmt
+
+
+def _update_app_state(session: Session, state: Any) -> Update:
+  return (
+      update(StorageAppState)
+      .where(StorageAppState.app_name == session.app_name)
+      .values(state=state)
+  )
+
+
+def _update_user_state(session: Session, state: Any) -> Update:
+  return (
+      update(StorageUserState)
+      .where(
+          StorageUserState.app_name == session.app_name,
+          StorageUserState.user_id == session.user_id,
+      )
+      .values(state=state)
+  )
+
+
+def _stale_session_error(
+    session: Session, update_time: Optional[datetime]
+) -> ValueError:
+  """Returns the error for a session that could not be updated."""
+  if update_time is None:
+    return ValueError(f"Session {session.id} not found.")
+  return ValueError(
+      "The last_update_time provided in the session object"
+      f" {datetime.fromtimestamp(session.last_update_time):'%Y-%m-%d %H:%M:%S'}"
+      " is earlier than the update_time in the storage_session"
+      f" {update_time:'%Y-%m-%d %H:%M:%S'}. Please check if it is a stale"
+      " session."
+  )
 
 
 def _extract_state_delta(state: dict[str, Any]):
@@ -599,6 +740,15 @@ def _extract_state_delta(state: dict[str, Any]):
   return app_state_delta, user_state_delta, session_state_delta
 
 
+def _extract_events_state_delta(events: list[Event]):
+  """Combines the state deltas of the events, with later events winning."""
+  state_delta = {}
+  for event in events:
+    if event.actions and event.actions.state_delta:
+      state_delta.update(event.actions.state_delta)
+  return _extract_state_delta(state_delta)
+
+
 def _merge_state(app_state, user_state, session_state):
   # Merge states for response
   merged_state = copy.deepcopy(session_state)
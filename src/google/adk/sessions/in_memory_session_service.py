@@ -33,9 +33,27 @@ logger = logging.getLogger('google_adk.' + __name__)
 
 
 class InMemorySessionService(BaseSessionService):
-  """An in-memory implementation of the session service."""
-
-  def __init__(self):
+  """An in-memory implementation of the session service.
+
+  By default every session returned by the service is a deep copy of the
+  stored session, so callers can never observe or corrupt the stored state.
+
+  With `share_events=True` the service returns lightweight snapshots instead:
+  events are treated as immutable once appended and the returned session only
+  gets its own events list and state dict, while the `Event` objects are
+  shared with the stored append-only event log. This keeps the cost of
+  `get_session` independent of the size of the events, at the price of
+  callers having to treat events and nested state values as read-only.
+  """
+
+  def __init__(self, *, share_events: bool = False):
+    """Initializes the InMemorySessionService.
+
+    Args:
+      share_events: Whether to return snapshots that share the stored events
+        instead of deep copies of the session.
+    """
+    self._share_events = share_events
     # A map from app name to a map from user ID to a map from session ID to
     # session.
     self.sessions: dict[str, dict[str, dict[str, Session]]] = {}
@@ -103,7 +121,7 @@ class InMemorySessionService(BaseSessionService):
       self.sessions[app_name][user_id] = {}
     self.sessions[app_name][user_id][session_id] = session
 
-    copied_session = copy.deepcopy(session)
+    copied_session = self._snapshot_session(session, session.events)
     return self._merge_state(app_name, user_id, copied_session)
 
   @override
@@ -154,24 +172,40 @@ class InMemorySessionService(BaseSessionService):
       return None
 
     session = self.sessions[app_name][user_id].get(session_id)
-    copied_session = copy.deepcopy(session)
 
+    # Filter on the stored events first, so that only the requested window of
+    # events is copied.
+    events = session.events
     if config:
       if config.num_recent_events:
-        copied_session.events = copied_session.events[
-            -config.num_recent_events :
-        ]
+        events = events[-config.num_recent_events :]
       if config.after_timestamp:
-        i = len(copied_session.events) - 1
+        i = len(events) - 1
         while i >= 0:
-          if copied_session.events[i].timestamp < config.after_timestamp:
+          if events[i].timestamp < config.after_timestamp:
             break
           i -= 1
         if i >= 0:
-          copied_session.events = copied_session.events[i + 1 :]
+          events = events[i + 1 :]
 
+    copied_session = self._snapshot_session(session, events)
     return self._merge_state(app_name, user_id, copied_session)
 
+  def _snapshot_session(self, session: Session, events: list[Event]) -> Session:
+    """Returns a copy of the stored session that holds the given events."""
+    if self._share_events:
+      # Events are immutable once appended, so the snapshot only needs its own
+      # events list and state dict.
+      return session.model_copy(
+          update={'events': list(events), 'state': dict(session.state)}
+      )
+    return session.model_copy(
+        update={
+            'events': copy.deepcopy(events),
+            'state': copy.deepcopy(session.state),
+        }
+    )
+
   def _merge_state(
       self, app_name: str, user_id: str, copied_session: Session
   ) -> Session:
@@ -218,10 +252,9 @@ class InMemorySessionService(BaseSessionService):
 
     sessions_without_events = []
     for session in self.sessions[app_name][user_id].values():
-      copied_session = copy.deepcopy(session)
-      copied_session.events = []
-      copied_session.state = {}
-      sessions_without_events.append(copied_session)
+      sessions_without_events.append(
+          session.model_copy(update={'events': [], 'state': {}})
+      )
     return ListSessionsResponse(sessions=sessions_without_events)
 
   @override
@@ -243,12 +276,7 @@ class InMemorySessionService(BaseSessionService):
   def _delete_session_impl(
       self, *, app_name: str, user_id: str, session_id: str
   ) -> None:
-    if (
-        self._get_session_impl(
-            app_name=app_name, user_id=user_id, session_id=session_id
-        )
-        is None
-    ):
+    if session_id not in self.sessions.get(app_name, {}).get(user_id, {}):
       return
 
     self.sessions[app_name][user_id].pop(session_id)
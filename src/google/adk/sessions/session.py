@@ -18,8 +18,11 @@ from pydantic import alias_generators
 from pydantic import BaseModel
 from pydantic import ConfigDict
 from pydantic import Field
+from pydantic import PrivateAttr
+from typing_extensions import Self
 
 from ..events.event import Event
+from ._event_index import EventIndex
 
 
 class Session(BaseModel):
@@ -56,3 +59,16 @@ class Session(BaseModel):
   call/response, etc."""
   last_update_time: float = 0.0
   """The last update time of the session."""
+
+  _event_index: EventIndex = PrivateAttr(default_factory=EventIndex)
+  """The index of the events, see `get_event_index`."""
+
+  def __copy__(self) -> Self:
+    copied = super().__copy__()
+    # Copies may get other events, so they do not share the index.
+    copied._event_index = EventIndex()
+    return copied
+
+  def get_event_index(self) -> EventIndex:
+    """Returns the index of the events, updated to the current events."""
+    return self._event_index.update(self.events)
@@ -23,11 +23,18 @@
 
 from __future__ import annotations
 
+from enum import Enum
 import json
+import logging
+import os
 from typing import Any
+from typing import Callable
+from typing import Optional
 
 from google.genai import types
 from opentelemetry import trace
+from pydantic import BaseModel
+from pydantic import ConfigDict
 
 from .agents.invocation_context import InvocationContext
 from .events.event import Event
@@ -35,8 +42,111 @@ from .models.llm_request import LlmRequest
 from .models.llm_response import LlmResponse
 from .tools.base_tool import BaseTool
 
+logger = logging.getLogger('google_adk.' + __name__)
+
 tracer = trace.get_tracer('gcp.vertex.agent')
 
+_PAYLOADS_ENV_VARIABLE_NAME = 'ADK_TELEMETRY_PAYLOADS'
+
+
+class PayloadCapture(Enum):
+  """How the payloads of LLM and tool calls are recorded in spans."""
+
+  OFF = 'off'
+  """No attributes are recorded on the spans."""
+
+  METADATA = 'metadata'
+  """Only ids, names and the model are recorded, not the payloads."""
+
+  TRUNCATED = 'truncated'
+  """The payloads are recorded, truncated to `max_payload_chars`."""
+
+  FULL = 'full'
+  """The payloads are recorded in full."""
+
+
+class TelemetryPolicy(BaseModel):
+  """Configs for what is recorded in the spans of LLM and tool calls.
+
+  Nothing is serialized for spans that are not recording, e.g. if tracing is
+  not enabled or the span is not sampled.
+  """
+
+  model_config = ConfigDict(
+      extra='forbid',
+  )
+  """The pydantic model config."""
+
+  payload_capture: PayloadCapture = PayloadCapture.FULL
+  """How the payloads are recorded. The web UI needs the full payloads.
+
+  The default can be set with the `ADK_TELEMETRY_PAYLOADS` environment
+  variable, to one of `off`, `metadata`, `truncated` or `full`.
+  """
+
+  max_payload_chars: int = 4096
+  """The max length of a payload, if truncated."""
+
+  max_payload_contents: int = 5
+  """The max number of the last contents of an LLM request, if truncated."""
+
+
+def _default_telemetry_policy() -> TelemetryPolicy:
+  payload_capture = os.environ.get(_PAYLOADS_ENV_VARIABLE_NAME)
+  if not payload_capture:
+    return TelemetryPolicy()
+  try:
+    return TelemetryPolicy(
+        payload_capture=PayloadCapture(payload_capture.strip().lower())
+    )
+  except ValueError:
+    logger.warning(
+        'Ignoring invalid %s=%r, expected one of: %s.',
+        _PAYLOADS_ENV_VARIABLE_NAME,
+        payload_capture,
+        ', '.join(capture.value for capture in PayloadCapture),
+    )
+    return TelemetryPolicy()
+
+
+_telemetry_policy = _default_telemetry_policy()
+
+
+def get_telemetry_policy() -> TelemetryPolicy:
+  """Returns the policy of what is recorded in spans."""
+  return _telemetry_policy
+
+
+def set_telemetry_policy(policy: TelemetryPolicy) -> None:
+  """Sets the policy of what is recorded in spans."""
+  global _telemetry_policy
+  _telemetry_policy = policy
+
+
+def _get_recording_span() -> Optional[trace.Span]:
+  """Returns the current span, if attributes should be recorded on it."""
+  span = trace.get_current_span()
+  if (
+      _telemetry_policy.payload_capture == PayloadCapture.OFF
+      or not span.is_recording()
+  ):
+    return None
+  return span
+
+
+def _set_payload_attribute(
+    span: trace.Span, key: str, serialize: Callable[[], str]
+) -> None:
+  """Sets a payload attribute, serialized only if the policy records it."""
+  payload_capture = _telemetry_policy.payload_capture
+  if payload_capture == PayloadCapture.METADATA:
+    return
+  payload = serialize()
+  max_chars = _telemetry_policy.max_payload_chars
+  if payload_capture == PayloadCapture.TRUNCATED and len(payload) > max_chars:
+    payload = f'{payload[:max_chars]}...<truncated>'
+  span.set_attribute(key, payload)
+
 
 def _safe_json_serialize(obj) -> str:
   """Convert any Python object to a JSON-serializable type or string.
@@ -69,7 +179,9 @@ def trace_tool_call(
     args: The arguments to the tool call.
     function_response_event: The event with the function response details.
   """
-  span = trace.get_current_span()
+  span = _get_recording_span()
+  if not span:
+    return
   span.set_attribute('gen_ai.system', 'gcp.vertex.agent')
   span.set_attribute('gen_ai.operation.name', 'execute_tool')
   span.set_attribute('gen_ai.tool.name', tool.name)
@@ -88,14 +200,16 @@ def trace_tool_call(
 
   if not isinstance(tool_response, dict):
     tool_response = {'result': tool_response}
-  span.set_attribute(
+  _set_payload_attribute(
+      span,
       'gcp.vertex.agent.tool_call_args',
-      _safe_json_serialize(args),
+      lambda: _safe_json_serialize(args),
   )
   span.set_attribute('gcp.vertex.agent.event_id', function_response_event.id)
-  span.set_attribute(
+  _set_payload_attribute(
+      span,
       'gcp.vertex.agent.tool_response',
-      _safe_json_serialize(tool_response),
+      lambda: _safe_json_serialize(tool_response),
   )
   # Setting empty llm request and response (as UI expect these) while not
   # applicable for tool_response.
@@ -120,7 +234,9 @@ def trace_merged_tool_calls(
     function_response_event: The merged response event.
   """
 
-  span = trace.get_current_span()
+  span = _get_recording_span()
+  if not span:
+    return
   span.set_attribute('gen_ai.system', 'gcp.vertex.agent')
   span.set_attribute('gen_ai.operation.name', 'execute_tool')
   span.set_attribute('gen_ai.tool.name', '(merged tools)')
@@ -129,16 +245,17 @@ def trace_merged_tool_calls(
 
   span.set_attribute('gcp.vertex.agent.tool_call_args', 'N/A')
   span.set_attribute('gcp.vertex.agent.event_id', response_event_id)
-  try:
-    function_response_event_json = function_response_event.model_dumps_json(
-        exclude_none=True
-    )
-  except Exception:  # pylint: disable=broad-exception-caught
-    function_response_event_json = '<not serializable>'
 
-  span.set_attribute(
+  def serialize_function_response_event() -> str:
+    try:
+      return function_response_event.model_dumps_json(exclude_none=True)
+    except Exception:  # pylint: disable=broad-exception-caught
+      return '<not serializable>'
+
+  _set_payload_attribute(
+      span,
       'gcp.vertex.agent.tool_response',
-      function_response_event_json,
+      serialize_function_response_event,
   )
   # Setting empty llm request and response (as UI expect these) while not
   # applicable for tool_response.
@@ -166,7 +283,9 @@ def trace_call_llm(
     llm_request: The LLM request object.
     llm_response: The LLM response object.
   """
-  span = trace.get_current_span()
+  span = _get_recording_span()
+  if not span:
+    return
   # Special standard Open Telemetry GenaI attributes that indicate
   # that this is a span related to a Generative AI system.
   span.set_attribute('gen_ai.system', 'gcp.vertex.agent')
@@ -179,20 +298,28 @@ def trace_call_llm(
   )
   span.set_attribute('gcp.vertex.agent.event_id', event_id)
   # Consider removing once GenAI SDK provides a way to record this info.
-  span.set_attribute(
+  max_contents = (
+      _telemetry_policy.max_payload_contents
+      if _telemetry_policy.payload_capture == PayloadCapture.TRUNCATED
+      else None
+  )
+  _set_payload_attribute(
+      span,
       'gcp.vertex.agent.llm_request',
-      _safe_json_serialize(_build_llm_request_for_trace(llm_request)),
+      lambda: _safe_json_serialize(
+          _build_llm_request_for_trace(llm_request, max_contents)
+      ),
   )
   # Consider removing once GenAI SDK provides a way to record this info.
 
-  try:
-    llm_response_json = llm_response.model_dump_json(exclude_none=True)
-  except Exception:  # pylint: disable=broad-exception-caught
-    llm_response_json = '<not serializable>'
+  def serialize_llm_response() -> str:
+    try:
+      return llm_response.model_dump_json(exclude_none=True)
+    except Exception:  # pylint: disable=broad-exception-caught
+      return '<not serializable>'
 
-  span.set_attribute(
-      'gcp.vertex.agent.llm_response',
-      llm_response_json,
+  _set_payload_attribute(
+      span, 'gcp.vertex.agent.llm_response', serialize_llm_response
   )
 
 
@@ -211,16 +338,19 @@ def trace_send_data(
     event_id: The ID of the event.
     data: A list of content objects.
   """
-  span = trace.get_current_span()
+  span = _get_recording_span()
+  if not span:
+    return
   span.set_attribute(
       'gcp.vertex.agent.invocation_id', invocation_context.invocation_id
   )
   span.set_attribute('gcp.vertex.agent.event_id', event_id)
   # Once instrumentation is added to the GenAI SDK, consider whether this
   # information still needs to be recorded by the Agent Development Kit.
-  span.set_attribute(
+  _set_payload_attribute(
+      span,
       'gcp.vertex.agent.data',
-      _safe_json_serialize([
+      lambda: _safe_json_serialize([
           types.Content(role=content.role, parts=content.parts).model_dump(
               exclude_none=True
           )
@@ -229,7 +359,9 @@ def trace_send_data(
   )
 
 
-def _build_llm_request_for_trace(llm_request: LlmRequest) -> dict[str, Any]:
+def _build_llm_request_for_trace(
+    llm_request: LlmRequest, max_contents: Optional[int] = None
+) -> dict[str, Any]:
   """Builds a dictionary representation of the LLM request for tracing.
 
   This function prepares a dictionary representation of the LlmRequest
@@ -238,6 +370,7 @@ def _build_llm_request_for_trace(llm_request: LlmRequest) -> dict[str, Any]:
 
   Args:
     llm_request: The LlmRequest object.
+    max_contents: The max number of the last contents to include, if any.
 
   Returns:
     A dictionary representation of the LLM request.
@@ -248,10 +381,14 @@ def _build_llm_request_for_trace(llm_request: LlmRequest) -> dict[str, Any]:
       'config': llm_request.config.model_dump(
           exclude_none=True, exclude='response_schema'
       ),
-      'contents': [],
   }
+  contents = llm_request.contents
+  if max_contents is not None and len(contents) > max_contents:
+    result['num_omitted_contents'] = len(contents) - max_contents
+    contents = contents[len(contents) - max_contents :]
+  result['contents'] = []
   # We do not want to send bytes data to the trace.
-  for content in llm_request.contents:
+  for content in contents:
     parts = [part for part in content.parts if not part.inline_data]
     result['contents'].append(
         types.Content(role=content.role, parts=parts).model_dump(
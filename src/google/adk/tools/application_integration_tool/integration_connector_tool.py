@@ -178,7 +178,9 @@ class IntegrationConnectorTool(BaseTool):
     args['operation'] = self._operation
     args['action'] = self._action
     logger.info('Running tool: %s with args: %s', self.name, args)
-    return self._rest_api_tool.call(args=args, tool_context=tool_context)
+    return await self._rest_api_tool.run_async(
+        args=args, tool_context=tool_context
+    )
 
   def __str__(self):
     return (
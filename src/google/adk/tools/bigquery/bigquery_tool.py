@@ -13,7 +13,6 @@
 # limitations under the License.
 
 
-import inspect
 from typing import Any
 from typing import Callable
 from typing import Optional
@@ -110,7 +109,7 @@ class BigQueryTool(FunctionTool):
         The result of the tool execution
     """
     args_to_call = args.copy()
-    signature = inspect.signature(self.func)
+    signature = self._get_signature()
     if "credentials" in signature.parameters:
       args_to_call["credentials"] = credentials
     return await super().run_async(args=args_to_call, tool_context=tool_context)
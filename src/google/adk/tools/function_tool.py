@@ -20,6 +20,7 @@ from typing import Optional
 from google.genai import types
 from typing_extensions import override
 
+from ..utils.variant_utils import GoogleLLMVariant
 from ._automatic_function_calling_util import build_function_declaration
 from .base_tool import BaseTool
 from .tool_context import ToolContext
@@ -58,27 +59,51 @@ class FunctionTool(BaseTool):
     super().__init__(name=name, description=doc)
     self.func = func
     self._ignore_params = ['tool_context', 'input_stream']
+    self._declarations: dict[GoogleLLMVariant, dict[str, Any]] = {}
+    """The dumped function declaration for each API variant, built once."""
+    self._signature: Optional[inspect.Signature] = None
+    self._mandatory_args: Optional[list[str]] = None
 
   @override
   def _get_declaration(self) -> Optional[types.FunctionDeclaration]:
-    function_decl = types.FunctionDeclaration.model_validate(
-        build_function_declaration(
-            func=self.func,
-            # The model doesn't understand the function context.
-            # input_stream is for streaming tool
-            ignore_params=self._ignore_params,
-            variant=self._api_variant,
-        )
+    variant = self._api_variant
+    if (function_decl := self._declarations.get(variant)) is None:
+      function_decl = types.FunctionDeclaration.model_validate(
+          build_function_declaration(
+              func=self.func,
+              # The model doesn't understand the function context.
+              # input_stream is for streaming tool
+              ignore_params=self._ignore_params,
+              variant=variant,
+          )
+      ).model_dump(exclude_none=True)
+      self._declarations[variant] = function_decl
+
+    # Callers may modify the declaration, e.g. in a before_model_callback, so
+    # each of them gets a new declaration, validated from the cached dump.
+    return types.FunctionDeclaration.model_validate(function_decl)
+
+  def _get_signature(self) -> inspect.Signature:
+    """Returns the signature of the function, inspected once."""
+    if self._signature is None:
+      self._signature = inspect.signature(self.func)
+    return self._signature
+
+  def _is_async(self) -> bool:
+    # Functions are callable objects, but not all callable objects are
+    # functions checking coroutine function is not enough. We also need to
+    # check whether Callable's __call__ function is a coroutine funciton
+    return inspect.iscoroutinefunction(self.func) or (
+        hasattr(self.func, '__call__')
+        and inspect.iscoroutinefunction(self.func.__call__)
     )
 
-    return function_decl
-
   @override
   async def run_async(
       self, *, args: dict[str, Any], tool_context: ToolContext
   ) -> Any:
     args_to_call = args.copy()
-    signature = inspect.signature(self.func)
+    signature = self._get_signature()
     if 'tool_context' in signature.parameters:
       args_to_call['tool_context'] = tool_context
 
@@ -99,14 +124,7 @@ class FunctionTool(BaseTool):
 You could retry calling this tool, but it is IMPORTANT for you to provide all the mandatory parameters."""
       return {'error': error_str}
 
-    # Functions are callable objects, but not all callable objects are functions
-    # checking coroutine function is not enough. We also need to check whether
-    # Callable's __call__ function is a coroutine funciton
-    if (
-        inspect.iscoroutinefunction(self.func)
-        or hasattr(self.func, '__call__')
-        and inspect.iscoroutinefunction(self.func.__call__)
-    ):
+    if self._is_async():
       return await self.func(**args_to_call)
     else:
       return self.func(**args_to_call)
@@ -120,7 +138,7 @@ You could retry calling this tool, but it is IMPORTANT for you to provide all th
       invocation_context,
   ) -> Any:
     args_to_call = args.copy()
-    signature = inspect.signature(self.func)
+    signature = self._get_signature()
     if (
         self.name in invocation_context.active_streaming_tools
         and invocation_context.active_streaming_tools[self.name].stream
@@ -141,7 +159,9 @@ You could retry calling this tool, but it is IMPORTANT for you to provide all th
     Returns:
       A list of strings, where each string is the name of a mandatory parameter.
     """
-    signature = inspect.signature(self.func)
+    if self._mandatory_args is not None:
+      return list(self._mandatory_args)
+    signature = self._get_signature()
     mandatory_params = []
 
     for name, param in signature.parameters.items():
@@ -156,4 +176,5 @@ You could retry calling this tool, but it is IMPORTANT for you to provide all th
       ):
         mandatory_params.append(name)
 
-    return mandatory_params
+    self._mandatory_args = mandatory_params
+    return list(mandatory_params)
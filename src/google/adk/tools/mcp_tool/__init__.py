@@ -20,12 +20,16 @@ try:
   from .mcp_session_manager import SseConnectionParams
   from .mcp_session_manager import StdioConnectionParams
   from .mcp_session_manager import StreamableHTTPConnectionParams
+  from .mcp_session_pool import MCPSessionPool
+  from .mcp_session_pool import MCPSessionPoolConfig
   from .mcp_tool import MCPTool
   from .mcp_toolset import MCPToolset
 
   __all__.extend([
       'adk_to_mcp_tool_type',
       'gemini_to_json_schema',
+      'MCPSessionPool',
+      'MCPSessionPoolConfig',
       'MCPTool',
       'MCPToolset',
       'StdioConnectionParams',
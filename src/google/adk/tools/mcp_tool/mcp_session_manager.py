@@ -30,6 +30,7 @@ from pydantic import BaseModel
 try:
   from mcp import ClientSession
   from mcp import StdioServerParameters
+  from mcp import types as mcp_types
   from mcp.client.sse import sse_client
   from mcp.client.stdio import stdio_client
   from mcp.client.streamable_http import streamablehttp_client
@@ -207,6 +208,23 @@ class MCPSessionManager:
     # Each session manager maintains its own exit stack for proper cleanup
     self._exit_stack: Optional[AsyncExitStack] = None
     self._session: Optional[ClientSession] = None
+    self._tools_version = 0
+
+  @property
+  def tools_version(self) -> int:
+    """A number that changes whenever the server's tools may have changed.
+
+    It changes when a new session is created, e.g. on reconnects, and when the
+    server sends a `notifications/tools/list_changed` notification.
+    """
+    return self._tools_version
+
+  async def _handle_message(self, message: Any) -> None:
+    """Handles the messages from the server that are not responses."""
+    if isinstance(message, mcp_types.ServerNotification) and isinstance(
+        message.root, mcp_types.ToolListChangedNotification
+    ):
+      self._tools_version += 1
 
   async def create_session(self) -> ClientSession:
     """Creates and initializes an MCP client session.
@@ -260,15 +278,17 @@ class MCPSessionManager:
                 read_timeout_seconds=timedelta(
                     seconds=self._connection_params.timeout
                 ),
+                message_handler=self._handle_message,
             )
         )
       else:
         session = await self._exit_stack.enter_async_context(
-            ClientSession(*transports[:2])
+            ClientSession(*transports[:2], message_handler=self._handle_message)
         )
       await session.initialize()
 
       self._session = session
+      self._tools_version += 1
       return session
 
     except Exception:
@@ -0,0 +1,440 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import asyncio
+import collections
+from contextlib import asynccontextmanager
+import logging
+import sys
+import time
+from typing import Any
+from typing import AsyncIterator
+from typing import Callable
+from typing import Optional
+from typing import TextIO
+from typing import Union
+
+import anyio
+from pydantic import BaseModel
+from pydantic import Field
+
+from .mcp_session_manager import MCPSessionManager
+from .mcp_session_manager import SseConnectionParams
+from .mcp_session_manager import StdioConnectionParams
+from .mcp_session_manager import StreamableHTTPConnectionParams
+
+# Attempt to import MCP Tool from the MCP library, and hints user to upgrade
+# their Python version to 3.10 if it fails.
+try:
+  from mcp import ClientSession
+  from mcp import StdioServerParameters
+except ImportError as e:
+  import sys
+
+  if sys.version_info < (3, 10):
+    raise ImportError(
+        'MCP Tool requires Python 3.10 or above. Please upgrade your Python'
+        ' version.'
+    ) from e
+  else:
+    raise e
+
+logger = logging.getLogger('google_adk.' + __name__)
+
+
+class MCPSessionPoolConfig(BaseModel):
+  """Configs for a pool of MCP sessions to the same server.
+
+  Attributes:
+      min_size: The number of sessions without an affinity key that are kept
+        open when idle.
+      max_size: The maximum number of open sessions per affinity key.
+      max_in_flight_per_session: The maximum number of concurrent requests on
+        a session. Callers wait in FIFO order when all sessions are busy and
+        the pool is full.
+      acquire_timeout_secs: How long to wait for a session, in seconds. None
+        waits forever.
+      health_check_interval_secs: A session idle for longer than this is pinged
+        before it's used, and replaced if the ping fails. None disables health
+        checks.
+      health_check_timeout_secs: How long to wait for a ping, in seconds.
+      idle_timeout_secs: Sessions idle for longer than this are closed, down to
+        `min_size`. None keeps idle sessions open.
+      user_affinity: Whether each user gets their own sessions, so that
+        sessions authenticated as a user are never shared.
+      user_headers_provider: Returns the headers of a user's sessions, e.g.
+        their auth headers. Only used with `user_affinity`, and with SSE or
+        Streamable HTTP connections.
+  """
+
+  min_size: int = Field(default=1, ge=0)
+  max_size: int = Field(default=4, ge=1)
+  max_in_flight_per_session: int = Field(default=10, ge=1)
+  acquire_timeout_secs: Optional[float] = None
+  health_check_interval_secs: Optional[float] = 30.0
+  health_check_timeout_secs: float = 5.0
+  idle_timeout_secs: Optional[float] = 300.0
+  user_affinity: bool = False
+  user_headers_provider: Optional[Callable[[str], dict[str, Any]]] = None
+
+
+class _PooledSession:
+  """An MCP session of a pool.
+
+  The session is opened and closed by its own task, as the transports of MCP
+  sessions must be closed by the task that opened them.
+  """
+
+  def __init__(self, session_manager: MCPSessionManager):
+    self.session_manager = session_manager
+    self.session: Optional[ClientSession] = None
+    self.in_flight = 0
+    self.last_used_at = time.monotonic()
+    self._close_event = asyncio.Event()
+    self._task: Optional[asyncio.Task] = None
+
+  async def open(self) -> None:
+    opened = asyncio.get_running_loop().create_future()
+    self._task = asyncio.create_task(self._run(opened))
+    try:
+      self.session = await opened
+    except asyncio.CancelledError:
+      self._close_event.set()
+      raise
+
+  async def _run(self, opened: asyncio.Future) -> None:
+    try:
+      session = await self.session_manager.create_session()
+    except BaseException as e:
+      if not opened.done():
+        opened.set_exception(e)
+      return
+    if not opened.done():
+      opened.set_result(session)
+    try:
+      await self._close_event.wait()
+    finally:
+      await self.session_manager.close()
+
+  async def close(self) -> None:
+    self._close_event.set()
+    if self._task is not None:
+      await self._task
+
+
+class _SessionGroup:
+  """The sessions of a pool with the same affinity key."""
+
+  def __init__(self, session_manager_factory: Callable[[], MCPSessionManager]):
+    self.session_manager_factory = session_manager_factory
+    self.sessions: list[_PooledSession] = []
+    self.num_opening = 0
+    self.waiters: collections.deque[asyncio.Future] = collections.deque()
+    """Callers waiting for a session, in FIFO order. A waiter's result is the
+    session handed to it, or None if it may open a session."""
+
+
+class MCPSessionPool:
+  """A pool of MCP sessions to the same server.
+
+  Concurrent calls are spread over up to `max_size` sessions, instead of all
+  sharing one transport. Closed sessions are replaced without affecting the
+  calls on other sessions.
+
+  Usage:
+  ```python
+  pool = MCPSessionPool(connection_params, MCPSessionPoolConfig(max_size=8))
+  async with pool.session() as session:
+    await session.call_tool('tool_name', arguments={})
+  ```
+  """
+
+  def __init__(
+      self,
+      connection_params: Union[
+          StdioServerParameters,
+          StdioConnectionParams,
+          SseConnectionParams,
+          StreamableHTTPConnectionParams,
+      ],
+      config: Optional[MCPSessionPoolConfig] = None,
+      errlog: TextIO = sys.stderr,
+  ):
+    """Initializes the MCP session pool.
+
+    Args:
+        connection_params: Parameters for the MCP connection (Stdio, SSE or
+          Streamable HTTP).
+        config: The configs of the pool.
+        errlog: (Optional) TextIO stream for error logging. Use only for
+          initializing a local stdio MCP session.
+    """
+    self._connection_params = connection_params
+    self._config = config or MCPSessionPoolConfig()
+    self._errlog = errlog
+    self._groups: dict[Optional[str], _SessionGroup] = {}
+    self._closing_tasks: set[asyncio.Task] = set()
+    self._base_tools_version = 0
+    """The tools version of the sessions that are no longer in the pool."""
+
+  @property
+  def tools_version(self) -> int:
+    """A number that changes whenever the server's tools may have changed.
+
+    It changes when a session is replaced after it was closed, and when the
+    server notifies any session that its tools changed.
+    """
+    # The version of a session manager is 1 once its session is open, and is
+    # bumped by each tools/list_changed notification.
+    return self._base_tools_version + sum(
+        max(pooled.session_manager.tools_version - 1, 0)
+        for group in self._groups.values()
+        for pooled in group.sessions
+    )
+
+  def get_affinity_key(self, user_id: Optional[str]) -> Optional[str]:
+    """Returns the affinity key of a user's sessions."""
+    return user_id if self._config.user_affinity else None
+
+  @asynccontextmanager
+  async def session(
+      self, affinity_key: Optional[str] = None
+  ) -> AsyncIterator[ClientSession]:
+    """Acquires a session of the pool for the duration of the context.
+
+    If the session is closed by the server, it's removed from the pool and the
+    `anyio.ClosedResourceError` is raised, so that the caller can retry on
+    another session.
+
+    Args:
+        affinity_key: Sessions are only shared by callers with the same key,
+          e.g. from `get_affinity_key`.
+
+    Yields:
+        ClientSession: The initialized MCP client session.
+    """
+    self._close_idle_sessions()
+    group = self._get_group(affinity_key)
+    pooled = await self._acquire(group)
+    try:
+      yield pooled.session
+    except anyio.ClosedResourceError:
+      await self._discard(group, pooled, replaced=True)
+      raise
+    except BaseException:
+      self._release(group, pooled)
+      raise
+    else:
+      self._release(group, pooled)
+
+  def _get_group(self, affinity_key: Optional[str]) -> _SessionGroup:
+    group = self._groups.get(affinity_key)
+    if group is None:
+      connection_params = self._connection_params
+      if (
+          affinity_key is not None
+          and self._config.user_headers_provider is not None
+          and isinstance(
+              connection_params,
+              (SseConnectionParams, StreamableHTTPConnectionParams),
+          )
+      ):
+        connection_params = connection_params.model_copy(
+            update={
+                'headers': {
+                    **(connection_params.headers or {}),
+                    **self._config.user_headers_provider(affinity_key),
+                }
+            }
+        )
+      group = _SessionGroup(
+          lambda: MCPSessionManager(
+              connection_params=connection_params, errlog=self._errlog
+          )
+      )
+      self._groups[affinity_key] = group
+    return group
+
+  async def _acquire(self, group: _SessionGroup) -> _PooledSession:
+    # Only waiters that were woken up may skip the queue.
+    may_skip_queue = False
+    while True:
+      if may_skip_queue or not group.waiters:
+        pooled = self._get_least_busy_session(group)
+        # Busy sessions are only shared when the pool is full.
+        if (pooled is None or pooled.in_flight > 0) and len(
+            group.sessions
+        ) + group.num_opening < self._config.max_size:
+          return await self._open_session(group)
+        if pooled is not None:
+          pooled.in_flight += 1
+          if await self._check_health(group, pooled):
+            return pooled
+          continue
+      pooled = await self._wait(group)
+      if pooled is not None:
+        return pooled
+      may_skip_queue = True
+
+  def _get_least_busy_session(
+      self, group: _SessionGroup
+  ) -> Optional[_PooledSession]:
+    least_busy = None
+    for pooled in group.sessions:
+      if pooled.in_flight < self._config.max_in_flight_per_session and (
+          least_busy is None or pooled.in_flight < least_busy.in_flight
+      ):
+        least_busy = pooled
+    return least_busy
+
+  async def _check_health(
+      self, group: _SessionGroup, pooled: _PooledSession
+  ) -> bool:
+    """Pings the session if it has been idle, and discards it if unhealthy."""
+    interval = self._config.health_check_interval_secs
+    if (
+        interval is None
+        or pooled.in_flight > 1
+        or time.monotonic() - pooled.last_used_at < interval
+    ):
+      return True
+    try:
+      await asyncio.wait_for(
+          pooled.session.send_ping(),
+          timeout=self._config.health_check_timeout_secs,
+      )
+    except Exception as e:
+      logger.warning('Replacing the unhealthy MCP session: %s', e)
+      await self._discard(group, pooled, replaced=True)
+      return False
+    pooled.last_used_at = time.monotonic()
+    return True
+
+  async def _open_session(self, group: _SessionGroup) -> _PooledSession:
+    pooled = _PooledSession(group.session_manager_factory())
+    group.num_opening += 1
+    try:
+      await pooled.open()
+    except BaseException:
+      # Lets a waiter try to open a session instead.
+      self._wake_up_waiter(group, None)
+      raise
+    finally:
+      group.num_opening -= 1
+    pooled.in_flight = 1
+    group.sessions.append(pooled)
+    return pooled
+
+  async def _wait(self, group: _SessionGroup) -> Optional[_PooledSession]:
+    """Waits for a session to be handed over, or for room to open one."""
+    waiter = asyncio.get_running_loop().create_future()
+    group.waiters.append(waiter)
+    try:
+      return await asyncio.wait_for(
+          asyncio.shield(waiter), timeout=self._config.acquire_timeout_secs
+      )
+    except BaseException:
+      if not waiter.done():
+        waiter.cancel()
+        group.waiters.remove(waiter)
+      elif not waiter.cancelled():
+        # The waiter was woken up, but the caller gave up meanwhile.
+        if (pooled := waiter.result()) is not None:
+          self._release(group, pooled)
+        else:
+          self._wake_up_waiter(group, None)
+      raise
+
+  def _wake_up_waiter(
+      self, group: _SessionGroup, pooled: Optional[_PooledSession]
+  ) -> bool:
+    """Hands the session, or room to open one, to the first waiter."""
+    while group.waiters:
+      waiter = group.waiters.popleft()
+      if not waiter.done():
+        waiter.set_result(pooled)
+        return True
+    return False
+
+  def _release(self, group: _SessionGroup, pooled: _PooledSession) -> None:
+    pooled.last_used_at = time.monotonic()
+    if pooled not in group.sessions:
+      # The session was discarded while in use.
+      return
+    if not self._wake_up_waiter(group, pooled):
+      pooled.in_flight -= 1
+
+  async def _discard(
+      self, group: _SessionGroup, pooled: _PooledSession, replaced: bool
+  ) -> None:
+    """Removes the session from the pool, and closes it.
+
+    Args:
+        group: The group of the session.
+        pooled: The session to discard.
+        replaced: Whether the session is discarded because it failed, so that
+          the server may have changed.
+    """
+    if pooled not in group.sessions:
+      return
+    group.sessions.remove(pooled)
+    self._base_tools_version += max(
+        pooled.session_manager.tools_version - 1, 0
+    ) + int(replaced)
+    self._wake_up_waiter(group, None)
+    await self._close_session(pooled)
+
+  def _close_idle_sessions(self) -> None:
+    idle_timeout = self._config.idle_timeout_secs
+    if idle_timeout is None:
+      return
+    now = time.monotonic()
+    for affinity_key, group in list(self._groups.items()):
+      min_size = self._config.min_size if affinity_key is None else 0
+      for pooled in list(group.sessions):
+        if len(group.sessions) <= min_size:
+          break
+        if pooled.in_flight == 0 and now - pooled.last_used_at >= idle_timeout:
+          group.sessions.remove(pooled)
+          self._base_tools_version += max(
+              pooled.session_manager.tools_version - 1, 0
+          )
+          task = asyncio.create_task(self._close_session(pooled))
+          self._closing_tasks.add(task)
+          task.add_done_callback(self._closing_tasks.discard)
+      if not group.sessions and not group.num_opening and not group.waiters:
+        del self._groups[affinity_key]
+
+  async def _close_session(self, pooled: _PooledSession) -> None:
+    try:
+      await pooled.close()
+    except Exception as e:
+      # Log the error but don't re-raise to avoid blocking the callers
+      logger.warning('Error during MCP session cleanup: %s', e)
+
+  async def close(self) -> None:
+    """Closes all sessions of the pool."""
+    # The sessions opened after closing may list different tools.
+    self._base_tools_version = self.tools_version + 1
+    groups = list(self._groups.values())
+    self._groups.clear()
+    for group in groups:
+      for waiter in group.waiters:
+        waiter.cancel()
+      for pooled in group.sessions:
+        await self._close_session(pooled)
+    if self._closing_tasks:
+      await asyncio.gather(*self._closing_tasks)
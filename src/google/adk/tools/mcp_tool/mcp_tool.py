@@ -15,6 +15,7 @@
 from __future__ import annotations
 
 import logging
+from typing import Any
 from typing import Optional
 
 from google.genai.types import FunctionDeclaration
@@ -23,6 +24,7 @@ from typing_extensions import override
 from .._gemini_schema_util import _to_gemini_schema
 from .mcp_session_manager import MCPSessionManager
 from .mcp_session_manager import retry_on_closed_resource
+from .mcp_session_pool import MCPSessionPool
 
 # Attempt to import MCP Tool from the MCP library, and hints user to upgrade
 # their Python version to 3.10 if it fails.
@@ -62,6 +64,7 @@ class MCPTool(BaseTool):
       mcp_session_manager: MCPSessionManager,
       auth_scheme: Optional[AuthScheme] = None,
       auth_credential: Optional[AuthCredential] = None,
+      mcp_session_pool: Optional[MCPSessionPool] = None,
   ):
     """Initializes a MCPTool.
 
@@ -73,6 +76,8 @@ class MCPTool(BaseTool):
         mcp_session_manager: The MCP session manager to use for communication.
         auth_scheme: The authentication scheme to use.
         auth_credential: The authentication credential to use.
+        mcp_session_pool: The pool of MCP sessions to call the tool with,
+          instead of the session of mcp_session_manager.
 
     Raises:
         ValueError: If mcp_tool or mcp_session_manager is None.
@@ -87,23 +92,30 @@ class MCPTool(BaseTool):
     )
     self._mcp_tool = mcp_tool
     self._mcp_session_manager = mcp_session_manager
+    self._mcp_session_pool = mcp_session_pool
     # TODO(cheliu): Support passing auth to MCP Server.
     self._auth_scheme = auth_scheme
     self._auth_credential = auth_credential
+    self._declaration: Optional[dict[str, Any]] = None
+    """The dumped function declaration, converted once."""
 
   @override
   def _get_declaration(self) -> FunctionDeclaration:
     """Gets the function declaration for the tool.
 
+    The declaration is converted from the MCP schema once. Each call returns a
+    new declaration, which the caller may modify.
+
     Returns:
         FunctionDeclaration: The Gemini function declaration for the tool.
     """
-    schema_dict = self._mcp_tool.inputSchema
-    parameters = _to_gemini_schema(schema_dict)
-    function_decl = FunctionDeclaration(
-        name=self.name, description=self.description, parameters=parameters
-    )
-    return function_decl
+    if self._declaration is None:
+      schema_dict = self._mcp_tool.inputSchema
+      parameters = _to_gemini_schema(schema_dict)
+      self._declaration = FunctionDeclaration(
+          name=self.name, description=self.description, parameters=parameters
+      ).model_dump(exclude_none=True)
+    return FunctionDeclaration.model_validate(self._declaration)
 
   @retry_on_closed_resource("_reinitialize_session")
   async def run_async(self, *, args, tool_context: ToolContext):
@@ -116,6 +128,13 @@ class MCPTool(BaseTool):
     Returns:
         Any: The response from the tool.
     """
+    if self._mcp_session_pool is not None:
+      affinity_key = self._mcp_session_pool.get_affinity_key(
+          tool_context._invocation_context.user_id
+      )
+      async with self._mcp_session_pool.session(affinity_key) as session:
+        return await session.call_tool(self.name, arguments=args)
+
     # Get the session from the session manager
     session = await self._mcp_session_manager.create_session()
 
@@ -125,6 +144,10 @@ class MCPTool(BaseTool):
 
   async def _reinitialize_session(self):
     """Reinitializes the session when connection is lost."""
+    if self._mcp_session_pool is not None:
+      # The pool has already discarded the closed session, and opens a new one
+      # on retry.
+      return
     # Close the old session and create a new one
     await self._mcp_session_manager.close()
     await self._mcp_session_manager.create_session()
@@ -14,8 +14,11 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import sys
+import time
+from typing import Dict
 from typing import List
 from typing import Optional
 from typing import TextIO
@@ -32,6 +35,8 @@ from .mcp_session_manager import SseServerParams
 from .mcp_session_manager import StdioConnectionParams
 from .mcp_session_manager import StreamableHTTPConnectionParams
 from .mcp_session_manager import StreamableHTTPServerParams
+from .mcp_session_pool import MCPSessionPool
+from .mcp_session_pool import MCPSessionPoolConfig
 
 # Attempt to import MCP Tool from the MCP library, and hints user to upgrade
 # their Python version to 3.10 if it fails.
@@ -54,6 +59,16 @@ from .mcp_tool import MCPTool
 logger = logging.getLogger("google_adk." + __name__)
 
 
+class _CachedTools:
+  """The tools listed on the sessions of an affinity key."""
+
+  def __init__(self, tools: List[MCPTool], tools_version: int):
+    self.tools = tools
+    self.tools_version = tools_version
+    """The tools version of the sessions when the tools were listed."""
+    self.cached_at = time.monotonic()
+
+
 class MCPToolset(BaseToolset):
   """Connects to a MCP Server, and retrieves MCP Tools into ADK Tools.
 
@@ -96,6 +111,8 @@ class MCPToolset(BaseToolset):
       ],
       tool_filter: Optional[Union[ToolPredicate, List[str]]] = None,
       errlog: TextIO = sys.stderr,
+      tools_cache_ttl_secs: Optional[float] = 300.0,
+      session_pool_config: Optional[MCPSessionPoolConfig] = None,
   ):
     """Initializes the MCPToolset.
 
@@ -112,6 +129,12 @@ class MCPToolset(BaseToolset):
         list of tool names to include - A ToolPredicate function for custom
         filtering logic
       errlog: TextIO stream for error logging.
+      tools_cache_ttl_secs: How long the tools of the server are cached, in
+        seconds. The cache is also cleared when the server notifies that its
+        tools changed, and when the session is recreated. None caches the
+        tools until then, and 0 lists the tools on every call.
+      session_pool_config: If set, the tools are called over a pool of
+        sessions with these configs, instead of sharing a single session.
     """
     super().__init__(tool_filter=tool_filter)
 
@@ -127,7 +150,20 @@ class MCPToolset(BaseToolset):
         errlog=self._errlog,
     )
 
+    self._mcp_session_pool: Optional[MCPSessionPool] = None
+    if session_pool_config is not None:
+      self._mcp_session_pool = MCPSessionPool(
+          connection_params=self._connection_params,
+          config=session_pool_config,
+          errlog=self._errlog,
+      )
+
     self._session = None
+    self._tools_cache_ttl_secs = tools_cache_ttl_secs
+    self._tools_caches: Dict[Optional[str], _CachedTools] = {}
+    """All tools of the server, before filtering, by the affinity key of the
+    session they were listed on. Without user affinity, the key is None."""
+    self._tools_lock = asyncio.Lock()
 
   @retry_on_closed_resource("_reinitialize_session")
   async def get_tools(
@@ -143,27 +179,89 @@ class MCPToolset(BaseToolset):
     Returns:
         List[BaseTool]: A list of tools available under the specified context.
     """
-    # Get session from session manager
-    if not self._session:
-      self._session = await self._mcp_session_manager.create_session()
-
-    # Fetch available tools from the MCP server
-    tools_response: ListToolsResult = await self._session.list_tools()
+    # With user affinity, each user may be served different tools.
+    affinity_key = None
+    if self._mcp_session_pool is not None and readonly_context:
+      affinity_key = self._mcp_session_pool.get_affinity_key(
+          readonly_context._invocation_context.user_id
+      )
+    if (cached_tools := self._get_cached_tools(affinity_key)) is None:
+      async with self._tools_lock:
+        # Another call may have listed the tools while this one waited.
+        if (cached_tools := self._get_cached_tools(affinity_key)) is None:
+          cached_tools = await self._list_tools(affinity_key)
 
     # Apply filtering based on context and tool_filter
-    tools = []
-    for tool in tools_response.tools:
-      mcp_tool = MCPTool(
-          mcp_tool=tool,
-          mcp_session_manager=self._mcp_session_manager,
-      )
+    return [
+        tool
+        for tool in cached_tools.tools
+        if self._is_tool_selected(tool, readonly_context)
+    ]
 
-      if self._is_tool_selected(mcp_tool, readonly_context):
-        tools.append(mcp_tool)
-    return tools
+  def _get_cached_tools(
+      self, affinity_key: Optional[str]
+  ) -> Optional[_CachedTools]:
+    cached_tools = self._tools_caches.get(affinity_key)
+    if cached_tools is None or not self._is_valid(cached_tools):
+      return None
+    return cached_tools
+
+  def _is_valid(self, cached_tools: _CachedTools) -> bool:
+    if cached_tools.tools_version != self._get_tools_version():
+      return False
+    return (
+        self._tools_cache_ttl_secs is None
+        or time.monotonic() - cached_tools.cached_at
+        < self._tools_cache_ttl_secs
+    )
+
+  def _get_tools_version(self) -> int:
+    if self._mcp_session_pool is not None:
+      return self._mcp_session_pool.tools_version
+    return self._mcp_session_manager.tools_version
+
+  async def _list_tools(self, affinity_key: Optional[str]) -> _CachedTools:
+    """Lists the tools of the server into the cache."""
+    if self._mcp_session_pool is not None:
+      async with self._mcp_session_pool.session(affinity_key) as session:
+        tools_version = self._get_tools_version()
+        tools_response: ListToolsResult = await session.list_tools()
+    else:
+      # Get session from session manager
+      self._session = await self._mcp_session_manager.create_session()
+      # The version is read before listing, so that a change notification
+      # received while listing invalidates the listed tools.
+      tools_version = self._get_tools_version()
+
+      # Fetch available tools from the MCP server
+      tools_response: ListToolsResult = await self._session.list_tools()
+
+    cached_tools = _CachedTools(
+        tools=[
+            MCPTool(
+                mcp_tool=tool,
+                mcp_session_manager=self._mcp_session_manager,
+                mcp_session_pool=self._mcp_session_pool,
+            )
+            for tool in tools_response.tools
+        ],
+        tools_version=tools_version,
+    )
+    # Drops the tools of other users that are out of date.
+    self._tools_caches = {
+        key: other_cached_tools
+        for key, other_cached_tools in self._tools_caches.items()
+        if self._is_valid(other_cached_tools)
+    }
+    self._tools_caches[affinity_key] = cached_tools
+    return cached_tools
 
   async def _reinitialize_session(self):
     """Reinitializes the session when connection is lost."""
+    if self._mcp_session_pool is not None:
+      # The pool has already discarded the closed session, and opens a new one
+      # on retry.
+      return
     # Close the old session and clear cache
     await self._mcp_session_manager.close()
     self._session = await self._mcp_session_manager.create_session()
@@ -179,10 +277,11 @@ class MCPToolset(BaseToolset):
     """
     try:
       await self._mcp_session_manager.close()
+      if self._mcp_session_pool is not None:
+        await self._mcp_session_pool.close()
     except Exception as e:
       # Log the error but don't re-raise to avoid blocking shutdown
       print(f"Warning: Error during MCPToolset cleanup: {e}", file=self._errlog)
     finally:
       # Clear cached tools
-      self._tools_cache = None
-      self._tools_loaded = False
+      self._tools_caches.clear()
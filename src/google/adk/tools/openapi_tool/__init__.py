@@ -12,10 +12,14 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from .openapi_spec_parser import HttpClient
+from .openapi_spec_parser import HttpClientConfig
 from .openapi_spec_parser import OpenAPIToolset
 from .openapi_spec_parser import RestApiTool
 
 __all__ = [
+    'HttpClient',
+    'HttpClientConfig',
     'OpenAPIToolset',
     'RestApiTool',
 ]
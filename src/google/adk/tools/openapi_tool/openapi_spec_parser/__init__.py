@@ -12,6 +12,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from .http_client import HttpClient
+from .http_client import HttpClientConfig
 from .openapi_spec_parser import OpenApiSpecParser
 from .openapi_spec_parser import OperationEndpoint
 from .openapi_spec_parser import ParsedOperation
@@ -23,6 +25,8 @@ from .rest_api_tool import snake_to_lower_camel
 from .tool_auth_handler import ToolAuthHandler
 
 __all__ = [
+    'HttpClient',
+    'HttpClientConfig',
     'OpenApiSpecParser',
     'OperationEndpoint',
     'ParsedOperation',
@@ -0,0 +1,237 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import asyncio
+import email.utils
+import logging
+import random
+import time
+from typing import Any
+from typing import List
+from typing import Optional
+import weakref
+
+import httpx
+from pydantic import BaseModel
+from pydantic import Field
+
+logger = logging.getLogger("google_adk." + __name__)
+
+_IDEMPOTENT_METHODS = frozenset(
+    ["get", "head", "options", "put", "delete", "trace"]
+)
+
+_NOT_SENT_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
+"""Errors raised before the request was sent, so that it's safe to retry."""
+
+
+class HttpClientConfig(BaseModel):
+  """Configs for the HTTP client of REST API tools.
+
+  Attributes:
+      max_connections: The maximum number of open connections. None means no
+        limit.
+      max_keepalive_connections: The maximum number of idle connections kept
+        open for reuse. None means no limit.
+      keepalive_expiry_secs: How long idle connections are kept open, in
+        seconds.
+      http2: Whether to use HTTP/2 with the servers that support it. Requires
+        the `h2` package, e.g. from `pip install httpx[http2]`.
+      timeout_secs: The timeout of reading a response, writing a request and
+        waiting for a connection from the pool, in seconds. None waits forever.
+      connect_timeout_secs: The timeout of connecting to a server, in seconds.
+        None waits forever.
+      max_retries: How many times a failed request is retried. Requests that
+        could not be sent are always retried. Requests with idempotent methods
+        are also retried on other transport errors, and on
+        `retry_status_codes`.
+      retry_backoff_secs: The base of the exponential backoff between retries.
+        Each wait is random between 0 and the backoff, to spread the retries of
+        concurrent calls.
+      max_retry_backoff_secs: The maximum wait between retries, including waits
+        requested by `Retry-After` headers.
+      retry_status_codes: The response status codes to retry on.
+  """
+
+  max_connections: Optional[int] = 100
+  max_keepalive_connections: Optional[int] = 20
+  keepalive_expiry_secs: Optional[float] = 5.0
+  http2: bool = False
+  timeout_secs: Optional[float] = 60.0
+  connect_timeout_secs: Optional[float] = 10.0
+  max_retries: int = Field(default=2, ge=0)
+  retry_backoff_secs: float = 0.5
+  max_retry_backoff_secs: float = 10.0
+  retry_status_codes: List[int] = [429, 502, 503, 504]
+
+
+class HttpClient:
+  """An async HTTP client with connection pooling and retries.
+
+  Connections are kept alive and reused across calls to the same servers,
+  instead of being opened for every call. The client can be shared by any
+  number of tools.
+  """
+
+  def __init__(self, config: Optional[HttpClientConfig] = None):
+    self._config = config or HttpClientConfig()
+    self._clients: weakref.WeakKeyDictionary[
+        asyncio.AbstractEventLoop, httpx.AsyncClient
+    ] = weakref.WeakKeyDictionary()
+    """The client of each event loop.
+
+    The connections of a client can only be used by the event loop that opened
+    them, so each event loop gets its own client.
+    """
+
+  @property
+  def config(self) -> HttpClientConfig:
+    return self._config
+
+  def _get_client(self) -> httpx.AsyncClient:
+    loop = asyncio.get_running_loop()
+    if (client := self._clients.get(loop)) is None:
+      self._drop_clients_of_closed_loops()
+      client = httpx.AsyncClient(
+          limits=httpx.Limits(
+              max_connections=self._config.max_connections,
+              max_keepalive_connections=self._config.max_keepalive_connections,
+              keepalive_expiry=self._config.keepalive_expiry_secs,
+          ),
+          timeout=httpx.Timeout(
+              self._config.timeout_secs,
+              connect=self._config.connect_timeout_secs,
+          ),
+          http2=self._config.http2,
+          follow_redirects=True,
+      )
+      self._clients[loop] = client
+    return client
+
+  def _drop_clients_of_closed_loops(self) -> None:
+    """Drops the clients of closed event loops, e.g. of past `asyncio.run`s.
+
+    Their connections can't be closed from another event loop, and keep their
+    loop alive, so the clients are dropped for their sockets to be closed when
+    they are garbage collected.
+    """
+    for loop in [loop for loop in self._clients if loop.is_closed()]:
+      del self._clients[loop]
+
+  async def request(
+      self, method: str, url: str, **kwargs: Any
+  ) -> httpx.Response:
+    """Sends a request, and retries it if it fails.
+
+    Args:
+        method: The HTTP method.
+        url: The URL of the request.
+        **kwargs: The other arguments of `httpx.AsyncClient.request`.
+
+    Returns:
+        The response. Error responses are returned after the last retry rather
+        than raised.
+
+    Raises:
+        httpx.TransportError: If the request still failed after the last retry.
+    """
+    client = self._get_client()
+    is_idempotent = method.lower() in _IDEMPOTENT_METHODS
+    attempt = 0
+    while True:
+      try:
+        response = await client.request(method, url, **kwargs)
+      except httpx.TransportError as e:
+        if attempt >= self._config.max_retries or not (
+            is_idempotent or isinstance(e, _NOT_SENT_ERRORS)
+        ):
+          raise
+        delay = self._get_backoff_secs(attempt)
+        logger.warning(
+            "Retrying %s %s in %.2fs after error: %r", method, url, delay, e
+        )
+      else:
+        if (
+            attempt >= self._config.max_retries
+            or not is_idempotent
+            or response.status_code not in self._config.retry_status_codes
+        ):
+          return response
+        delay = max(
+            self._get_backoff_secs(attempt),
+            min(
+                _get_retry_after_secs(response) or 0.0,
+                self._config.max_retry_backoff_secs,
+            ),
+        )
+        logger.warning(
+            "Retrying %s %s in %.2fs after status %d",
+            method,
+            url,
+            delay,
+            response.status_code,
+        )
+        await response.aclose()
+      await asyncio.sleep(delay)
+      attempt += 1
+
+  def _get_backoff_secs(self, attempt: int) -> float:
+    """Returns an exponential backoff with full jitter."""
+    return random.uniform(
+        0,
+        min(
+            self._config.retry_backoff_secs * 2**attempt,
+            self._config.max_retry_backoff_secs,
+        ),
+    )
+
+  async def close(self) -> None:
+    """Closes the connections of the client in the running event loop."""
+    self._drop_clients_of_closed_loops()
+    client = self._clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+      await client.aclose()
+
+
+def _get_retry_after_secs(response: httpx.Response) -> Optional[float]:
+  """Returns the wait requested by the `Retry-After` header, if any."""
+  retry_after = response.headers.get("Retry-After")
+  if not retry_after:
+    return None
+  try:
+    return max(float(retry_after), 0.0)
+  except ValueError:
+    pass
+  try:
+    retry_at = email.utils.parsedate_to_datetime(retry_after)
+  except (TypeError, ValueError):
+    return None
+  return max(retry_at.timestamp() - time.time(), 0.0)
+
+
+_default_http_client: Optional[HttpClient] = None
+
+
+def get_default_http_client() -> HttpClient:
+  """Returns the HTTP client shared by the tools without their own client.
+
+  The connections to each server are pooled separately, so the tools of all
+  base URLs can share the client.
+  """
+  global _default_http_client
+  if _default_http_client is None:
+    _default_http_client = HttpClient()
+  return _default_http_client
@@ -30,6 +30,8 @@ from ....auth.auth_credential import AuthCredential
 from ....auth.auth_schemes import AuthScheme
 from ...base_toolset import BaseToolset
 from ...base_toolset import ToolPredicate
+from .http_client import HttpClient
+from .http_client import HttpClientConfig
 from .openapi_spec_parser import OpenApiSpecParser
 from .rest_api_tool import RestApiTool
 
@@ -67,6 +69,7 @@ class OpenAPIToolset(BaseToolset):
       auth_scheme: Optional[AuthScheme] = None,
       auth_credential: Optional[AuthCredential] = None,
       tool_filter: Optional[Union[ToolPredicate, List[str]]] = None,
+      http_client_config: Optional[HttpClientConfig] = None,
   ):
     """Initializes the OpenAPIToolset.
 
@@ -102,6 +105,9 @@ class OpenAPIToolset(BaseToolset):
         `google.adk.tools.openapi_tool.auth.auth_helpers`
       tool_filter: The filter used to filter the tools in the toolset. It can be
         either a tool predicate or a list of tool names of the tools to expose.
+      http_client_config: If set, the tools share an HTTP client with these
+        configs, which is closed with the toolset. Otherwise, the tools use the
+        client shared by all tools.
     """
     super().__init__(tool_filter=tool_filter)
     if not spec_dict:
@@ -109,6 +115,11 @@ class OpenAPIToolset(BaseToolset):
     self._tools: Final[List[RestApiTool]] = list(self._parse(spec_dict))
     if auth_scheme or auth_credential:
       self._configure_auth_all(auth_scheme, auth_credential)
+    self._http_client: Optional[HttpClient] = None
+    if http_client_config is not None:
+      self._http_client = HttpClient(http_client_config)
+      for tool in self._tools:
+        tool.configure_http_client(self._http_client)
 
   def _configure_auth_all(
       self, auth_scheme: AuthScheme, auth_credential: AuthCredential
@@ -161,4 +172,5 @@ class OpenAPIToolset(BaseToolset):
 
   @override
   async def close(self):
-    pass
+    if self._http_client is not None:
+      await self._http_client.close()
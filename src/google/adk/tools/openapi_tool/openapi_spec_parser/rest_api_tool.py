@@ -37,6 +37,8 @@ from ..auth.auth_helpers import credential_to_param
 from ..auth.auth_helpers import dict_to_auth_scheme
 from ..auth.credential_exchangers.auto_auth_credential_exchanger import AutoAuthCredentialExchanger
 from ..common.common import ApiParameter
+from .http_client import get_default_http_client
+from .http_client import HttpClient
 from .openapi_spec_parser import OperationEndpoint
 from .openapi_spec_parser import ParsedOperation
 from .operation_parser import OperationParser
@@ -64,6 +66,21 @@ def snake_to_lower_camel(snake_case_string: str):
 AuthPreparationState = Literal["pending", "done"]
 
 
+def _to_httpx_request_params(request_params: Dict[str, Any]) -> Dict[str, Any]:
+  """Converts the arguments of requests.request() to those of httpx."""
+  httpx_params = dict(request_params)
+  # httpx deprecates per-request cookies, so they are sent as a header.
+  if cookies := httpx_params.pop("cookies", None):
+    httpx_params["headers"] = {
+        **httpx_params.get("headers", {}),
+        "Cookie": "; ".join(f"{k}={v}" for k, v in cookies.items()),
+    }
+  # httpx only encodes dicts as forms, and takes raw bodies as content.
+  if "data" in httpx_params and not isinstance(httpx_params["data"], dict):
+    httpx_params["content"] = httpx_params.pop("data")
+  return httpx_params
+
+
 class RestApiTool(BaseTool):
   """A generic tool that interacts with a REST API.
 
@@ -88,6 +105,7 @@ class RestApiTool(BaseTool):
       auth_scheme: Optional[Union[AuthScheme, str]] = None,
       auth_credential: Optional[Union[AuthCredential, str]] = None,
       should_parse_operation=True,
+      http_client: Optional[HttpClient] = None,
   ):
     """Initializes the RestApiTool with the given parameters.
 
@@ -115,6 +133,8 @@ class RestApiTool(BaseTool):
           (https://github.com/OAI/OpenAPI-Specification/blob/main/versions/3.1.0.md#security-scheme-object)
         auth_credential: The authentication credential of the tool.
         should_parse_operation: Whether to parse the operation.
+        http_client: The HTTP client to call the API with. Defaults to a client
+          shared by all tools.
     """
     # Gemini restrict the length of function name to be less than 64 characters
     self.name = name[:60]
@@ -133,6 +153,7 @@ class RestApiTool(BaseTool):
 
     self.configure_auth_credential(auth_credential)
     self.configure_auth_scheme(auth_scheme)
+    self.configure_http_client(http_client)
 
     # Private properties
     self.credential_exchanger = AutoAuthCredentialExchanger()
@@ -218,6 +239,14 @@ class RestApiTool(BaseTool):
       auth_credential = AuthCredential.model_validate_json(auth_credential)
     self.auth_credential = auth_credential
 
+  def configure_http_client(self, http_client: Optional[HttpClient] = None):
+    """Configures the HTTP client for the API call.
+
+    Args:
+        http_client: The HTTP client. None uses the client shared by all tools.
+    """
+    self._http_client = http_client
+
   def _prepare_auth_request_params(
       self,
       auth_scheme: AuthScheme,
@@ -345,13 +374,40 @@ class RestApiTool(BaseTool):
   async def run_async(
       self, *, args: dict[str, Any], tool_context: Optional[ToolContext]
   ) -> Dict[str, Any]:
-    return self.call(args=args, tool_context=tool_context)
+    """Executes the REST API call, without blocking the event loop.
+
+    Args:
+        args: Keyword arguments representing the operation parameters.
+        tool_context: The tool context (not used here, but required by the
+          interface).
+
+    Returns:
+        The API response as a dictionary.
+    """
+    request_params = self._prepare_call(args, tool_context)
+    if request_params is None:
+      return self._get_auth_pending_response()
+
+    http_client = self._http_client or get_default_http_client()
+    response = await http_client.request(
+        **_to_httpx_request_params(request_params)
+    )
+
+    # Parse API response
+    if response.is_error:
+      return self._get_error_response(response.content.decode("utf-8"))
+    try:
+      return response.json()  # Try to decode JSON
+    except ValueError:
+      return {"text": response.text}  # Return text if not JSON
 
   def call(
       self, *, args: dict[str, Any], tool_context: Optional[ToolContext]
   ) -> Dict[str, Any]:
     """Executes the REST API call.
 
+    This blocks until the API responds. Prefer `run_async` in async code.
+
     Args:
         args: Keyword arguments representing the operation parameters.
         tool_context: The tool context (not used here, but required by the
@@ -360,6 +416,29 @@ class RestApiTool(BaseTool):
     Returns:
         The API response as a dictionary.
     """
+    request_params = self._prepare_call(args, tool_context)
+    if request_params is None:
+      return self._get_auth_pending_response()
+
+    response = requests.request(**request_params)
+
+    # Parse API response
+    try:
+      response.raise_for_status()  # Raise HTTPError for bad responses
+      return response.json()  # Try to decode JSON
+    except requests.exceptions.HTTPError:
+      return self._get_error_response(response.content.decode("utf-8"))
+    except ValueError:
+      return {"text": response.text}  # Return text if not JSON
+
+  def _prepare_call(
+      self, args: dict[str, Any], tool_context: Optional[ToolContext]
+  ) -> Optional[Dict[str, Any]]:
+    """Prepares the request parameters of the API call with auth.
+
+    Returns:
+        The request parameters, or None if the auth is pending.
+    """
     # Prepare auth credentials for the API call
     tool_auth_handler = ToolAuthHandler.from_tool_context(
         tool_context, self.auth_scheme, self.auth_credential
@@ -372,10 +451,7 @@ class RestApiTool(BaseTool):
     )
 
     if auth_state == "pending":
-      return {
-          "pending": True,
-          "message": "Needs your authorization to access your data.",
-      }
+      return None
 
     # Attach parameters from auth into main parameters list
     api_params, api_args = self._operation_parser.get_parameters().copy(), args
@@ -388,26 +464,24 @@ class RestApiTool(BaseTool):
         api_params = [auth_param] + api_params
         api_args.update(auth_args)
 
-    # Got all parameters. Call the API.
-    request_params = self._prepare_request_params(api_params, api_args)
-    response = requests.request(**request_params)
+    # Got all parameters.
+    return self._prepare_request_params(api_params, api_args)
 
-    # Parse API response
-    try:
-      response.raise_for_status()  # Raise HTTPError for bad responses
-      return response.json()  # Try to decode JSON
-    except requests.exceptions.HTTPError:
-      error_details = response.content.decode("utf-8")
-      return {
-          "error": (
-              f"Tool {self.name} execution failed. Analyze this execution error"
-              " and your inputs. Retry with adjustments if applicable. But"
-              " make sure don't retry more than 3 times. Execution Error:"
-              f" {error_details}"
-          )
-      }
-    except ValueError:
-      return {"text": response.text}  # Return text if not JSON
+  def _get_auth_pending_response(self) -> Dict[str, Any]:
+    return {
+        "pending": True,
+        "message": "Needs your authorization to access your data.",
+    }
+
+  def _get_error_response(self, error_details: str) -> Dict[str, Any]:
+    return {
+        "error": (
+            f"Tool {self.name} execution failed. Analyze this execution error"
+            " and your inputs. Retry with adjustments if applicable. But"
+            " make sure don't retry more than 3 times. Execution Error:"
+            f" {error_details}"
+        )
+    }
 
   def __str__(self):
     return (
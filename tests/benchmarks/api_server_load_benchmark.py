@@ -0,0 +1,146 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Load-tests `adk api_server` with 1 worker vs one worker per core.
+
+Serves a local agent that does CPU-bound work without calling a model, and
+sends concurrent /run requests, each to its own in-memory session.
+
+Usage:
+  python -m tests.benchmarks.api_server_load_benchmark
+"""
+
+import asyncio
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+import httpx
+
+_PORT = 8765
+_NUM_SESSIONS = 32
+_REQUESTS_PER_SESSION = 4
+_AGENT_CODE = """
+import hashlib
+
+from google.adk.agents import BaseAgent
+from google.adk.events import Event
+from google.genai import types
+
+
+class CpuBoundAgent(BaseAgent):
+
+  async def _run_async_impl(self, ctx):
+    digest = b""
+    for _ in range(100000):
+      digest = hashlib.sha256(digest).digest()
+    yield Event(
+        author=self.name,
+        invocation_id=ctx.invocation_id,
+        content=types.ModelContent(digest.hex()),
+    )
+
+
+root_agent = CpuBoundAgent(name="cpu_bound_agent")
+"""
+
+
+def _create_agents_dir() -> str:
+  agents_dir = tempfile.mkdtemp()
+  agent_dir = os.path.join(agents_dir, "cpu_bound_agent")
+  os.mkdir(agent_dir)
+  with open(os.path.join(agent_dir, "__init__.py"), "w") as f:
+    f.write("from . import agent\n")
+  with open(os.path.join(agent_dir, "agent.py"), "w") as f:
+    f.write(_AGENT_CODE)
+  return agents_dir
+
+
+async def _wait_until_healthy(client: httpx.AsyncClient) -> None:
+  deadline = time.monotonic() + 120
+  while time.monotonic() < deadline:
+    try:
+      if (await client.get("/health")).status_code == 200:
+        return
+    except httpx.TransportError:
+      pass
+    await asyncio.sleep(0.2)
+  raise RuntimeError("The server did not start.")
+
+
+async def _run_session(client: httpx.AsyncClient) -> None:
+  response = await client.post("/apps/cpu_bound_agent/users/user/sessions")
+  response.raise_for_status()
+  session_id = response.json()["id"]
+  for _ in range(_REQUESTS_PER_SESSION):
+    response = await client.post(
+        "/run",
+        json={
+            "app_name": "cpu_bound_agent",
+            "user_id": "user",
+            "session_id": session_id,
+            "new_message": {"role": "user", "parts": [{"text": "hi"}]},
+        },
+    )
+    response.raise_for_status()
+
+
+async def _load_test(agents_dir: str, num_workers: int) -> float:
+  """Returns the throughput in requests per second."""
+  server = subprocess.Popen(
+      [
+          sys.executable,
+          "-m",
+          "google.adk.cli",
+          "api_server",
+          "--no-reload",
+          f"--port={_PORT}",
+          f"--workers={num_workers}",
+          "--log_level=WARNING",
+          agents_dir,
+      ],
+      stdout=subprocess.DEVNULL,
+      stderr=subprocess.DEVNULL,
+  )
+  try:
+    async with httpx.AsyncClient(
+        base_url=f"http://127.0.0.1:{_PORT}", timeout=None
+    ) as client:
+      await _wait_until_healthy(client)
+      # Warms up each worker's runner.
+      await asyncio.gather(*[_run_session(client) for _ in range(num_workers)])
+      start = time.perf_counter()
+      await asyncio.gather(
+          *[_run_session(client) for _ in range(_NUM_SESSIONS)]
+      )
+      elapsed = time.perf_counter() - start
+  finally:
+    server.terminate()
+    server.wait()
+  return _NUM_SESSIONS * _REQUESTS_PER_SESSION / elapsed
+
+
+async def main():
+  agents_dir = _create_agents_dir()
+  num_cores = os.cpu_count() or 1
+  print(f'{"workers":>8} {"requests/s":>11}')
+  for num_workers in sorted({1, num_cores}):
+    throughput = await _load_test(agents_dir, num_workers)
+    print(f"{num_workers:>8} {throughput:>11.1f}")
+
+
+if __name__ == "__main__":
+  asyncio.run(main())
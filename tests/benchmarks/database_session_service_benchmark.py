@@ -0,0 +1,111 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Benchmarks the sync and async database session services under concurrency.
+
+Runs many simultaneous sessions against a SQLite file, and reports the total
+time and the longest time the event loop was blocked.
+
+Usage:
+  python -m tests.benchmarks.database_session_service_benchmark
+"""
+
+import asyncio
+import os
+import tempfile
+import time
+
+from google.adk.events import Event
+from google.adk.events import EventActions
+from google.adk.sessions import AsyncDatabaseSessionService
+from google.adk.sessions import DatabaseSessionService
+from google.adk.sessions.base_session_service import BaseSessionService
+from google.genai import types
+
+_NUM_SESSIONS = (10, 50, 200)
+_NUM_EVENTS = 5
+
+
+async def _run_session(session_service: BaseSessionService, i: int) -> None:
+  session = await session_service.create_session(
+      app_name='benchmark_app', user_id=f'user_{i}'
+  )
+  for j in range(_NUM_EVENTS):
+    await session_service.append_event(
+        session,
+        Event(
+            author='user',
+            content=types.Content(
+                role='user', parts=[types.Part(text=f'message {j}')]
+            ),
+            actions=EventActions(state_delta={'turn': j}),
+        ),
+    )
+  await session_service.get_session(
+      app_name='benchmark_app', user_id=session.user_id, session_id=session.id
+  )
+
+
+async def _measure(
+    session_service: BaseSessionService, num_sessions: int
+) -> tuple[float, float]:
+  """Returns the total time and the longest event loop stall in ms."""
+  max_stall = 0.0
+  done = False
+
+  async def monitor_loop():
+    nonlocal max_stall
+    while not done:
+      start = time.perf_counter()
+      await asyncio.sleep(0.001)
+      max_stall = max(max_stall, time.perf_counter() - start - 0.001)
+
+  monitor = asyncio.create_task(monitor_loop())
+  start = time.perf_counter()
+  await asyncio.gather(
+      *(_run_session(session_service, i) for i in range(num_sessions))
+  )
+  elapsed = time.perf_counter() - start
+  done = True
+  await monitor
+  return elapsed * 1000, max_stall * 1000
+
+
+async def main():
+  print(
+      f'{"sessions":>9} {"service":>7} {"total (ms)":>12}'
+      f' {"max loop stall (ms)":>21}'
+  )
+  for num_sessions in _NUM_SESSIONS:
+    with tempfile.TemporaryDirectory() as tmp_dir:
+      db_path = os.path.join(tmp_dir, 'sessions.db')
+      services = [
+          ('sync', DatabaseSessionService(f'sqlite:///{db_path}')),
+          (
+              'async',
+              AsyncDatabaseSessionService(
+                  f'sqlite+aiosqlite:///{db_path}', pool_size=10
+              ),
+          ),
+      ]
+      for name, session_service in services:
+        total_ms, stall_ms = await _measure(session_service, num_sessions)
+        print(
+            f'{num_sessions:>9} {name:>7} {total_ms:>12.1f} {stall_ms:>21.1f}'
+        )
+      await services[1][1].close()
+
+
+if __name__ == '__main__':
+  asyncio.run(main())
@@ -0,0 +1,120 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Benchmarks search_memory of InMemoryMemoryService vs stored sessions.
+
+Compares the inverted index with a scan that tokenizes every stored event on
+each query, as the service did before the index.
+
+Usage:
+  python -m tests.benchmarks.in_memory_memory_service_benchmark
+"""
+
+import asyncio
+import random
+import re
+import time
+
+from google.adk.events import Event
+from google.adk.memory import InMemoryMemoryService
+from google.adk.sessions import Session
+from google.genai import types
+
+_APP_NAME = 'benchmark_app'
+_USER_ID = 'benchmark_user'
+_NUM_SESSIONS = (1000, 10000, 20000)
+_EVENTS_PER_SESSION = 10
+_NUM_QUERIES = 20
+# Words are letters only, since digits are not part of indexed words.
+_VOCABULARY = [
+    ''.join(chr(ord('a') + (i // 26**k) % 26) for k in range(3))
+    for i in range(5000)
+]
+
+
+def _session(rng: random.Random, session_id: str) -> Session:
+  return Session(
+      app_name=_APP_NAME,
+      user_id=_USER_ID,
+      id=session_id,
+      events=[
+          Event(
+              author='user',
+              content=types.Content(
+                  role='user',
+                  parts=[
+                      types.Part(text=' '.join(rng.choices(_VOCABULARY, k=20)))
+                  ],
+              ),
+          )
+          for _ in range(_EVENTS_PER_SESSION)
+      ],
+  )
+
+
+def _scan(sessions: list[Session], query: str) -> int:
+  """Returns the number of events matching the query, scanning all events."""
+  words_in_query = set(query.lower().split())
+  num_matches = 0
+  for session in sessions:
+    for event in session.events:
+      words_in_event = set(
+          word.lower()
+          for word in re.findall(
+              r'[A-Za-z]+',
+              ' '.join(
+                  [part.text for part in event.content.parts if part.text]
+              ),
+          )
+      )
+      if any(query_word in words_in_event for query_word in words_in_query):
+        num_matches += 1
+  return num_matches
+
+
+async def main():
+  rng = random.Random(0)
+  queries = [
+      ' '.join(rng.choices(_VOCABULARY, k=3)) for _ in range(_NUM_QUERIES)
+  ]
+  print(
+      f'{"sessions":>8} {"add (s)":>8} {"index search (ms)":>18}'
+      f' {"scan search (ms)":>17}'
+  )
+  for num_sessions in _NUM_SESSIONS:
+    sessions = [_session(rng, f'session_{i}') for i in range(num_sessions)]
+    memory_service = InMemoryMemoryService()
+
+    start = time.perf_counter()
+    for session in sessions:
+      await memory_service.add_session_to_memory(session)
+    add_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for query in queries:
+      await memory_service.search_memory(
+          app_name=_APP_NAME, user_id=_USER_ID, query=query
+      )
+    index_ms = (time.perf_counter() - start) * 1000 / _NUM_QUERIES
+
+    start = time.perf_counter()
+    for query in queries[:2]:
+      _scan(sessions, query)
+    scan_ms = (time.perf_counter() - start) * 1000 / 2
+
+    print(f'{num_sessions:>8} {add_s:>8.2f} {index_ms:>18.3f} {scan_ms:>17.3f}')
+
+
+if __name__ == '__main__':
+  asyncio.run(main())
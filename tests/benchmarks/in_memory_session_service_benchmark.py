@@ -0,0 +1,72 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Benchmarks get_session cost of InMemorySessionService vs history length.
+
+Usage:
+  python -m tests.benchmarks.in_memory_session_service_benchmark
+"""
+
+import asyncio
+import time
+
+from google.adk.events import Event
+from google.adk.events import EventActions
+from google.adk.sessions import InMemorySessionService
+from google.genai import types
+
+_APP_NAME = 'benchmark_app'
+_USER_ID = 'benchmark_user'
+_HISTORY_SIZES = (10, 100, 1000, 5000)
+_NUM_CALLS = 20
+
+
+async def _time_get_session(share_events: bool, num_events: int) -> float:
+  """Returns the average get_session latency in milliseconds."""
+  session_service = InMemorySessionService(share_events=share_events)
+  session = await session_service.create_session(
+      app_name=_APP_NAME, user_id=_USER_ID
+  )
+  for i in range(num_events):
+    await session_service.append_event(
+        session,
+        Event(
+            invocation_id=f'invocation_{i}',
+            author='user' if i % 2 == 0 else 'agent',
+            content=types.Content(
+                role='user' if i % 2 == 0 else 'model',
+                parts=[types.Part(text=f'message {i} ' * 20)],
+            ),
+            actions=EventActions(state_delta={'turn': i}),
+        ),
+    )
+
+  start = time.perf_counter()
+  for _ in range(_NUM_CALLS):
+    await session_service.get_session(
+        app_name=_APP_NAME, user_id=_USER_ID, session_id=session.id
+    )
+  return (time.perf_counter() - start) * 1000 / _NUM_CALLS
+
+
+async def main():
+  print(f'{"events":>8} {"deepcopy (ms)":>15} {"shared (ms)":>13}')
+  for num_events in _HISTORY_SIZES:
+    deepcopy_ms = await _time_get_session(False, num_events)
+    shared_ms = await _time_get_session(True, num_events)
+    print(f'{num_events:>8} {deepcopy_ms:>15.3f} {shared_ms:>13.3f}')
+
+
+if __name__ == '__main__':
+  asyncio.run(main())
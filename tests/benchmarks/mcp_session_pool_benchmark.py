@@ -0,0 +1,137 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Benchmarks concurrent MCP tool calls, with and without a session pool.
+
+Calls the tools of a local stdio MCP server from concurrent callers. The
+server has a tool that blocks its process, like many local servers do, and a
+tool that waits without blocking.
+
+Usage:
+  python -m tests.benchmarks.mcp_session_pool_benchmark
+"""
+
+import asyncio
+import os
+import sys
+import tempfile
+import textwrap
+import time
+from typing import Optional
+from typing import TextIO
+from unittest import mock
+
+from google.adk.tools.mcp_tool.mcp_session_manager import StdioConnectionParams
+from google.adk.tools.mcp_tool.mcp_session_pool import MCPSessionPoolConfig
+from google.adk.tools.mcp_tool.mcp_toolset import MCPToolset
+from mcp import StdioServerParameters
+
+_SERVER_CODE = textwrap.dedent('''
+    import asyncio
+    import time
+
+    from mcp.server.fastmcp import FastMCP
+
+    server = FastMCP("benchmark_server")
+
+
+    @server.tool()
+    def blocking_tool() -> str:
+      """Does 10ms of blocking work."""
+      time.sleep(0.01)
+      return "done"
+
+
+    @server.tool()
+    async def non_blocking_tool() -> str:
+      """Waits 10ms."""
+      await asyncio.sleep(0.01)
+      return "done"
+
+
+    server.run()
+''')
+_NUM_CALLERS = 16
+_NUM_CALLS_PER_CALLER = 10
+_CONFIGS = {
+    'single session': None,
+    'pool of 1': MCPSessionPoolConfig(max_size=1, max_in_flight_per_session=16),
+    'pool of 4': MCPSessionPoolConfig(max_size=4, max_in_flight_per_session=4),
+    'pool of 8': MCPSessionPoolConfig(max_size=8, max_in_flight_per_session=2),
+}
+
+
+async def _measure(
+    server_path: str,
+    errlog: TextIO,
+    tool_name: str,
+    session_pool_config: Optional[MCPSessionPoolConfig],
+) -> tuple[float, float]:
+  """Returns the calls per second, and the average latency in milliseconds."""
+  toolset = MCPToolset(
+      connection_params=StdioConnectionParams(
+          server_params=StdioServerParameters(
+              command=sys.executable, args=[server_path]
+          ),
+          timeout=30,
+      ),
+      tool_filter=[tool_name],
+      errlog=errlog,
+      session_pool_config=session_pool_config,
+  )
+  try:
+    [tool] = await toolset.get_tools()
+    tool_context = mock.MagicMock()
+    latencies = []
+
+    async def caller():
+      for _ in range(_NUM_CALLS_PER_CALLER):
+        start = time.perf_counter()
+        await tool.run_async(args={}, tool_context=tool_context)
+        latencies.append(time.perf_counter() - start)
+
+    # Opens the sessions before measuring.
+    await asyncio.gather(*[caller() for _ in range(_NUM_CALLERS)])
+    latencies.clear()
+    start = time.perf_counter()
+    await asyncio.gather(*[caller() for _ in range(_NUM_CALLERS)])
+    elapsed = time.perf_counter() - start
+  finally:
+    await toolset.close()
+  return len(latencies) / elapsed, sum(latencies) / len(latencies) * 1000
+
+
+async def main():
+  with (
+      tempfile.TemporaryDirectory() as temp_dir,
+      open(os.devnull, 'w') as errlog,
+  ):
+    server_path = os.path.join(temp_dir, 'server.py')
+    with open(server_path, 'w') as f:
+      f.write(_SERVER_CODE)
+    print(f'{_NUM_CALLERS} concurrent callers')
+    print(f'{"tool":>18} {"sessions":>15} {"calls/s":>8} {"avg ms":>8}')
+    for tool_name in ('blocking_tool', 'non_blocking_tool'):
+      for name, session_pool_config in _CONFIGS.items():
+        calls_per_sec, average_latency = await _measure(
+            server_path, errlog, tool_name, session_pool_config
+        )
+        print(
+            f'{tool_name:>18} {name:>15} {calls_per_sec:>8.0f}'
+            f' {average_latency:>8.1f}'
+        )
+
+
+if __name__ == '__main__':
+  asyncio.run(main())
@@ -0,0 +1,102 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Benchmarks LLM calls with new vs shared model instances.
+
+Points the Gemini API at a local stub server and counts the TCP connections
+it accepts, to show that shared instances reuse their connections.
+
+Usage:
+  python -m tests.benchmarks.model_instance_cache_benchmark
+"""
+
+import asyncio
+from http.server import BaseHTTPRequestHandler
+from http.server import ThreadingHTTPServer
+import json
+import os
+import threading
+import time
+
+from google.adk.models import LLMRegistry
+from google.adk.models import LlmRequest
+from google.genai import types
+
+_MODEL = 'gemini-2.0-flash'
+_NUM_CALLS = 50
+_RESPONSE = json.dumps({
+    'candidates': [{
+        'content': {'role': 'model', 'parts': [{'text': 'hello'}]},
+        'finishReason': 'STOP',
+    }]
+}).encode()
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+  protocol_version = 'HTTP/1.1'
+  num_connections = 0
+
+  def setup(self):
+    super().setup()
+    _StubHandler.num_connections += 1
+
+  def do_POST(self):
+    self.rfile.read(int(self.headers['Content-Length']))
+    self.send_response(200)
+    self.send_header('Content-Type', 'application/json')
+    self.send_header('Content-Length', str(len(_RESPONSE)))
+    self.end_headers()
+    self.wfile.write(_RESPONSE)
+
+  def log_message(self, *args):
+    pass
+
+
+async def _call_llm(get_llm) -> tuple[float, int]:
+  """Returns the average latency in ms and the number of new connections."""
+  llm_request = LlmRequest(
+      model=_MODEL,
+      contents=[types.Content(role='user', parts=[types.Part(text='hi')])],
+      config=types.GenerateContentConfig(),
+  )
+  _StubHandler.num_connections = 0
+  start = time.perf_counter()
+  for _ in range(_NUM_CALLS):
+    async for _ in get_llm(_MODEL).generate_content_async(llm_request):
+      pass
+  elapsed_ms = (time.perf_counter() - start) * 1000 / _NUM_CALLS
+  return elapsed_ms, _StubHandler.num_connections
+
+
+async def main():
+  server = ThreadingHTTPServer(('127.0.0.1', 0), _StubHandler)
+  threading.Thread(target=server.serve_forever, daemon=True).start()
+  os.environ['GOOGLE_GEMINI_BASE_URL'] = (
+      f'http://127.0.0.1:{server.server_port}'
+  )
+  os.environ['GOOGLE_GENAI_USE_VERTEXAI'] = '0'
+  os.environ.setdefault('GOOGLE_API_KEY', 'fake_api_key')
+
+  print(f'{"mode":>8} {"latency (ms)":>14} {"connections":>13}')
+  for mode, get_llm in [
+      ('new', LLMRegistry.new_llm),
+      ('shared', LLMRegistry.get_llm),
+  ]:
+    latency_ms, num_connections = await _call_llm(get_llm)
+    print(f'{mode:>8} {latency_ms:>14.3f} {num_connections:>13}')
+  server.shutdown()
+
+
+if __name__ == '__main__':
+  asyncio.run(main())
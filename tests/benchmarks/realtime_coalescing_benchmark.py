@@ -0,0 +1,142 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Benchmarks sending 20ms audio frames to a live model, with coalescing.
+
+Sends the frames through `_send_to_model` to a fake connection. Throughput
+is measured with all frames queued up front, and latency with the frames
+sent in real time, as a client would send them.
+
+Usage:
+  python -m tests.benchmarks.realtime_coalescing_benchmark
+"""
+
+import asyncio
+import time
+from typing import Optional
+
+from google.adk.agents import Agent
+from google.adk.agents.invocation_context import InvocationContext
+from google.adk.agents.live_request_queue import LiveRequestQueue
+from google.adk.agents.run_config import RealtimeInputCoalescingConfig
+from google.adk.agents.run_config import RunConfig
+from google.adk.flows.llm_flows.single_flow import SingleFlow
+from google.adk.sessions import InMemorySessionService
+from google.genai import types
+
+_FRAME_BYTES = 640
+"""20ms of 16kHz 16-bit mono PCM."""
+_FRAME_INTERVAL_SECS = 0.02
+_NUM_THROUGHPUT_FRAMES = 20000
+_NUM_LATENCY_FRAMES = 100
+_CONFIGS = {
+    'none': None,
+    '100ms': RealtimeInputCoalescingConfig(max_bytes=3200, max_delay_secs=0.1),
+    '200ms': RealtimeInputCoalescingConfig(max_bytes=6400, max_delay_secs=0.2),
+}
+
+
+class _FakeConnection:
+  """Records when each frame is sent."""
+
+  def __init__(self):
+    self.num_sends = 0
+    self.frame_sent_at: list[float] = []
+
+  async def send_realtime(self, blob: types.Blob):
+    self.num_sends += 1
+    sent_at = time.perf_counter()
+    self.frame_sent_at.extend([sent_at] * (len(blob.data) // _FRAME_BYTES))
+    # Yields like a websocket send would.
+    await asyncio.sleep(0)
+
+  async def close(self):
+    pass
+
+
+async def _create_invocation_context(
+    coalescing_config: Optional[RealtimeInputCoalescingConfig],
+) -> InvocationContext:
+  session_service = InMemorySessionService()
+  session = await session_service.create_session(
+      app_name='benchmark_app', user_id='benchmark_user'
+  )
+  return InvocationContext(
+      invocation_id='invocation',
+      agent=Agent(name='benchmark_agent', model='gemini-2.0-flash'),
+      session=session,
+      session_service=session_service,
+      live_request_queue=LiveRequestQueue(),
+      run_config=RunConfig(realtime_input_coalescing=coalescing_config),
+  )
+
+
+def _frame() -> types.Blob:
+  return types.Blob(data=bytes(_FRAME_BYTES), mime_type='audio/pcm')
+
+
+async def _measure_throughput(
+    coalescing_config: Optional[RealtimeInputCoalescingConfig],
+) -> tuple[float, int]:
+  """Returns the frames per second and the number of sends."""
+  invocation_context = await _create_invocation_context(coalescing_config)
+  for _ in range(_NUM_THROUGHPUT_FRAMES):
+    invocation_context.live_request_queue.send_realtime(_frame())
+  invocation_context.live_request_queue.close()
+  connection = _FakeConnection()
+  start = time.perf_counter()
+  await SingleFlow()._send_to_model(connection, invocation_context)
+  elapsed = time.perf_counter() - start
+  return _NUM_THROUGHPUT_FRAMES / elapsed, connection.num_sends
+
+
+async def _measure_latency(
+    coalescing_config: Optional[RealtimeInputCoalescingConfig],
+) -> tuple[float, float]:
+  """Returns the average and max latency of a frame in milliseconds."""
+  invocation_context = await _create_invocation_context(coalescing_config)
+  connection = _FakeConnection()
+  send_task = asyncio.create_task(
+      SingleFlow()._send_to_model(connection, invocation_context)
+  )
+  frame_queued_at = []
+  for _ in range(_NUM_LATENCY_FRAMES):
+    frame_queued_at.append(time.perf_counter())
+    invocation_context.live_request_queue.send_realtime(_frame())
+    await asyncio.sleep(_FRAME_INTERVAL_SECS)
+  invocation_context.live_request_queue.close()
+  await send_task
+  latencies = [
+      (sent_at - queued_at) * 1000
+      for queued_at, sent_at in zip(frame_queued_at, connection.frame_sent_at)
+  ]
+  return sum(latencies) / len(latencies), max(latencies)
+
+
+async def main():
+  print(
+      f'{"coalescing":>10} {"frames/s":>10} {"sends":>7}'
+      f' {"avg ms":>8} {"max ms":>8}'
+  )
+  for name, coalescing_config in _CONFIGS.items():
+    throughput, num_sends = await _measure_throughput(coalescing_config)
+    average_latency, max_latency = await _measure_latency(coalescing_config)
+    print(
+        f'{name:>10} {throughput:>10.0f} {num_sends:>7}'
+        f' {average_latency:>8.1f} {max_latency:>8.1f}'
+    )
+
+
+if __name__ == '__main__':
+  asyncio.run(main())
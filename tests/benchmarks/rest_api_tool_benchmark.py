@@ -0,0 +1,137 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Benchmarks concurrent RestApiTool calls against a local HTTP stub server.
+
+Compares the blocking `RestApiTool.call`, which `run_async` used to wrap,
+with `run_async` over the pooled async HTTP client. The stub server takes
+10ms to respond. The longest stall of the event loop shows how long other
+coroutines, e.g. other agents, could not run.
+
+Usage:
+  python -m tests.benchmarks.rest_api_tool_benchmark
+"""
+
+import asyncio
+import http.server
+import json
+import threading
+import time
+
+from fastapi.openapi.models import Operation
+from google.adk.tools.openapi_tool.openapi_spec_parser.http_client import HttpClient
+from google.adk.tools.openapi_tool.openapi_spec_parser.openapi_spec_parser import OperationEndpoint
+from google.adk.tools.openapi_tool.openapi_spec_parser.rest_api_tool import RestApiTool
+
+_NUM_CALLERS = (1, 10, 50)
+_NUM_CALLS_PER_CALLER = 10
+_RESPONSE_DELAY_SECS = 0.01
+
+
+class _StubHandler(http.server.BaseHTTPRequestHandler):
+  protocol_version = 'HTTP/1.1'
+  # Sends the headers and the body without waiting for delayed ACKs.
+  disable_nagle_algorithm = True
+
+  def do_GET(self):
+    time.sleep(_RESPONSE_DELAY_SECS)
+    body = json.dumps({'items': ['item'] * 10}).encode()
+    self.send_response(200)
+    self.send_header('Content-Length', str(len(body)))
+    self.end_headers()
+    self.wfile.write(body)
+
+  def log_message(self, *args):
+    pass
+
+
+async def _measure_loop_stall(stop: asyncio.Event) -> float:
+  """Returns the longest time the event loop did not run this task, in ms."""
+  max_stall = 0.0
+  while not stop.is_set():
+    start = time.perf_counter()
+    await asyncio.sleep(0.001)
+    max_stall = max(max_stall, time.perf_counter() - start - 0.001)
+  return max_stall * 1000
+
+
+async def _measure(
+    tool: RestApiTool, num_callers: int, use_async: bool
+) -> tuple[float, float, float]:
+  """Returns the calls per second, the average latency and the max stall."""
+  latencies = []
+
+  async def caller():
+    for _ in range(_NUM_CALLS_PER_CALLER):
+      start = time.perf_counter()
+      if use_async:
+        await tool.run_async(args={}, tool_context=None)
+      else:
+        tool.call(args={}, tool_context=None)
+      latencies.append(time.perf_counter() - start)
+
+  stop = asyncio.Event()
+  stall_task = asyncio.create_task(_measure_loop_stall(stop))
+  start = time.perf_counter()
+  await asyncio.gather(*[caller() for _ in range(num_callers)])
+  elapsed = time.perf_counter() - start
+  stop.set()
+  max_stall = await stall_task
+  return (
+      len(latencies) / elapsed,
+      sum(latencies) / len(latencies) * 1000,
+      max_stall,
+  )
+
+
+async def main():
+  server = http.server.ThreadingHTTPServer(('127.0.0.1', 0), _StubHandler)
+  server.daemon_threads = True
+  threading.Thread(target=server.serve_forever, daemon=True).start()
+  http_client = HttpClient()
+  tool = RestApiTool(
+      name='list_items',
+      description='Lists the items.',
+      endpoint=OperationEndpoint(
+          base_url=f'http://127.0.0.1:{server.server_address[1]}',
+          path='/items',
+          method='GET',
+      ),
+      operation=Operation(operationId='listItems'),
+      http_client=http_client,
+  )
+  try:
+    # Creates the client, which loads the TLS certificates, before measuring.
+    await tool.run_async(args={}, tool_context=None)
+    print(
+        f'{"callers":>7} {"client":>8} {"calls/s":>8} {"avg ms":>8}'
+        f' {"max stall ms":>13}'
+    )
+    for num_callers in _NUM_CALLERS:
+      for name, use_async in (('requests', False), ('httpx', True)):
+        calls_per_sec, average_latency, max_stall = await _measure(
+            tool, num_callers, use_async
+        )
+        print(
+            f'{num_callers:>7} {name:>8} {calls_per_sec:>8.0f}'
+            f' {average_latency:>8.1f} {max_stall:>13.1f}'
+        )
+  finally:
+    await http_client.close()
+    server.shutdown()
+    server.server_close()
+
+
+if __name__ == '__main__':
+  asyncio.run(main())
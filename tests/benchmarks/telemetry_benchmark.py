@@ -0,0 +1,119 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Benchmarks the overhead of trace_call_llm vs history length.
+
+Compares a span that is not recording (tracing disabled or not sampled) with
+a recording span under each payload capture policy.
+
+Usage:
+  python -m tests.benchmarks.telemetry_benchmark
+"""
+
+import asyncio
+import time
+
+from google.adk import telemetry
+from google.adk.agents import Agent
+from google.adk.agents.invocation_context import InvocationContext
+from google.adk.models import LlmRequest
+from google.adk.models import LlmResponse
+from google.adk.sessions import InMemorySessionService
+from google.adk.telemetry import PayloadCapture
+from google.adk.telemetry import TelemetryPolicy
+from google.genai import types
+from opentelemetry import trace
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.sampling import ALWAYS_OFF
+from opentelemetry.sdk.trace.sampling import ALWAYS_ON
+
+_HISTORY_SIZES = (10, 100, 1000)
+_NUM_CALLS = 50
+
+
+async def _create_invocation_context() -> InvocationContext:
+  session_service = InMemorySessionService()
+  session = await session_service.create_session(
+      app_name='benchmark_app', user_id='benchmark_user'
+  )
+  return InvocationContext(
+      invocation_id='invocation',
+      agent=Agent(name='benchmark_agent', model='gemini-2.0-flash'),
+      session=session,
+      session_service=session_service,
+  )
+
+
+def _llm_request(num_contents: int) -> LlmRequest:
+  return LlmRequest(
+      model='gemini-2.0-flash',
+      contents=[
+          types.Content(
+              role='user' if i % 2 == 0 else 'model',
+              parts=[types.Part(text=f'message {i} ' * 50)],
+          )
+          for i in range(num_contents)
+      ],
+      config=types.GenerateContentConfig(system_instruction='Be helpful.'),
+  )
+
+
+def _time_trace_call_llm(
+    tracer: trace.Tracer,
+    invocation_context: InvocationContext,
+    llm_request: LlmRequest,
+) -> float:
+  """Returns the average latency of trace_call_llm in milliseconds."""
+  llm_response = LlmResponse(
+      content=types.ModelContent([types.Part(text='response')])
+  )
+  start = time.perf_counter()
+  for _ in range(_NUM_CALLS):
+    with tracer.start_as_current_span('call_llm'):
+      telemetry.trace_call_llm(
+          invocation_context, 'event', llm_request, llm_response
+      )
+  return (time.perf_counter() - start) * 1000 / _NUM_CALLS
+
+
+async def main():
+  invocation_context = await _create_invocation_context()
+  unsampled_tracer = TracerProvider(sampler=ALWAYS_OFF).get_tracer('benchmark')
+  sampled_tracer = TracerProvider(sampler=ALWAYS_ON).get_tracer('benchmark')
+  policies = list(PayloadCapture)
+
+  print(
+      f'{"contents":>8} {"unsampled":>10} '
+      + ' '.join(f'{policy.value:>10}' for policy in policies)
+      + '  (ms per call)'
+  )
+  for num_contents in _HISTORY_SIZES:
+    llm_request = _llm_request(num_contents)
+    telemetry.set_telemetry_policy(TelemetryPolicy())
+    results = [
+        _time_trace_call_llm(unsampled_tracer, invocation_context, llm_request)
+    ]
+    for policy in policies:
+      telemetry.set_telemetry_policy(TelemetryPolicy(payload_capture=policy))
+      results.append(
+          _time_trace_call_llm(sampled_tracer, invocation_context, llm_request)
+      )
+    print(
+        f'{num_contents:>8} '
+        + ' '.join(f'{result:>10.3f}' for result in results)
+    )
+
+
+if __name__ == '__main__':
+  asyncio.run(main())
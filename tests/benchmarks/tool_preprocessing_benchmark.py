@@ -0,0 +1,102 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Benchmarks preprocessing an LLM request for an agent with many tools.
+
+Compares the first step of an agent, which wraps its functions in tools and
+builds their declarations, with later steps, which reuse them.
+
+Usage:
+  python -m tests.benchmarks.tool_preprocessing_benchmark
+"""
+
+import asyncio
+import time
+
+from google.adk.agents import Agent
+from google.adk.agents.invocation_context import InvocationContext
+from google.adk.agents.run_config import RunConfig
+from google.adk.flows.llm_flows.single_flow import SingleFlow
+from google.adk.models import LlmRequest
+from google.adk.sessions import InMemorySessionService
+
+_NUM_TOOLS = (10, 50, 100)
+_NUM_STEPS = 20
+
+
+def _create_tool(index: int):
+  def tool(city: str, days: int, units: str) -> dict[str, str]:
+    """Gets the weather forecast of a city.
+
+    Args:
+      city: The city.
+      days: The number of days to forecast.
+      units: The units of the forecast.
+
+    Returns:
+      The forecast.
+    """
+    return {'forecast': 'sunny'}
+
+  tool.__name__ = f'get_weather_{index}'
+  return tool
+
+
+async def _create_invocation_context(num_tools: int) -> InvocationContext:
+  session_service = InMemorySessionService()
+  session = await session_service.create_session(
+      app_name='benchmark_app', user_id='benchmark_user'
+  )
+  return InvocationContext(
+      invocation_id='invocation',
+      agent=Agent(
+          name='benchmark_agent',
+          model='gemini-2.0-flash',
+          instruction='Be helpful.',
+          tools=[_create_tool(i) for i in range(num_tools)],
+      ),
+      session=session,
+      session_service=session_service,
+      run_config=RunConfig(),
+  )
+
+
+async def _time_preprocess(
+    flow: SingleFlow, invocation_context: InvocationContext
+) -> float:
+  """Returns the latency of preprocessing a request in milliseconds."""
+  start = time.perf_counter()
+  async for _ in flow._preprocess_async(invocation_context, LlmRequest()):
+    pass
+  return (time.perf_counter() - start) * 1000
+
+
+async def main():
+  flow = SingleFlow()
+  print(f'{"tools":>6} {"first step":>11} {"later steps":>12}  (ms per step)')
+  for num_tools in _NUM_TOOLS:
+    invocation_context = await _create_invocation_context(num_tools)
+    first_step = await _time_preprocess(flow, invocation_context)
+    later_steps = [
+        await _time_preprocess(flow, invocation_context)
+        for _ in range(_NUM_STEPS)
+    ]
+    print(
+        f'{num_tools:>6} {first_step:>11.2f}'
+        f' {sum(later_steps) / len(later_steps):>12.2f}'
+    )
+
+
+if __name__ == '__main__':
+  asyncio.run(main())
@@ -0,0 +1,130 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the lookup tables of frozen agent trees."""
+
+from google.adk.agents import _agent_tree
+from google.adk.agents.base_agent import BaseAgent
+from google.adk.agents.llm_agent import LlmAgent
+from google.adk.agents.sequential_agent import SequentialAgent
+from google.adk.flows.llm_flows import agent_transfer
+from google.adk.runners import InMemoryRunner
+
+
+def _create_agent_tree() -> LlmAgent:
+  return LlmAgent(
+      name='root',
+      sub_agents=[
+          LlmAgent(
+              name='a',
+              sub_agents=[
+                  LlmAgent(name='a1', disallow_transfer_to_peers=True),
+                  LlmAgent(name='a2', disallow_transfer_to_parent=True),
+              ],
+          ),
+          SequentialAgent(
+              name='b',
+              sub_agents=[LlmAgent(name='b1'), LlmAgent(name='b2')],
+          ),
+      ],
+  )
+
+
+def _all_agents(agent: BaseAgent) -> list[BaseAgent]:
+  agents = [agent]
+  for sub_agent in agent.sub_agents:
+    agents.extend(_all_agents(sub_agent))
+  return agents
+
+
+def test_frozen_lookups_match_unfrozen_lookups():
+  unfrozen_root = _create_agent_tree()
+  frozen_root = _create_agent_tree()
+  InMemoryRunner(frozen_root)
+  names = [agent.name for agent in _all_agents(unfrozen_root)] + ['unknown']
+  runner = InMemoryRunner(_create_agent_tree())
+
+  assert unfrozen_root._get_agent_tree() is None
+  for unfrozen, frozen in zip(
+      _all_agents(unfrozen_root), _all_agents(frozen_root)
+  ):
+    assert frozen._get_agent_tree() is not None
+    assert frozen.root_agent is frozen_root
+    for name in names:
+      unfrozen_match = unfrozen.find_agent(name)
+      frozen_match = frozen.find_agent(name)
+      assert (unfrozen_match and unfrozen_match.name) == (
+          frozen_match and frozen_match.name
+      )
+      unfrozen_match = unfrozen.find_sub_agent(name)
+      frozen_match = frozen.find_sub_agent(name)
+      assert (unfrozen_match and unfrozen_match.name) == (
+          frozen_match and frozen_match.name
+      )
+    assert runner._is_transferable_across_agent_tree(
+        unfrozen
+    ) == runner._is_transferable_across_agent_tree(frozen)
+    if isinstance(frozen, LlmAgent):
+      assert [
+          agent.name for agent in agent_transfer._get_transfer_targets(unfrozen)
+      ] == [
+          agent.name for agent in agent_transfer._get_transfer_targets(frozen)
+      ]
+
+
+def test_find_agent_returns_first_match_in_pre_order():
+  root = LlmAgent(
+      name='root',
+      sub_agents=[
+          LlmAgent(name='a', sub_agents=[LlmAgent(name='dup')]),
+          LlmAgent(name='dup'),
+      ],
+  )
+  _agent_tree.freeze(root)
+
+  assert root.find_agent('dup') is root.sub_agents[0].sub_agents[0]
+  assert root.sub_agents[1].find_agent('dup') is root.sub_agents[1]
+  assert root.sub_agents[1].find_sub_agent('dup') is None
+  assert root.find_sub_agent('dup') is root.sub_agents[0].sub_agents[0]
+
+
+def test_frozen_find_sub_agent_does_not_walk_sub_agents(monkeypatch):
+  root = _create_agent_tree()
+  _agent_tree.freeze(root)
+
+  def fail_find_agent(self, name):
+    raise AssertionError('find_agent should not be called')
+
+  monkeypatch.setattr(BaseAgent, 'find_agent', fail_find_agent)
+  assert root.find_sub_agent('b2') is root.sub_agents[1].sub_agents[1]
+  assert root.find_sub_agent('root') is None
+
+
+def test_freeze_from_sub_agent_freezes_whole_tree():
+  root = _create_agent_tree()
+  agent_tree = _agent_tree.freeze(root.sub_agents[0])
+
+  assert agent_tree.root_agent is root
+  assert all(
+      agent._get_agent_tree() is agent_tree for agent in _all_agents(root)
+  )
+
+
+def test_copied_agent_is_not_in_frozen_tree():
+  root = _create_agent_tree()
+  _agent_tree.freeze(root)
+  copied_agent = root.sub_agents[0].model_copy()
+
+  assert copied_agent._get_agent_tree() is None
+  assert copied_agent.find_agent('a1').name == 'a1'
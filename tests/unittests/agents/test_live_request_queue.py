@@ -1,9 +1,11 @@
+import asyncio
 from unittest.mock import AsyncMock
 from unittest.mock import MagicMock
 from unittest.mock import patch
 
 from google.adk.agents.live_request_queue import LiveRequest
 from google.adk.agents.live_request_queue import LiveRequestQueue
+from google.adk.agents.live_request_queue import OverflowPolicy
 from google.genai import types
 import pytest
 
@@ -54,3 +56,170 @@ async def test_get():
 
     assert result == res
     mock_get.assert_called_once()
+
+
+def _audio_blob(data: bytes) -> types.Blob:
+  return types.Blob(data=data, mime_type="audio/pcm")
+
+
+@pytest.mark.asyncio
+async def test_bounded_queue_blocks_when_full():
+  queue = LiveRequestQueue(max_size=1)
+  queue.send_realtime(_audio_blob(b"1"))
+
+  with pytest.raises(asyncio.QueueFull):
+    queue.send_realtime(_audio_blob(b"2"))
+  send_task = asyncio.create_task(
+      queue.send_async(LiveRequest(blob=_audio_blob(b"2")))
+  )
+  await asyncio.sleep(0)
+  assert not send_task.done()
+
+  assert (await queue.get()).blob.data == b"1"
+  await send_task
+  assert (await queue.get()).blob.data == b"2"
+
+
+@pytest.mark.asyncio
+async def test_bounded_queue_drops_oldest_when_full():
+  queue = LiveRequestQueue(
+      max_size=2, overflow_policy=OverflowPolicy.DROP_OLDEST
+  )
+  for data in [b"1", b"2", b"3"]:
+    queue.send_realtime(_audio_blob(data))
+  await queue.send_async(LiveRequest(blob=_audio_blob(b"4")))
+
+  assert (await queue.get()).blob.data == b"3"
+  assert (await queue.get()).blob.data == b"4"
+  assert queue.get_metrics().num_dropped == 2
+
+
+@pytest.mark.asyncio
+async def test_bounded_queue_coalesces_audio_when_full():
+  queue = LiveRequestQueue(
+      max_size=2, overflow_policy=OverflowPolicy.COALESCE_AUDIO
+  )
+  content = types.UserContent("hi")
+  queue.send_content(content)
+  for data in [b"1", b"2", b"3"]:
+    queue.send_realtime(_audio_blob(data))
+  queue.send_realtime(types.Blob(data=b"image", mime_type="image/jpeg"))
+
+  # The coalesced audio blob is dropped for the image, not the content.
+  assert (await queue.get()).content == content
+  assert (await queue.get()).blob.mime_type == "image/jpeg"
+  metrics = queue.get_metrics()
+  assert metrics.num_coalesced == 2
+  assert metrics.num_dropped == 1
+
+
+@pytest.mark.parametrize(
+    "overflow_policy",
+    [OverflowPolicy.DROP_OLDEST, OverflowPolicy.COALESCE_AUDIO],
+)
+@pytest.mark.asyncio
+async def test_content_is_not_dropped_for_blobs(overflow_policy):
+  queue = LiveRequestQueue(max_size=2, overflow_policy=overflow_policy)
+  content = types.UserContent("hi")
+  queue.send_content(content)
+  for i in range(5):
+    queue.send_realtime(
+        types.Blob(data=str(i).encode(), mime_type=f"image/{i}")
+    )
+
+  assert (await queue.get()).content == content
+  assert (await queue.get()).blob.data == b"4"
+  assert queue.get_metrics().num_dropped == 4
+
+
+@pytest.mark.parametrize(
+    "overflow_policy",
+    [OverflowPolicy.DROP_OLDEST, OverflowPolicy.COALESCE_AUDIO],
+)
+@pytest.mark.asyncio
+async def test_full_queue_of_content_is_not_dropped(overflow_policy):
+  queue = LiveRequestQueue(max_size=2, overflow_policy=overflow_policy)
+  contents = [types.UserContent(str(i)) for i in range(3)]
+  queue.send_content(contents[0])
+  queue.send_content(contents[1])
+
+  with pytest.raises(asyncio.QueueFull):
+    queue.send_realtime(_audio_blob(b"1"))
+  with pytest.raises(asyncio.QueueFull):
+    queue.send_content(contents[2])
+  send_task = asyncio.create_task(
+      queue.send_async(LiveRequest(content=contents[2]))
+  )
+  await asyncio.sleep(0)
+  assert not send_task.done()
+
+  assert (await queue.get()).content == contents[0]
+  await send_task
+  # Closing does not drop content, even if the queue is full.
+  queue.close()
+  assert [(await queue.get()).content for _ in range(2)] == contents[1:]
+  assert (await queue.get()).close
+  assert queue.get_metrics().num_dropped == 0
+
+
+@pytest.mark.asyncio
+async def test_coalesced_audio_is_received_as_bytes():
+  queue = LiveRequestQueue(
+      max_size=1, overflow_policy=OverflowPolicy.COALESCE_AUDIO
+  )
+  for data in [b"1", b"2", b"3"]:
+    queue.send_realtime(_audio_blob(data))
+
+  blob = queue.get_nowait().blob
+  assert blob.data == b"123"
+  assert isinstance(blob.data, bytes)
+  queue.send_realtime(_audio_blob(b"4"))
+  queue.send_realtime(_audio_blob(b"5"))
+  assert queue.get_nowait().blob.data == b"45"
+
+
+@pytest.mark.asyncio
+async def test_close_never_blocks():
+  queue = LiveRequestQueue(max_size=1)
+  queue.send_realtime(_audio_blob(b"1"))
+  queue.close()
+
+  assert (await queue.get()).close
+
+
+@pytest.mark.asyncio
+async def test_get_waits_without_polling():
+  queue = LiveRequestQueue()
+  get_task = asyncio.create_task(queue.get())
+  await asyncio.sleep(0.01)
+  assert not get_task.done()
+
+  queue.send_realtime(_audio_blob(b"1"))
+  assert (await get_task).blob.data == b"1"
+
+
+@pytest.mark.asyncio
+async def test_metrics():
+  queue = LiveRequestQueue()
+  for data in [b"1", b"2", b"3"]:
+    queue.send_realtime(_audio_blob(data))
+  await queue.get()
+
+  metrics = queue.get_metrics()
+  assert metrics.depth == 2
+  assert metrics.max_depth == 3
+  assert metrics.num_sent == 3
+  assert metrics.num_received == 1
+  assert metrics.num_dropped == 0
+  assert metrics.max_latency_secs >= metrics.average_latency_secs >= 0
+
+
+@pytest.mark.asyncio
+async def test_get_nowait():
+  queue = LiveRequestQueue()
+
+  with pytest.raises(asyncio.QueueEmpty):
+    queue.get_nowait()
+  queue.send_realtime(_audio_blob(b"1"))
+  assert queue.get_nowait().blob.data == b"1"
+  assert queue.get_metrics().num_received == 1
@@ -280,3 +280,23 @@ def test_allow_transfer_by_default():
 
   assert not agent.disallow_transfer_to_parent
   assert not agent.disallow_transfer_to_peers
+
+
+@pytest.mark.asyncio
+async def test_canonical_tools_reuses_function_tools():
+  def _tool_1():
+    pass
+
+  def _tool_2():
+    pass
+
+  agent = LlmAgent(name='test_agent', tools=[_tool_1, _tool_2])
+  ctx = await _create_readonly_context(agent)
+
+  tools = await agent.canonical_tools(ctx)
+  assert [tool.func for tool in tools] == [_tool_1, _tool_2]
+  assert await agent.canonical_tools(ctx) == tools
+
+  agent.tools = [_tool_2]
+  assert await agent.canonical_tools(ctx) == [tools[1]]
+  assert list(agent._function_tools.values()) == [tools[1]]
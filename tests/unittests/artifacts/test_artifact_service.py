@@ -14,13 +14,17 @@
 
 """Tests for the artifact service."""
 
+import contextlib
 import enum
+import pathlib
+import threading
 from typing import Optional
 from typing import Union
-from unittest import mock
 
+from google.adk.artifacts import FileArtifactService
 from google.adk.artifacts import GcsArtifactService
 from google.adk.artifacts import InMemoryArtifactService
+from google.api_core import exceptions
 from google.genai import types
 import pytest
 
@@ -30,6 +34,7 @@ Enum = enum.Enum
 class ArtifactServiceType(Enum):
   IN_MEMORY = "IN_MEMORY"
   GCS = "GCS"
+  FILE = "FILE"
 
 
 class MockBlob:
@@ -49,16 +54,27 @@ class MockBlob:
     self.name = name
     self.content: Optional[bytes] = None
     self.content_type: Optional[str] = None
+    self.upload_thread_id: Optional[int] = None
 
   def upload_from_string(
-      self, data: Union[str, bytes], content_type: Optional[str] = None
+      self,
+      data: Union[str, bytes],
+      content_type: Optional[str] = None,
+      if_generation_match: Optional[int] = None,
   ) -> None:
     """Mocks uploading data to the blob (from a string or bytes).
 
     Args:
         data: The data to upload (string or bytes).
         content_type:  The content type of the data (optional).
+        if_generation_match: If 0, the upload fails if the blob exists.
+
+    Raises:
+        PreconditionFailed: If the precondition does not match.
     """
+    if if_generation_match == 0 and self.content is not None:
+      raise exceptions.PreconditionFailed(f"{self.name} exists.")
+    self.upload_thread_id = threading.get_ident()
     if isinstance(data, str):
       self.content = data.encode("utf-8")
     elif isinstance(data, bytes):
@@ -120,6 +136,8 @@ class MockClient:
   def __init__(self) -> None:
     """Initializes MockClient."""
     self.buckets: dict[str, MockBucket] = {}
+    self.num_list_blobs_calls = 0
+    self.num_batches = 0
 
   def bucket(self, bucket_name: str) -> MockBucket:
     """Mocks getting a Bucket object."""
@@ -128,37 +146,47 @@ class MockClient:
     return self.buckets[bucket_name]
 
   def list_blobs(self, bucket: MockBucket, prefix: Optional[str] = None):
-    """Mocks listing blobs in a bucket, optionally with a prefix."""
-    if prefix:
-      return [
-          blob for name, blob in bucket.blobs.items() if name.startswith(prefix)
-      ]
-    return list(bucket.blobs.values())
+    """Mocks listing the uploaded blobs in a bucket, optionally with a prefix."""
+    self.num_list_blobs_calls += 1
+    return [
+        blob
+        for name, blob in bucket.blobs.items()
+        if blob.content is not None and name.startswith(prefix or "")
+    ]
+
+  def batch(self):
+    """Mocks a batch of requests, which are run immediately."""
+    self.num_batches += 1
+    return contextlib.nullcontext()
+
+
+def _text_artifact(text: str) -> types.Part:
+  return types.Part.from_bytes(data=text.encode(), mime_type="text/plain")
 
 
 def mock_gcs_artifact_service():
-  with mock.patch("google.cloud.storage.Client", return_value=MockClient()):
-    service = GcsArtifactService(bucket_name="test_bucket")
-    service.bucket = service.storage_client.bucket("test_bucket")
-    return service
+  return GcsArtifactService(
+      bucket_name="test_bucket", storage_client=MockClient()
+  )
 
 
 def get_artifact_service(
     service_type: ArtifactServiceType = ArtifactServiceType.IN_MEMORY,
+    root_dir: Optional[pathlib.Path] = None,
 ):
   """Creates an artifact service for testing."""
   if service_type == ArtifactServiceType.GCS:
     return mock_gcs_artifact_service()
+  if service_type == ArtifactServiceType.FILE:
+    return FileArtifactService(root_dir=str(root_dir))
   return InMemoryArtifactService()
 
 
 @pytest.mark.asyncio
-@pytest.mark.parametrize(
-    "service_type", [ArtifactServiceType.IN_MEMORY, ArtifactServiceType.GCS]
-)
-async def test_load_empty(service_type):
+@pytest.mark.parametrize("service_type", list(ArtifactServiceType))
+async def test_load_empty(service_type, tmp_path):
   """Tests loading an artifact when none exists."""
-  artifact_service = get_artifact_service(service_type)
+  artifact_service = get_artifact_service(service_type, tmp_path)
   assert not await artifact_service.load_artifact(
       app_name="test_app",
       user_id="test_user",
@@ -168,12 +196,10 @@ async def test_load_empty(service_type):
 
 
 @pytest.mark.asyncio
-@pytest.mark.parametrize(
-    "service_type", [ArtifactServiceType.IN_MEMORY, ArtifactServiceType.GCS]
-)
-async def test_save_load_delete(service_type):
+@pytest.mark.parametrize("service_type", list(ArtifactServiceType))
+async def test_save_load_delete(service_type, tmp_path):
   """Tests saving, loading, and deleting an artifact."""
-  artifact_service = get_artifact_service(service_type)
+  artifact_service = get_artifact_service(service_type, tmp_path)
   artifact = types.Part.from_bytes(data=b"test_data", mime_type="text/plain")
   app_name = "app0"
   user_id = "user0"
@@ -212,12 +238,10 @@ async def test_save_load_delete(service_type):
 
 
 @pytest.mark.asyncio
-@pytest.mark.parametrize(
-    "service_type", [ArtifactServiceType.IN_MEMORY, ArtifactServiceType.GCS]
-)
-async def test_list_keys(service_type):
+@pytest.mark.parametrize("service_type", list(ArtifactServiceType))
+async def test_list_keys(service_type, tmp_path):
   """Tests listing keys in the artifact service."""
-  artifact_service = get_artifact_service(service_type)
+  artifact_service = get_artifact_service(service_type, tmp_path)
   artifact = types.Part.from_bytes(data=b"test_data", mime_type="text/plain")
   app_name = "app0"
   user_id = "user0"
@@ -243,12 +267,10 @@ async def test_list_keys(service_type):
 
 
 @pytest.mark.asyncio
-@pytest.mark.parametrize(
-    "service_type", [ArtifactServiceType.IN_MEMORY, ArtifactServiceType.GCS]
-)
-async def test_list_versions(service_type):
+@pytest.mark.parametrize("service_type", list(ArtifactServiceType))
+async def test_list_versions(service_type, tmp_path):
   """Tests listing versions of an artifact."""
-  artifact_service = get_artifact_service(service_type)
+  artifact_service = get_artifact_service(service_type, tmp_path)
 
   app_name = "app0"
   user_id = "user0"
@@ -278,3 +300,165 @@ async def test_list_versions(service_type):
   )
 
   assert response_versions == list(range(3))
+
+
+@pytest.mark.asyncio
+async def test_gcs_caches_latest_version():
+  """Tests that saves and loads of the latest version do not list blobs."""
+  artifact_service = mock_gcs_artifact_service()
+  storage_client = artifact_service.storage_client
+  artifact_key = dict(
+      app_name="app0", user_id="user0", session_id="123", filename="file"
+  )
+
+  for i in range(3):
+    assert i == await artifact_service.save_artifact(
+        **artifact_key,
+        artifact=_text_artifact(f"version {i}"),
+    )
+  assert (
+      await artifact_service.load_artifact(**artifact_key)
+  ) == _text_artifact("version 2")
+  assert storage_client.num_list_blobs_calls == 1
+  # Uploads run in the thread pool, not on the event loop.
+  blob = artifact_service.bucket.blob("app0/user0/123/file/2")
+  assert blob.upload_thread_id != threading.get_ident()
+
+
+@pytest.mark.asyncio
+async def test_gcs_close_shuts_down_thread_pool():
+  """Tests that the worker threads are stopped on close."""
+  artifact_service = mock_gcs_artifact_service()
+  artifact_key = dict(
+      app_name="app0", user_id="user0", session_id="123", filename="file"
+  )
+  await artifact_service.save_artifact(
+      **artifact_key, artifact=_text_artifact("version 0")
+  )
+
+  await artifact_service.close()
+
+  with pytest.raises(RuntimeError):
+    await artifact_service.save_artifact(
+        **artifact_key, artifact=_text_artifact("version 1")
+    )
+
+
+@pytest.mark.asyncio
+async def test_gcs_save_does_not_overwrite_other_writers():
+  """Tests that a save retries with a new version if the version exists."""
+  artifact_service = mock_gcs_artifact_service()
+  artifact_key = dict(
+      app_name="app0", user_id="user0", session_id="123", filename="file"
+  )
+  await artifact_service.save_artifact(
+      **artifact_key, artifact=_text_artifact("version 0")
+  )
+  # Another writer saves version 1, which is not in the cache.
+  artifact_service.bucket.blob("app0/user0/123/file/1").upload_from_string(
+      "other writer", content_type="text/plain"
+  )
+
+  assert 2 == await artifact_service.save_artifact(
+      **artifact_key, artifact=_text_artifact("version 2")
+  )
+  assert (
+      await artifact_service.load_artifact(**artifact_key, version=1)
+  ) == _text_artifact("other writer")
+
+
+@pytest.mark.asyncio
+async def test_gcs_delete_artifact_in_batches():
+  """Tests that the versions of an artifact are deleted in batches."""
+  artifact_service = mock_gcs_artifact_service()
+  artifact_key = dict(
+      app_name="app0", user_id="user0", session_id="123", filename="file"
+  )
+  for i in range(150):
+    await artifact_service.save_artifact(
+        **artifact_key, artifact=_text_artifact(f"version {i}")
+    )
+
+  await artifact_service.delete_artifact(**artifact_key)
+
+  assert artifact_service.storage_client.num_batches == 2
+  assert not await artifact_service.list_versions(**artifact_key)
+  assert not await artifact_service.load_artifact(**artifact_key)
+  assert 0 == await artifact_service.save_artifact(
+      **artifact_key, artifact=_text_artifact("version 0")
+  )
+
+
+@pytest.mark.asyncio
+async def test_file_artifacts_persist(tmp_path):
+  """Tests that file artifacts are loaded by a new service."""
+  artifact_service = FileArtifactService(root_dir=str(tmp_path))
+  await artifact_service.save_artifact(
+      app_name="app0",
+      user_id="user0",
+      session_id="../123",
+      filename="dir/file",
+      artifact=_text_artifact("version 0"),
+  )
+  await artifact_service.save_artifact(
+      app_name="app0",
+      user_id="user0",
+      session_id="../123",
+      filename="user:file",
+      artifact=types.Part.from_bytes(data=b"", mime_type="image/png"),
+  )
+
+  artifact_service = FileArtifactService(root_dir=str(tmp_path))
+  assert await artifact_service.list_artifact_keys(
+      app_name="app0", user_id="user0", session_id="../123"
+  ) == ["dir/file", "user:file"]
+  assert (
+      await artifact_service.load_artifact(
+          app_name="app0",
+          user_id="user0",
+          session_id="../123",
+          filename="dir/file",
+      )
+  ) == _text_artifact("version 0")
+  assert (
+      await artifact_service.load_artifact(
+          app_name="app0",
+          user_id="user0",
+          session_id="other",
+          filename="user:file",
+      )
+  ) == types.Part.from_bytes(data=b"", mime_type="image/png")
+  assert not await artifact_service.load_artifact(
+      app_name="app0",
+      user_id="user0",
+      session_id="../123",
+      filename="dir/file",
+      version=1,
+  )
+  # Path components are quoted, so nothing is written outside root_dir.
+  assert [path.name for path in tmp_path.iterdir()] == ["app0"]
+
+
+@pytest.mark.asyncio
+async def test_in_memory_evicts_least_recently_used():
+  """Tests that the least recently used artifacts are evicted."""
+  artifact_service = InMemoryArtifactService(max_size_bytes=10)
+  artifact_key = dict(app_name="app0", user_id="user0", session_id="123")
+  for filename in ["a", "b"]:
+    await artifact_service.save_artifact(
+        **artifact_key, filename=filename, artifact=_text_artifact("1234")
+    )
+  await artifact_service.load_artifact(**artifact_key, filename="a")
+  await artifact_service.save_artifact(
+      **artifact_key, filename="c", artifact=_text_artifact("1234")
+  )
+
+  assert await artifact_service.list_artifact_keys(**artifact_key) == [
+      "a",
+      "c",
+  ]
+  # An artifact larger than the limit is kept until the next save.
+  await artifact_service.save_artifact(
+      **artifact_key, filename="d", artifact=_text_artifact("12345678901")
+  )
+  assert await artifact_service.list_artifact_keys(**artifact_key) == ["d"]
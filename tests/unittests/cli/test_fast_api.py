@@ -106,7 +106,10 @@ async def dummy_run_async(
     session_id,
     new_message,
     run_config: RunConfig = RunConfig(),
+    session=None,
 ):
+  # The handlers pass the session they loaded, so it is not loaded again.
+  assert session["id"] == session_id
   yield _event_1()
   await asyncio.sleep(0)
 
@@ -0,0 +1,174 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the multi-worker API server router."""
+
+import threading
+
+from fastapi import FastAPI
+from fastapi import HTTPException
+from fastapi import Request
+from fastapi import WebSocket
+from fastapi.responses import StreamingResponse
+from fastapi.testclient import TestClient
+from google.adk.cli import multi_worker
+import pytest
+import uvicorn
+
+
+def _create_worker_app(index: int) -> FastAPI:
+  """Creates a fake worker app with in-memory sessions."""
+  app = FastAPI()
+  sessions: dict[str, dict[str, str]] = {}
+
+  @app.get("/health")
+  def health():
+    return {"status": "ok"}
+
+  @app.post("/apps/{app_name}/users/{user_id}/sessions/{session_id}")
+  def create_session(app_name: str, user_id: str, session_id: str):
+    sessions[session_id] = {"id": session_id, "worker": index}
+    return sessions[session_id]
+
+  @app.get("/apps/{app_name}/users/{user_id}/sessions/{session_id}")
+  def get_session(app_name: str, user_id: str, session_id: str):
+    if session_id not in sessions:
+      raise HTTPException(status_code=404, detail="Session not found")
+    return sessions[session_id]
+
+  @app.get("/apps/{app_name}/users/{user_id}/sessions")
+  def list_sessions(app_name: str, user_id: str):
+    return list(sessions.values())
+
+  @app.post("/run_sse")
+  async def run_sse(request: Request):
+    body = await request.json()
+    if body["session_id"] not in sessions:
+      raise HTTPException(status_code=404, detail="Session not found")
+
+    async def events():
+      for i in range(3):
+        yield f'data: {{"worker": {index}, "event": {i}}}\n\n'
+
+    return StreamingResponse(events(), media_type="text/event-stream")
+
+  @app.get("/debug/trace/{event_id}")
+  def get_trace(event_id: str):
+    if event_id != f"event_{index}":
+      raise HTTPException(status_code=404, detail="Trace not found")
+    return {"worker": index}
+
+  @app.websocket("/run_live")
+  async def run_live(websocket: WebSocket, session_id: str):
+    await websocket.accept()
+    if session_id not in sessions:
+      await websocket.close(code=1002, reason="Session not found")
+      return
+    message = await websocket.receive_text()
+    await websocket.send_text(f"{index}:{message}")
+
+  return app
+
+
+class _FakeWorkerPool(multi_worker.WorkerPool):
+  """Runs the workers as uvicorn servers in threads."""
+
+  def __init__(self, num_workers: int):
+    super().__init__(num_workers, {})
+    self.servers: list[uvicorn.Server] = []
+
+  def _start_worker(self, worker):
+    worker.socket = multi_worker._bind_socket()
+    worker.port = worker.socket.getsockname()[1]
+    server = uvicorn.Server(
+        uvicorn.Config(_create_worker_app(worker.index), log_level="error")
+    )
+    worker.process = threading.Thread(
+        target=server.run, kwargs={"sockets": [worker.socket]}, daemon=True
+    )
+    worker.process.pid = None
+    worker.process.start()
+    self.servers.append(server)
+
+  def stop(self, timeout_secs: float = 10.0):
+    for server in self.servers:
+      server.should_exit = True
+    for worker in self.workers:
+      worker.process.join(timeout_secs)
+      worker.socket.close()
+
+
+@pytest.fixture
+def router():
+  worker_pool = _FakeWorkerPool(3)
+  with TestClient(multi_worker.create_router_app(worker_pool)) as client:
+    yield client
+
+
+def test_sessions_are_sticky(router: TestClient):
+  session_ids = []
+  for _ in range(6):
+    response = router.post("/apps/app/users/user/sessions")
+    assert response.status_code == 200
+    session_ids.append(response.json()["id"])
+
+  for session_id in session_ids:
+    session = router.get(f"/apps/app/users/user/sessions/{session_id}").json()
+    assert session["id"] == session_id
+    response = router.post(
+        "/run_sse",
+        json={"app_name": "app", "user_id": "user", "session_id": session_id},
+    )
+    assert response.status_code == 200
+    assert response.text.count(f'"worker": {session["worker"]}') == 3
+
+  sessions = router.get("/apps/app/users/user/sessions").json()
+  assert sorted(session["id"] for session in sessions) == sorted(session_ids)
+
+
+def test_run_live_is_sticky(router: TestClient):
+  session_id = router.post("/apps/app/users/user/sessions").json()["id"]
+  worker = router.get(f"/apps/app/users/user/sessions/{session_id}").json()[
+      "worker"
+  ]
+
+  with router.websocket_connect(f"/run_live?session_id={session_id}") as ws:
+    ws.send_text("hello")
+    assert ws.receive_text() == f"{worker}:hello"
+
+
+def test_trace_by_event_id(router: TestClient):
+  assert router.get("/debug/trace/event_2").json() == {"worker": 2}
+  assert router.get("/debug/trace/unknown").status_code == 404
+
+
+def test_health(router: TestClient):
+  response = router.get("/health")
+
+  assert response.status_code == 200
+  assert response.json()["status"] == "ok"
+  assert [worker["healthy"] for worker in response.json()["workers"]] == [
+      True
+  ] * 3
+
+
+def test_get_session_id():
+  assert (
+      multi_worker._get_session_id("/apps/a/users/u/sessions/s1/artifacts", b"")
+      == "s1"
+  )
+  assert multi_worker._get_session_id("/debug/trace/session/s2", b"") == "s2"
+  assert multi_worker._get_session_id("/run", b'{"session_id": "s3"}') == "s3"
+  assert multi_worker._get_session_id("/run", b"{invalid") is None
+  assert multi_worker._get_session_id("/list-apps", b"") is None
@@ -0,0 +1,57 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for utilities in envs."""
+
+import os
+from pathlib import Path
+from unittest import mock
+
+from google.adk.cli.utils import envs
+import pytest
+
+
+@pytest.fixture
+def agents_dir(tmp_path: Path, monkeypatch) -> Path:
+  for agent_name, value in [("agent_a", "a"), ("agent_b", "b")]:
+    (tmp_path / agent_name).mkdir()
+    (tmp_path / agent_name / ".env").write_text(f"ADK_TEST_ENV={value}\n")
+  monkeypatch.delenv("ADK_TEST_ENV", raising=False)
+  return tmp_path
+
+
+def test_load_dotenv_for_agent_if_changed(agents_dir: Path, monkeypatch):
+  with mock.patch.object(
+      envs, "load_dotenv", wraps=envs.load_dotenv
+  ) as load_dotenv:
+    envs.load_dotenv_for_agent_if_changed("agent_a", str(agents_dir))
+    envs.load_dotenv_for_agent_if_changed("agent_a", str(agents_dir))
+    assert os.environ["ADK_TEST_ENV"] == "a"
+    assert load_dotenv.call_count == 1
+
+    # Another agent's .env file is loaded, then the first one again.
+    envs.load_dotenv_for_agent_if_changed("agent_b", str(agents_dir))
+    assert os.environ["ADK_TEST_ENV"] == "b"
+    envs.load_dotenv_for_agent_if_changed("agent_a", str(agents_dir))
+    assert os.environ["ADK_TEST_ENV"] == "a"
+    assert load_dotenv.call_count == 3
+
+    # A changed .env file is loaded again.
+    dotenv_path = agents_dir / "agent_a" / ".env"
+    dotenv_path.write_text("ADK_TEST_ENV=changed\n")
+    mtime = os.stat(dotenv_path).st_mtime + 10
+    os.utime(dotenv_path, (mtime, mtime))
+    envs.load_dotenv_for_agent_if_changed("agent_a", str(agents_dir))
+    assert os.environ["ADK_TEST_ENV"] == "changed"
+    assert load_dotenv.call_count == 4
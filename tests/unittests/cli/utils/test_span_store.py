@@ -0,0 +1,102 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from unittest import mock
+
+from google.adk.cli.fast_api import InMemoryExporter
+from google.adk.cli.utils.span_store import SpanStore
+from opentelemetry.sdk.trace import ReadableSpan
+from opentelemetry.trace import SpanContext
+
+
+def _span(name: str, trace_id: int, span_id: int, **attributes) -> ReadableSpan:
+  return ReadableSpan(
+      name=name,
+      context=SpanContext(trace_id=trace_id, span_id=span_id, is_remote=False),
+      attributes=attributes,
+  )
+
+
+def test_session_spans():
+  store = SpanStore()
+  exporter = InMemoryExporter(store)
+  exporter.export([
+      _span("execute_tool", 1, 1),
+      _span("call_llm", 1, 2, **{"gcp.vertex.agent.session_id": "s1"}),
+      _span("invocation", 2, 3),
+      _span("call_llm", 3, 4, **{"gcp.vertex.agent.session_id": "s2"}),
+      _span("invocation", 1, 5),
+  ])
+
+  assert [span.context.span_id for span in store.get_session_spans("s1")] == [
+      1,
+      2,
+      5,
+  ]
+  assert [span.context.span_id for span in store.get_session_spans("s2")] == [4]
+  assert not store.get_session_spans("unknown")
+
+
+def test_event_attributes():
+  store = SpanStore()
+  exporter = InMemoryExporter(store)
+  exporter.export([
+      _span("call_llm", 1, 2, **{"gcp.vertex.agent.event_id": "e1"}),
+      _span("invocation", 1, 3, **{"gcp.vertex.agent.event_id": "e2"}),
+  ])
+
+  assert store.get_event_attributes("e1") == {
+      "gcp.vertex.agent.event_id": "e1",
+      "trace_id": 1,
+      "span_id": 2,
+  }
+  assert store.get_event_attributes("e2") is None
+
+
+def test_evicts_oldest_spans():
+  store = SpanStore(max_spans=3)
+  store.add(_span("call_llm", 1, 1), session_id="s1", event_id="e1")
+  store.add(_span("call_llm", 2, 2), session_id="s2", event_id="e2")
+  store.add(_span("invocation", 1, 3))
+  store.add(_span("call_llm", 3, 4), session_id="s3", event_id="e2")
+
+  assert len(store) == 3
+  assert [span.context.span_id for span in store.get_session_spans("s1")] == [3]
+  assert store.get_event_attributes("e1") is None
+  # The attributes of e2 were replaced by a later span, which is kept.
+  store.add(_span("invocation", 4, 5))
+  assert not store.get_session_spans("s2")
+  assert store.get_event_attributes("e2") == {}
+
+  store.add(_span("invocation", 4, 6))
+  store.add(_span("invocation", 4, 7))
+  assert not store.get_session_spans("s1")
+  assert not store.get_session_spans("s3")
+  # The indexes do not keep evicted traces or sessions.
+  assert store._spans_by_trace.keys() == {4}
+  assert not store._trace_ids_by_session
+  assert not store._session_ids_by_trace
+
+
+def test_evicts_expired_spans():
+  store = SpanStore(max_age_secs=60)
+  with mock.patch("time.monotonic", return_value=1000.0):
+    store.add(_span("call_llm", 1, 1), session_id="s1", event_id="e1")
+  with mock.patch("time.monotonic", return_value=1030.0):
+    store.add(_span("call_llm", 2, 2), session_id="s2")
+
+  with mock.patch("time.monotonic", return_value=1061.0):
+    assert not store.get_session_spans("s1")
+    assert store.get_event_attributes("e1") is None
+    assert len(store.get_session_spans("s2")) == 1
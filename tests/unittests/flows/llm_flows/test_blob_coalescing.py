@@ -0,0 +1,135 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for coalescing realtime blobs before they are sent to the model."""
+
+import asyncio
+from typing import Optional
+
+from google.adk.agents import Agent
+from google.adk.agents.live_request_queue import LiveRequestQueue
+from google.adk.agents.run_config import RealtimeInputCoalescingConfig
+from google.adk.flows.llm_flows.single_flow import SingleFlow
+from google.genai import types
+import pytest
+
+from ... import testing_utils
+
+
+class _FakeConnection:
+
+  def __init__(self):
+    self.sent: list = []
+    self.closed = False
+
+  async def send_realtime(self, blob: types.Blob):
+    self.sent.append(blob)
+
+  async def send_content(self, content: types.Content):
+    self.sent.append(content)
+
+  async def close(self):
+    self.closed = True
+
+
+async def _send_to_model(
+    requests: list,
+    coalescing_config: Optional[RealtimeInputCoalescingConfig],
+) -> tuple[_FakeConnection, list]:
+  invocation_context = await testing_utils.create_invocation_context(
+      Agent(name='root_agent')
+  )
+  invocation_context.run_config.realtime_input_coalescing = coalescing_config
+  invocation_context.live_request_queue = LiveRequestQueue()
+  for request in requests:
+    if isinstance(request, types.Blob):
+      invocation_context.live_request_queue.send_realtime(request)
+    else:
+      invocation_context.live_request_queue.send_content(request)
+  invocation_context.live_request_queue.close()
+  connection = _FakeConnection()
+  await SingleFlow()._send_to_model(connection, invocation_context)
+  assert connection.closed
+  return connection, [
+      entry.data for entry in invocation_context.transcription_cache or []
+  ]
+
+
+def _audio(data: bytes) -> types.Blob:
+  return types.Blob(data=data, mime_type='audio/pcm')
+
+
+@pytest.mark.asyncio
+async def test_blobs_are_sent_one_by_one_by_default():
+  connection, transcription_data = await _send_to_model(
+      [_audio(b'1'), _audio(b'2')], None
+  )
+
+  assert connection.sent == [_audio(b'1'), _audio(b'2')]
+  assert transcription_data == [_audio(b'1'), _audio(b'2')]
+
+
+@pytest.mark.asyncio
+async def test_consecutive_blobs_are_coalesced():
+  content = types.UserContent('hi')
+  connection, transcription_data = await _send_to_model(
+      [
+          _audio(b'12'),
+          _audio(b'34'),
+          _audio(b'56'),
+          _audio(b'7'),
+          types.Blob(data=b'image', mime_type='image/jpeg'),
+          _audio(b'8'),
+          content,
+          _audio(b'9'),
+      ],
+      RealtimeInputCoalescingConfig(max_bytes=4, max_delay_secs=60),
+  )
+
+  assert connection.sent == [
+      _audio(b'1234'),
+      _audio(b'567'),
+      types.Blob(data=b'image', mime_type='image/jpeg'),
+      _audio(b'8'),
+      content,
+      _audio(b'9'),
+  ]
+  assert transcription_data == [
+      blob for blob in connection.sent if isinstance(blob, types.Blob)
+  ]
+
+
+@pytest.mark.asyncio
+async def test_coalesced_blobs_are_sent_after_max_delay():
+  invocation_context = await testing_utils.create_invocation_context(
+      Agent(name='root_agent')
+  )
+  invocation_context.run_config.realtime_input_coalescing = (
+      RealtimeInputCoalescingConfig(max_bytes=1000, max_delay_secs=0.05)
+  )
+  invocation_context.live_request_queue = LiveRequestQueue()
+  connection = _FakeConnection()
+  send_task = asyncio.create_task(
+      SingleFlow()._send_to_model(connection, invocation_context)
+  )
+
+  invocation_context.live_request_queue.send_realtime(_audio(b'1'))
+  invocation_context.live_request_queue.send_realtime(_audio(b'2'))
+  await asyncio.sleep(0.01)
+  assert not connection.sent
+  await asyncio.sleep(0.2)
+  assert connection.sent == [_audio(b'12')]
+
+  invocation_context.live_request_queue.close()
+  await send_task
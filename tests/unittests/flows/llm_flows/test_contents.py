@@ -0,0 +1,181 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import random
+from typing import Optional
+from typing import Union
+
+from google.adk.agents import Agent
+from google.adk.events import Event
+from google.adk.flows.llm_flows import contents
+from google.adk.flows.llm_flows.functions import REQUEST_EUC_FUNCTION_CALL_NAME
+from google.adk.models import LlmRequest
+from google.genai import types
+import pytest
+
+from ... import testing_utils
+
+_AGENT_NAME = 'agent'
+_AUTHORS = ['user', _AGENT_NAME, 'other_agent']
+_BRANCHES = [None, 'root', 'root.agent', 'root.other_agent']
+
+
+def _random_event(rng: random.Random, pending_call_ids: list[str]) -> Event:
+  """Returns a random event, answering pending function calls at random."""
+  author = rng.choice(_AUTHORS)
+  branch = rng.choice(_BRANCHES)
+  kind = rng.choice(
+      ['text', 'text', 'empty', 'no_content', 'call', 'response', 'auth']
+  )
+  if kind == 'no_content':
+    return Event(author=author, branch=branch)
+  if kind == 'empty':
+    parts = [types.Part(text='')]
+  elif kind == 'call':
+    parts = []
+    for _ in range(rng.randint(1, 3)):
+      call_id = f'adk-{rng.getrandbits(32)}'
+      pending_call_ids.append(call_id)
+      parts.append(
+          types.Part(
+              function_call=types.FunctionCall(
+                  id=call_id, name='tool', args={'x': rng.randint(0, 9)}
+              )
+          )
+      )
+  elif kind == 'response' and pending_call_ids:
+    parts = []
+    for call_id in rng.sample(
+        pending_call_ids, rng.randint(1, len(pending_call_ids))
+    ):
+      parts.append(
+          types.Part(
+              function_response=types.FunctionResponse(
+                  id=call_id, name='tool', response={'result': call_id}
+              )
+          )
+      )
+    if rng.random() < 0.5:
+      for part in parts:
+        pending_call_ids.remove(part.function_response.id)
+  elif kind == 'auth':
+    parts = [
+        types.Part(
+            function_call=types.FunctionCall(
+                id='auth', name=REQUEST_EUC_FUNCTION_CALL_NAME, args={}
+            )
+        )
+    ]
+  else:
+    parts = [types.Part(text=f'text {rng.randint(0, 99)}')]
+  return Event(
+      author=author,
+      branch=branch,
+      content=types.Content(
+          role='user' if author == 'user' else 'model', parts=parts
+      ),
+  )
+
+
+def _contents_or_error(build) -> Union[list[types.Content], type[Exception]]:
+  try:
+    return build()
+  except ValueError:
+    return ValueError
+
+
+@pytest.mark.parametrize('seed', range(50))
+def test_builder_matches_get_contents(seed: int):
+  rng = random.Random(seed)
+  branch: Optional[str] = rng.choice(_BRANCHES)
+  builder = contents._ContentsBuilder(branch, _AGENT_NAME)
+  events: list[Event] = []
+  pending_call_ids: list[str] = []
+
+  for _ in range(rng.randint(1, 8)):
+    for _ in range(rng.randint(1, 6)):
+      events.append(_random_event(rng, pending_call_ids))
+
+    expected = _contents_or_error(
+        lambda: contents._get_contents(branch, events, _AGENT_NAME)
+    )
+    actual = _contents_or_error(lambda: builder.build(events))
+    if expected is ValueError:
+      assert actual is ValueError
+    else:
+      assert [c.model_dump() for c in actual] == [
+          c.model_dump() for c in expected
+      ]
+
+
+def test_builder_resets_on_new_events():
+  builder = contents._ContentsBuilder(None, _AGENT_NAME)
+  events = [
+      Event(author='user', content=testing_utils.UserContent('hello')),
+  ]
+  assert builder.build(events)[0].parts[0].text == 'hello'
+
+  other_events = [
+      Event(author='user', content=testing_utils.UserContent('bye')),
+  ]
+  assert [c.parts[0].text for c in builder.build(other_events)] == ['bye']
+
+
+def test_builder_returns_independent_contents():
+  builder = contents._ContentsBuilder(None, _AGENT_NAME)
+  events = [
+      Event(author='user', content=testing_utils.UserContent('hello')),
+  ]
+  first = builder.build(events)
+  first[0].parts[0] = types.Part(text='changed')
+  first[0].parts.append(types.Part(text='appended'))
+
+  second = builder.build(events)
+  assert len(second[0].parts) == 1
+  assert second[0].parts[0].text == 'hello'
+
+
+@pytest.mark.asyncio
+async def test_processor_reuses_builder_across_steps():
+  agent = Agent(model='gemini-1.5-flash', name=_AGENT_NAME)
+  invocation_context = await testing_utils.create_invocation_context(
+      agent=agent, user_content='hello'
+  )
+
+  llm_request = LlmRequest()
+  async for _ in contents.request_processor.run_async(
+      invocation_context, llm_request
+  ):
+    pass
+  assert testing_utils.simplify_contents(llm_request.contents) == [
+      ('user', 'hello')
+  ]
+  assert len(invocation_context._contents_builders) == 1
+
+  invocation_context.session.events.append(
+      Event(
+          author=_AGENT_NAME,
+          content=testing_utils.ModelContent([types.Part(text='hi')]),
+      )
+  )
+  llm_request = LlmRequest()
+  async for _ in contents.request_processor.run_async(
+      invocation_context, llm_request
+  ):
+    pass
+  assert testing_utils.simplify_contents(llm_request.contents) == [
+      ('user', 'hello'),
+      ('model', 'hi'),
+  ]
+  assert len(invocation_context._contents_builders) == 1
@@ -0,0 +1,181 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+
+from google.adk.agents import Agent
+from google.adk.agents.run_config import RunConfig
+from google.adk.events import Event
+from google.adk.events import EventActions
+from google.adk.flows.llm_flows.functions import handle_function_calls_async
+from google.adk.flows.llm_flows.functions import merge_parallel_function_response_events
+from google.adk.tools import ToolContext
+from google.adk.tools.function_tool import FunctionTool
+from google.genai import types
+import pytest
+
+from ... import testing_utils
+
+
+def _function_call_event(num_calls: int) -> Event:
+  return Event(
+      author='root_agent',
+      content=types.Content(
+          role='model',
+          parts=[
+              types.Part(
+                  function_call=types.FunctionCall(
+                      id=f'call_{i}', name='slow_tool', args={'i': i}
+                  )
+              )
+              for i in range(num_calls)
+          ],
+      ),
+  )
+
+
+async def _run_function_calls(
+    max_concurrent_function_calls: int, num_calls: int
+) -> tuple[Event, int]:
+  """Runs slow function calls and returns the response and max concurrency."""
+  running = 0
+  max_running = 0
+
+  async def slow_tool(i: int, tool_context: ToolContext) -> int:
+    nonlocal running, max_running
+    running += 1
+    max_running = max(max_running, running)
+    # Later calls finish first.
+    await asyncio.sleep(0.01 * (num_calls - i))
+    tool_context.state[f'key_{i}'] = i
+    running -= 1
+    return i
+
+  tool = FunctionTool(slow_tool)
+  agent = Agent(name='root_agent', model='gemini-1.5-flash', tools=[tool])
+  invocation_context = await testing_utils.create_invocation_context(
+      agent=agent, user_content=''
+  )
+  invocation_context.run_config = RunConfig(
+      max_concurrent_function_calls=max_concurrent_function_calls
+  )
+
+  event = await handle_function_calls_async(
+      invocation_context, _function_call_event(num_calls), {tool.name: tool}
+  )
+  return event, max_running
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    'max_concurrent_function_calls, expected_max_running',
+    [(1, 1), (2, 2), (0, 4), (10, 4)],
+)
+async def test_max_concurrent_function_calls(
+    max_concurrent_function_calls, expected_max_running
+):
+  event, max_running = await _run_function_calls(
+      max_concurrent_function_calls, num_calls=4
+  )
+
+  assert max_running == expected_max_running
+  # The responses are in the order of the function calls.
+  assert [
+      (
+          function_response.id,
+          function_response.response,
+      )
+      for function_response in event.get_function_responses()
+  ] == [(f'call_{i}', {'result': i}) for i in range(4)]
+  # The actions of all function calls are kept.
+  assert event.actions.state_delta == {f'key_{i}': i for i in range(4)}
+
+
+@pytest.mark.asyncio
+async def test_concurrent_function_calls_cancelled_on_error():
+  cancelled = False
+
+  async def slow_tool() -> int:
+    nonlocal cancelled
+    try:
+      await asyncio.sleep(10)
+    except asyncio.CancelledError:
+      cancelled = True
+      raise
+    return 1
+
+  async def failing_tool() -> int:
+    raise ValueError('failed')
+
+  tools = [FunctionTool(slow_tool), FunctionTool(failing_tool)]
+  agent = Agent(name='root_agent', model='gemini-1.5-flash', tools=tools)
+  invocation_context = await testing_utils.create_invocation_context(
+      agent=agent, user_content=''
+  )
+  invocation_context.run_config = RunConfig(max_concurrent_function_calls=0)
+  function_call_event = Event(
+      author='root_agent',
+      content=types.Content(
+          role='model',
+          parts=[
+              types.Part.from_function_call(name='slow_tool', args={}),
+              types.Part.from_function_call(name='failing_tool', args={}),
+          ],
+      ),
+  )
+
+  with pytest.raises(ValueError, match='failed'):
+    await handle_function_calls_async(
+        invocation_context,
+        function_call_event,
+        {tool.name: tool for tool in tools},
+    )
+  await asyncio.sleep(0)
+  assert cancelled
+
+
+def test_merge_parallel_function_response_events_merges_actions():
+  events = [
+      Event(
+          author='root_agent',
+          content=types.Content(
+              role='user',
+              parts=[
+                  types.Part.from_function_response(
+                      name=f'tool_{i}', response={'result': i}
+                  )
+              ],
+          ),
+          actions=actions,
+      )
+      for i, actions in enumerate([
+          EventActions(
+              state_delta={'a': 1},
+              artifact_delta={'file_a': 0},
+              skip_summarization=True,
+          ),
+          EventActions(state_delta={'b': 2}, transfer_to_agent='other'),
+          EventActions(state_delta={'a': 3}),
+      ])
+  ]
+
+  merged_event = merge_parallel_function_response_events(events)
+
+  assert merged_event.actions.state_delta == {'a': 3, 'b': 2}
+  assert merged_event.actions.artifact_delta == {'file_a': 0}
+  assert merged_event.actions.skip_summarization
+  assert merged_event.actions.transfer_to_agent == 'other'
+  assert [
+      part.function_response.name for part in merged_event.content.parts
+  ] == ['tool_0', 'tool_1', 'tool_2']
@@ -140,3 +140,37 @@ async def test_after_model_callback_noop():
   assert testing_utils.simplify_events(
       await runner.run_async_with_new_session('test')
   ) == [('root_agent', 'model_response')]
+
+
+def test_before_model_callback_changes_do_not_affect_later_steps():
+  def get_weather(city: str) -> str:
+    """Gets the weather of a city."""
+    return 'sunny'
+
+  def change_declarations(
+      callback_context: CallbackContext, llm_request: LlmRequest
+  ) -> None:
+    for declaration in llm_request.config.tools[0].function_declarations:
+      declaration.description += ' Changed.'
+
+  mock_model = testing_utils.MockModel.create(
+      responses=[
+          types.Part.from_function_call(
+              name='get_weather', args={'city': 'Paris'}
+          ),
+          'response',
+      ]
+  )
+  agent = Agent(
+      name='root_agent',
+      model=mock_model,
+      tools=[get_weather],
+      before_model_callback=change_declarations,
+  )
+
+  testing_utils.InMemoryRunner(agent).run('test')
+
+  assert [
+      request.config.tools[0].function_declarations[0].description
+      for request in mock_model.requests
+  ] == ['Gets the weather of a city. Changed.'] * 2
@@ -0,0 +1,123 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from typing import Optional
+
+from google.adk.events import Event
+from google.adk.memory import InMemoryMemoryService
+from google.adk.sessions import Session
+from google.genai import types
+import pytest
+
+_APP_NAME = 'my_app'
+_USER_ID = 'user'
+
+
+def _session(session_id: str, texts: list[str]) -> Session:
+  return Session(
+      app_name=_APP_NAME,
+      user_id=_USER_ID,
+      id=session_id,
+      events=[
+          Event(
+              id=f'{session_id}_{i}',
+              author='user',
+              content=types.Content(role='user', parts=[types.Part(text=text)]),
+          )
+          for i, text in enumerate(texts)
+      ],
+  )
+
+
+async def _search(
+    memory_service: InMemoryMemoryService,
+    query: str,
+    user_id: str = _USER_ID,
+) -> list[str]:
+  response = await memory_service.search_memory(
+      app_name=_APP_NAME, user_id=user_id, query=query
+  )
+  return [memory.content.parts[0].text for memory in response.memories]
+
+
+@pytest.mark.asyncio
+async def test_search_ranks_matches():
+  memory_service = InMemoryMemoryService()
+  await memory_service.add_session_to_memory(
+      _session(
+          'session_1',
+          [
+              'The weather is sunny.',
+              'I like pizza.',
+              'Weather, weather, weather: rainy weather today.',
+          ],
+      )
+  )
+  await memory_service.add_session_to_memory(
+      _session('session_2', ['Pizza with pineapple?', 'Nothing here'])
+  )
+
+  assert await _search(memory_service, 'Weather?') == [
+      'Weather, weather, weather: rainy weather today.',
+      'The weather is sunny.',
+  ]
+  # Events with rare words rank higher.
+  assert (await _search(memory_service, 'pineapple weather'))[0] == (
+      'Pizza with pineapple?'
+  )
+  assert await _search(memory_service, 'unknown') == []
+  assert await _search(memory_service, 'pizza', user_id='other_user') == []
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('top_k, expected_count', [(2, 2), (None, 5)])
+async def test_search_top_k(top_k: Optional[int], expected_count: int):
+  memory_service = InMemoryMemoryService(top_k=top_k)
+  await memory_service.add_session_to_memory(
+      _session('session', [f'memory number {i}' for i in range(5)])
+  )
+
+  assert await _search(memory_service, 'memory') == [
+      f'memory number {i}' for i in range(expected_count)
+  ]
+
+
+@pytest.mark.asyncio
+async def test_add_session_again_updates_index():
+  memory_service = InMemoryMemoryService()
+  session = _session('session', ['apple'])
+  await memory_service.add_session_to_memory(session)
+
+  session.events.append(_session('new', ['banana']).events[0])
+  await memory_service.add_session_to_memory(session)
+  assert await _search(memory_service, 'apple banana') == ['apple', 'banana']
+
+  # The events are replaced if they are not an extension of the indexed ones.
+  await memory_service.add_session_to_memory(_session('session', ['cherry']))
+  assert await _search(memory_service, 'apple banana') == []
+  assert await _search(memory_service, 'cherry') == ['cherry']
+
+
+@pytest.mark.asyncio
+async def test_events_without_content_are_skipped():
+  memory_service = InMemoryMemoryService()
+  session = _session('session', ['apple'])
+  session.events.append(Event(author='agent'))
+  await memory_service.add_session_to_memory(session)
+
+  response = await memory_service.search_memory(
+      app_name=_APP_NAME, user_id=_USER_ID, query='apple'
+  )
+  assert len(response.memories) == 1
+  assert response.memories[0].author == 'user'
@@ -0,0 +1,176 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from google.adk.events import Event
+from google.adk.sessions import Session
+from google.genai import types
+import pytest
+
+np = pytest.importorskip('numpy')
+
+from google.adk.memory import HashingEmbedder
+from google.adk.memory import VectorMemoryService
+
+_APP_NAME = 'my_app'
+_USER_ID = 'user'
+
+
+class _CountingEmbedder(HashingEmbedder):
+  """Counts the embedded texts."""
+
+  def __init__(self):
+    super().__init__(dimension=64)
+    self.texts: list[str] = []
+
+  def __call__(self, texts: list[str]) -> np.ndarray:
+    self.texts.extend(texts)
+    return super().__call__(texts)
+
+
+def _session(session_id: str, texts: list[str]) -> Session:
+  return Session(
+      app_name=_APP_NAME,
+      user_id=_USER_ID,
+      id=session_id,
+      events=[
+          Event(
+              id=f'{session_id}_{i}',
+              author='user',
+              content=types.Content(role='user', parts=[types.Part(text=text)]),
+          )
+          for i, text in enumerate(texts)
+      ],
+  )
+
+
+async def _search(memory_service: VectorMemoryService, query: str) -> list[str]:
+  response = await memory_service.search_memory(
+      app_name=_APP_NAME, user_id=_USER_ID, query=query
+  )
+  return [memory.content.parts[0].text for memory in response.memories]
+
+
+def test_hashing_embedder_is_deterministic():
+  embedder = HashingEmbedder(dimension=32)
+  embeddings = embedder(['the weather is sunny', 'the weather is sunny', ''])
+
+  assert embeddings.shape == (3, 32)
+  np.testing.assert_array_equal(embeddings[0], embeddings[1])
+  assert not embeddings[2].any()
+
+
+@pytest.mark.asyncio
+async def test_search_returns_most_similar():
+  memory_service = VectorMemoryService(HashingEmbedder(), top_k=2)
+  await memory_service.add_session_to_memory(
+      _session(
+          'session',
+          [
+              'the weather is sunny today',
+              'my favorite food is pizza',
+              'pizza with pineapple is my favorite',
+              'rainy weather tomorrow',
+          ],
+      )
+  )
+
+  assert await _search(memory_service, 'favorite pizza') == [
+      'my favorite food is pizza',
+      'pizza with pineapple is my favorite',
+  ]
+  assert await _search(memory_service, 'unknown') == []
+  response = await memory_service.search_memory(
+      app_name=_APP_NAME, user_id='other_user', query='pizza'
+  )
+  assert not response.memories
+
+
+@pytest.mark.asyncio
+async def test_add_session_again_embeds_only_new_events():
+  embedder = _CountingEmbedder()
+  memory_service = VectorMemoryService(embedder)
+  session = _session('session', ['apple'])
+  session.events.append(Event(author='agent'))
+  await memory_service.add_session_to_memory(session)
+
+  session.events.extend(_session('new', ['banana', 'cherry']).events)
+  await memory_service.add_session_to_memory(session)
+
+  assert embedder.texts == ['apple', 'banana', 'cherry']
+  assert (await _search(memory_service, 'banana'))[0] == 'banana'
+
+
+@pytest.mark.asyncio
+async def test_async_embedding_function():
+  embedder = HashingEmbedder()
+
+  async def embed(texts: list[str]) -> np.ndarray:
+    return embedder(texts)
+
+  memory_service = VectorMemoryService(embed)
+  await memory_service.add_session_to_memory(_session('session', ['apple']))
+
+  assert await _search(memory_service, 'apple') == ['apple']
+
+
+@pytest.mark.asyncio
+async def test_embeddings_grow_past_capacity():
+  memory_service = VectorMemoryService(HashingEmbedder(), top_k=1)
+  for i in range(100):
+    await memory_service.add_session_to_memory(
+        _session(f'session_{i}', [f'memory {i} word{i}'])
+    )
+
+  assert await _search(memory_service, 'word57') == ['memory 57 word57']
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('mmap', [True, False])
+async def test_save_and_load(tmp_path, mmap: bool):
+  storage_dir = str(tmp_path / 'memory')
+  memory_service = VectorMemoryService(
+      HashingEmbedder(), storage_dir=storage_dir
+  )
+  await memory_service.add_session_to_memory(
+      _session('session', ['apple pie', 'banana bread'])
+  )
+  memory_service.save()
+
+  embedder = _CountingEmbedder()
+  embedder.dimension = 256
+  loaded_service = VectorMemoryService(
+      embedder, storage_dir=storage_dir, mmap=mmap
+  )
+  assert (await _search(loaded_service, 'banana'))[0] == 'banana bread'
+  # Loaded events are not embedded again, and new events are appended.
+  await loaded_service.add_session_to_memory(
+      _session('session', ['apple pie', 'banana bread', 'cherry cake'])
+  )
+  assert embedder.texts == ['banana', 'cherry cake']
+  assert (await _search(loaded_service, 'cherry'))[0] == 'cherry cake'
+
+
+def test_save_without_storage_dir():
+  with pytest.raises(ValueError, match='storage_dir'):
+    VectorMemoryService(HashingEmbedder()).save()
+
+
+@pytest.mark.asyncio
+async def test_embedding_dimension_mismatch():
+  memory_service = VectorMemoryService(HashingEmbedder(dimension=8))
+  await memory_service.add_session_to_memory(_session('session_1', ['apple']))
+  memory_service._embedding_function = HashingEmbedder(dimension=16)
+
+  with pytest.raises(ValueError, match='dimension'):
+    await memory_service.add_session_to_memory(_session('session_2', ['pie']))
@@ -12,14 +12,18 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import logging
 import os
 import sys
 from unittest import mock
 
 from google.adk import version as adk_version
+from google.adk.models import _logging_util
 from google.adk.models.gemini_llm_connection import GeminiLlmConnection
 from google.adk.models.google_llm import _AGENT_ENGINE_TELEMETRY_ENV_VARIABLE_NAME
 from google.adk.models.google_llm import _AGENT_ENGINE_TELEMETRY_TAG
+from google.adk.models.google_llm import _build_request_log
+from google.adk.models.google_llm import _log_response
 from google.adk.models.google_llm import Gemini
 from google.adk.models.llm_request import LlmRequest
 from google.adk.models.llm_response import LlmResponse
@@ -337,3 +341,78 @@ async def test_connect(gemini_llm, llm_request):
   ):
     async with gemini_llm.connect(llm_request) as connection:
       assert connection is mock_connection
+
+
+@pytest.mark.asyncio
+async def test_generate_content_async_skips_logs_if_info_disabled(
+    gemini_llm, llm_request, generate_content_response, caplog
+):
+  with (
+      mock.patch.object(gemini_llm, "api_client") as mock_client,
+      mock.patch(
+          "google.adk.models.google_llm._build_request_log"
+      ) as mock_build_request_log,
+      mock.patch(
+          "google.adk.models.google_llm._build_response_log"
+      ) as mock_build_response_log,
+  ):
+
+    async def mock_coro():
+      return generate_content_response
+
+    mock_client.aio.models.generate_content.return_value = mock_coro()
+
+    with caplog.at_level(logging.WARNING, logger="google_adk"):
+      async for _ in gemini_llm.generate_content_async(llm_request):
+        pass
+
+    mock_build_request_log.assert_not_called()
+    mock_build_response_log.assert_not_called()
+
+
+def test_build_request_log_truncates_at_info_level(llm_request):
+  llm_request.contents = [
+      Content(role="user", parts=[Part.from_text(text=f"{i}" * 5000)])
+      for i in range(_logging_util.MAX_LOG_CONTENTS + 5)
+  ]
+
+  full_log = _build_request_log(llm_request)
+  truncated_log = _build_request_log(
+      llm_request,
+      _logging_util.MAX_LOG_VALUE_CHARS,
+      _logging_util.MAX_LOG_CONTENTS,
+  )
+
+  assert "0" * 5000 in full_log
+  assert "omitted" not in full_log
+  assert "(5 earlier values omitted)" in truncated_log
+  assert "0" * 100 not in truncated_log
+  assert "more characters)" in truncated_log
+  assert len(truncated_log) < _logging_util.MAX_LOG_CONTENTS * (
+      _logging_util.MAX_LOG_VALUE_CHARS + 100
+  )
+
+
+@pytest.mark.parametrize(
+    "level, finish_reason, expected_logged",
+    [
+        (logging.DEBUG, None, True),
+        (logging.INFO, None, False),
+        (logging.INFO, types.FinishReason.STOP, True),
+        (logging.WARNING, types.FinishReason.STOP, False),
+    ],
+)
+def test_log_response_chunk(level, finish_reason, expected_logged, caplog):
+  response = types.GenerateContentResponse(
+      candidates=[
+          types.Candidate(
+              content=Content(role="model", parts=[Part.from_text(text="Hi")]),
+              finish_reason=finish_reason,
+          )
+      ]
+  )
+
+  with caplog.at_level(level, logger="google_adk"):
+    _log_response(response, is_chunk=True)
+
+  assert ("LLM Response" in caplog.text) == expected_logged
@@ -12,7 +12,10 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
+
 from google.adk import models
+from google.adk.models import registry
 from google.adk.models.anthropic_llm import Claude
 from google.adk.models.google_llm import Gemini
 from google.adk.models.registry import LLMRegistry
@@ -60,3 +63,54 @@ def test_non_exist_model():
   with pytest.raises(ValueError) as e_info:
     models.LLMRegistry.resolve('non-exist-model')
   assert 'Model non-exist-model not found.' in str(e_info.value)
+
+
+@pytest.mark.asyncio
+async def test_get_llm_reuses_instance_in_event_loop():
+  llm = LLMRegistry.get_llm('gemini-1.5-flash')
+
+  assert isinstance(llm, Gemini)
+  assert LLMRegistry.get_llm('gemini-1.5-flash') is llm
+  assert LLMRegistry.get_llm('gemini-1.5-pro') is not llm
+  assert LLMRegistry.new_llm('gemini-1.5-flash') is not llm
+
+
+@pytest.mark.asyncio
+async def test_get_llm_does_not_share_instances_across_client_configs(
+    monkeypatch,
+):
+  monkeypatch.setenv('GOOGLE_API_KEY', 'agent_1_key')
+  llm = LLMRegistry.get_llm('gemini-1.5-flash')
+
+  monkeypatch.setenv('GOOGLE_API_KEY', 'agent_2_key')
+  assert LLMRegistry.get_llm('gemini-1.5-flash') is not llm
+
+  monkeypatch.setenv('GOOGLE_API_KEY', 'agent_1_key')
+  assert LLMRegistry.get_llm('gemini-1.5-flash') is llm
+
+
+def test_get_llm_drops_instances_of_closed_loops():
+  async def get_llm():
+    return asyncio.get_running_loop(), LLMRegistry.get_llm('gemini-1.5-flash')
+
+  first_loop, first_llm = asyncio.run(get_llm())
+  second_loop, second_llm = asyncio.run(get_llm())
+
+  assert second_llm is not first_llm
+  assert first_loop not in registry._llm_instances
+  assert second_loop in registry._llm_instances
+
+
+def test_get_llm_outside_event_loop_returns_new_instance():
+  assert LLMRegistry.get_llm('gemini-1.5-flash') is not LLMRegistry.get_llm(
+      'gemini-1.5-flash'
+  )
+
+
+@pytest.mark.asyncio
+async def test_register_clears_shared_instances():
+  llm = LLMRegistry.get_llm('gemini-1.5-flash')
+
+  LLMRegistry.register(Gemini)
+
+  assert LLMRegistry.get_llm('gemini-1.5-flash') is not llm
@@ -0,0 +1,121 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import copy
+import random
+
+from google.adk.events import Event
+from google.adk.sessions import InMemorySessionService
+from google.adk.sessions import Session
+from google.adk.sessions._event_index import EventIndex
+from google.genai import types
+import pytest
+
+_AUTHORS = ['user', 'agent_1', 'agent_2']
+_CALL_IDS = ['call_1', 'call_2', 'call_3', None]
+
+
+def _random_event(rng: random.Random) -> Event:
+  parts = []
+  for _ in range(rng.randint(0, 3)):
+    call_id = rng.choice(_CALL_IDS)
+    if rng.random() < 0.5:
+      parts.append(
+          types.Part(function_call=types.FunctionCall(id=call_id, name='f'))
+      )
+    else:
+      parts.append(
+          types.Part(
+              function_response=types.FunctionResponse(
+                  id=call_id, name='f', response={}
+              )
+          )
+      )
+  return Event(
+      author=rng.choice(_AUTHORS),
+      content=types.Content(role='model', parts=parts) if parts else None,
+  )
+
+
+def _assert_matches_scan(event_index: EventIndex, events: list[Event]):
+  for call_id in _CALL_IDS:
+    assert event_index.get_function_call_indices(call_id) == [
+        i
+        for i, event in enumerate(events)
+        if any(call.id == call_id for call in event.get_function_calls())
+    ]
+    assert event_index.get_function_response_indices(call_id) == [
+        i
+        for i, event in enumerate(events)
+        if any(
+            response.id == call_id
+            for response in event.get_function_responses()
+        )
+    ]
+  assert event_index.get_function_call_event_indices() == [
+      i for i, event in enumerate(events) if event.get_function_calls()
+  ]
+  for author in _AUTHORS:
+    assert event_index.get_last_author_index(author) == max(
+        (i for i, event in enumerate(events) if event.author == author),
+        default=None,
+    )
+  assert event_index.get_authors() == list(
+      dict.fromkeys(event.author for event in reversed(events))
+  )
+
+
+@pytest.mark.parametrize('seed', range(20))
+def test_index_matches_scan(seed: int):
+  rng = random.Random(seed)
+  event_index = EventIndex()
+  events: list[Event] = []
+
+  for _ in range(rng.randint(1, 8)):
+    for _ in range(rng.randint(0, 5)):
+      events.append(_random_event(rng))
+    if rng.random() < 0.2:
+      # The events are replaced, e.g. when a session is reloaded.
+      events = [copy.copy(event) for event in events[: rng.randint(0, 5)]]
+    _assert_matches_scan(event_index.update(events), events)
+
+
+@pytest.mark.asyncio
+async def test_append_event_updates_session_index():
+  session_service = InMemorySessionService()
+  session = await session_service.create_session(
+      app_name='my_app', user_id='user'
+  )
+  await session_service.append_event(session, Event(author='agent'))
+  await session_service.append_event(session, Event(author='user'))
+
+  event_index = session._event_index
+  assert event_index.get_authors() == ['user', 'agent']
+  assert session.get_event_index() is event_index
+
+
+def test_session_copies_do_not_share_index():
+  session = Session(
+      app_name='my_app',
+      user_id='user',
+      id='session',
+      events=[Event(author='agent')],
+  )
+  session.get_event_index()
+
+  copied_session = session.model_copy(update={'events': []})
+
+  assert copied_session.get_event_index().get_authors() == []
+  assert session.get_event_index().get_authors() == ['agent']
+  assert copied_session.model_copy(update={'events': session.events}) == session
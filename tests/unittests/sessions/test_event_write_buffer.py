@@ -0,0 +1,215 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+
+from google.adk.agents import Agent
+from google.adk.agents import BaseAgent
+from google.adk.agents.run_config import EventWriteBehindConfig
+from google.adk.agents.run_config import RunConfig
+from google.adk.events import Event
+from google.adk.events import EventActions
+from google.adk.runners import Runner
+from google.adk.sessions import InMemorySessionService
+from google.adk.sessions import Session
+from google.adk.sessions._event_write_buffer import EventWriteBuffer
+import pytest
+
+from .. import testing_utils
+
+
+class _RecordingSessionService(InMemorySessionService):
+  """Records the batches of stored events, storing each batch slowly."""
+
+  def __init__(self, delay: float = 0, fail: bool = False):
+    super().__init__()
+    self.batches: list[list[str]] = []
+    self.delay = delay
+    self.fail = fail
+
+  async def append_events(
+      self, session: Session, events: list[Event]
+  ) -> list[Event]:
+    await asyncio.sleep(self.delay)
+    if self.fail:
+      raise ValueError('storage failed')
+    self.batches.append([event.id for event in events])
+    return await super().append_events(session, events)
+
+
+async def _create_buffer(
+    session_service: InMemorySessionService, **kwargs
+) -> tuple[Session, EventWriteBuffer]:
+  session = await session_service.create_session(
+      app_name='my_app', user_id='user'
+  )
+  kwargs = {
+      'flush_interval_secs': 10,
+      'max_batch_size': 3,
+      'max_pending_events': 100,
+      **kwargs,
+  }
+  return session, EventWriteBuffer(session_service, session, **kwargs)
+
+
+def _stored_event_ids(session_service, session: Session) -> list[str]:
+  stored_session = session_service.get_session_sync(
+      app_name=session.app_name, user_id=session.user_id, session_id=session.id
+  )
+  return [event.id for event in stored_session.events]
+
+
+@pytest.mark.asyncio
+async def test_events_applied_in_memory_and_stored_in_batches():
+  session_service = _RecordingSessionService()
+  session, buffer = await _create_buffer(session_service)
+  events = [
+      Event(author='agent', actions=EventActions(state_delta={'key': i}))
+      for i in range(7)
+  ]
+
+  for event in events:
+    await buffer.append_event(event)
+  # The events are applied to the in-memory session right away.
+  assert [event.id for event in session.events] == [e.id for e in events]
+  assert session.state == {'key': 6}
+
+  await buffer.close()
+
+  ids = [event.id for event in events]
+  assert session_service.batches == [ids[0:3], ids[3:6], ids[6:]]
+  assert _stored_event_ids(session_service, session) == ids
+  stored_session = await session_service.get_session(
+      app_name=session.app_name, user_id=session.user_id, session_id=session.id
+  )
+  assert stored_session.state == {'key': 6}
+
+
+@pytest.mark.asyncio
+async def test_partial_events_not_stored():
+  session_service = _RecordingSessionService()
+  session, buffer = await _create_buffer(session_service)
+
+  await buffer.append_event(Event(author='agent', partial=True))
+  await buffer.close()
+
+  assert session_service.batches == []
+
+
+@pytest.mark.asyncio
+async def test_events_stored_after_flush_interval():
+  session_service = _RecordingSessionService()
+  session, buffer = await _create_buffer(
+      session_service, flush_interval_secs=0.01
+  )
+  event = Event(author='agent')
+
+  await buffer.append_event(event)
+  await asyncio.sleep(0.1)
+
+  assert _stored_event_ids(session_service, session) == [event.id]
+  await buffer.close()
+  assert session_service.batches == [[event.id]]
+
+
+@pytest.mark.asyncio
+async def test_append_event_waits_for_pending_events():
+  session_service = _RecordingSessionService(delay=0.05)
+  session, buffer = await _create_buffer(
+      session_service, max_batch_size=1, max_pending_events=1
+  )
+
+  await buffer.append_event(Event(author='agent'))
+  await asyncio.sleep(0)
+  # The first event is being stored, and the second one is queued.
+  await buffer.append_event(Event(author='agent'))
+  append_task = asyncio.create_task(buffer.append_event(Event(author='agent')))
+  await asyncio.sleep(0.01)
+  assert not append_task.done()
+
+  await append_task
+  await buffer.close()
+  assert len(session_service.batches) == 3
+
+
+@pytest.mark.asyncio
+async def test_storage_error_raised():
+  session_service = _RecordingSessionService(fail=True)
+  session, buffer = await _create_buffer(session_service, max_batch_size=1)
+
+  await buffer.append_event(Event(author='agent'))
+  await asyncio.sleep(0.01)
+  with pytest.raises(ValueError, match='storage failed'):
+    await buffer.append_event(Event(author='agent'))
+  with pytest.raises(ValueError, match='storage failed'):
+    await buffer.close()
+
+
+@pytest.mark.asyncio
+async def test_runner_stores_events_behind_the_run():
+  session_service = _RecordingSessionService(delay=0.01)
+  mock_model = testing_utils.MockModel.create(responses=['response'])
+  runner = Runner(
+      app_name='my_app',
+      agent=Agent(name='root_agent', model=mock_model),
+      session_service=session_service,
+  )
+  session = await session_service.create_session(
+      app_name='my_app', user_id='user'
+  )
+
+  events = [
+      event
+      async for event in runner.run_async(
+          user_id='user',
+          session_id=session.id,
+          new_message=testing_utils.UserContent('hello'),
+          run_config=RunConfig(event_write_behind=EventWriteBehindConfig()),
+      )
+  ]
+
+  assert testing_utils.simplify_events(events) == [('root_agent', 'response')]
+  assert session_service.batches == [[events[0].id]]
+  stored_events = _stored_event_ids(session_service, session)
+  assert stored_events[1:] == [events[0].id]
+
+
+class _FailingAgent(BaseAgent):
+  """Yields an event, then fails."""
+
+  async def _run_async_impl(self, ctx):
+    yield Event(author=self.name, invocation_id=ctx.invocation_id)
+    raise RuntimeError('agent failed')
+
+
+@pytest.mark.asyncio
+async def test_runner_raises_agent_error_when_flush_fails_too():
+  session_service = _RecordingSessionService(fail=True)
+  runner = Runner(
+      app_name='my_app',
+      agent=_FailingAgent(name='root_agent'),
+      session_service=session_service,
+  )
+  session = await session_service.create_session(
+      app_name='my_app', user_id='user'
+  )
+
+  with pytest.raises(RuntimeError, match='agent failed'):
+    async for _ in runner.run_async(
+        user_id='user',
+        session_id=session.id,
+        new_message=testing_utils.UserContent('hello'),
+        run_config=RunConfig(event_write_behind=EventWriteBehindConfig()),
+    ):
+      pass
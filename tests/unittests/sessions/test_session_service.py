@@ -16,6 +16,7 @@ import enum
 
 from google.adk.events import Event
 from google.adk.events import EventActions
+from google.adk.sessions import AsyncDatabaseSessionService
 from google.adk.sessions import DatabaseSessionService
 from google.adk.sessions import InMemorySessionService
 from google.adk.sessions.base_session_service import GetSessionConfig
@@ -26,6 +27,7 @@ import pytest
 class SessionServiceType(enum.Enum):
   IN_MEMORY = 'IN_MEMORY'
   DATABASE = 'DATABASE'
+  ASYNC_DATABASE = 'ASYNC_DATABASE'
 
 
 def get_session_service(
@@ -34,12 +36,19 @@ def get_session_service(
   """Creates a session service for testing."""
   if service_type == SessionServiceType.DATABASE:
     return DatabaseSessionService('sqlite:///:memory:')
+  if service_type == SessionServiceType.ASYNC_DATABASE:
+    return AsyncDatabaseSessionService('sqlite+aiosqlite:///:memory:')
   return InMemorySessionService()
 
 
 @pytest.mark.asyncio
 @pytest.mark.parametrize(
-    'service_type', [SessionServiceType.IN_MEMORY, SessionServiceType.DATABASE]
+    'service_type',
+    [
+        SessionServiceType.IN_MEMORY,
+        SessionServiceType.DATABASE,
+        SessionServiceType.ASYNC_DATABASE,
+    ],
 )
 async def test_get_empty_session(service_type):
   session_service = get_session_service(service_type)
@@ -50,7 +59,12 @@ async def test_get_empty_session(service_type):
 
 @pytest.mark.asyncio
 @pytest.mark.parametrize(
-    'service_type', [SessionServiceType.IN_MEMORY, SessionServiceType.DATABASE]
+    'service_type',
+    [
+        SessionServiceType.IN_MEMORY,
+        SessionServiceType.DATABASE,
+        SessionServiceType.ASYNC_DATABASE,
+    ],
 )
 async def test_create_get_session(service_type):
   session_service = get_session_service(service_type)
@@ -87,7 +101,12 @@ async def test_create_get_session(service_type):
 
 @pytest.mark.asyncio
 @pytest.mark.parametrize(
-    'service_type', [SessionServiceType.IN_MEMORY, SessionServiceType.DATABASE]
+    'service_type',
+    [
+        SessionServiceType.IN_MEMORY,
+        SessionServiceType.DATABASE,
+        SessionServiceType.ASYNC_DATABASE,
+    ],
 )
 async def test_create_and_list_sessions(service_type):
   session_service = get_session_service(service_type)
@@ -110,7 +129,12 @@ async def test_create_and_list_sessions(service_type):
 
 @pytest.mark.asyncio
 @pytest.mark.parametrize(
-    'service_type', [SessionServiceType.IN_MEMORY, SessionServiceType.DATABASE]
+    'service_type',
+    [
+        SessionServiceType.IN_MEMORY,
+        SessionServiceType.DATABASE,
+        SessionServiceType.ASYNC_DATABASE,
+    ],
 )
 async def test_session_state(service_type):
   session_service = get_session_service(service_type)
@@ -190,7 +214,12 @@ async def test_session_state(service_type):
 
 @pytest.mark.asyncio
 @pytest.mark.parametrize(
-    'service_type', [SessionServiceType.IN_MEMORY, SessionServiceType.DATABASE]
+    'service_type',
+    [
+        SessionServiceType.IN_MEMORY,
+        SessionServiceType.DATABASE,
+        SessionServiceType.ASYNC_DATABASE,
+    ],
 )
 async def test_create_new_session_will_merge_states(service_type):
   session_service = get_session_service(service_type)
@@ -236,7 +265,12 @@ async def test_create_new_session_will_merge_states(service_type):
 
 @pytest.mark.asyncio
 @pytest.mark.parametrize(
-    'service_type', [SessionServiceType.IN_MEMORY, SessionServiceType.DATABASE]
+    'service_type',
+    [
+        SessionServiceType.IN_MEMORY,
+        SessionServiceType.DATABASE,
+        SessionServiceType.ASYNC_DATABASE,
+    ],
 )
 async def test_append_event_bytes(service_type):
   session_service = get_session_service(service_type)
@@ -277,7 +311,12 @@ async def test_append_event_bytes(service_type):
 
 @pytest.mark.asyncio
 @pytest.mark.parametrize(
-    'service_type', [SessionServiceType.IN_MEMORY, SessionServiceType.DATABASE]
+    'service_type',
+    [
+        SessionServiceType.IN_MEMORY,
+        SessionServiceType.DATABASE,
+        SessionServiceType.ASYNC_DATABASE,
+    ],
 )
 async def test_append_event_complete(service_type):
   session_service = get_session_service(service_type)
@@ -317,7 +356,12 @@ async def test_append_event_complete(service_type):
 
 @pytest.mark.asyncio
 @pytest.mark.parametrize(
-    'service_type', [SessionServiceType.IN_MEMORY, SessionServiceType.DATABASE]
+    'service_type',
+    [
+        SessionServiceType.IN_MEMORY,
+        SessionServiceType.DATABASE,
+        SessionServiceType.ASYNC_DATABASE,
+    ],
 )
 async def test_get_session_with_config(service_type):
   session_service = get_session_service(service_type)
@@ -377,3 +421,207 @@ async def test_get_session_with_config(service_type):
   )
   events = session.events
   assert len(events) == num_test_events - after_timestamp + 1
+
+
+@pytest.mark.asyncio
+async def test_share_events_snapshot_isolation():
+  session_service = InMemorySessionService(share_events=True)
+  app_name = 'my_app'
+  user_id = 'user'
+
+  session = await session_service.create_session(
+      app_name=app_name, user_id=user_id, state={'key': 'value'}
+  )
+  event = Event(
+      invocation_id='invocation',
+      author='user',
+      content=types.Content(role='user', parts=[types.Part(text='text')]),
+      actions=EventActions(state_delta={'key': 'new_value'}),
+  )
+  await session_service.append_event(session=session, event=event)
+
+  snapshot = await session_service.get_session(
+      app_name=app_name, user_id=user_id, session_id=session.id
+  )
+  assert snapshot == session
+  # The events are shared with the storage, the containers are not.
+  assert snapshot.events[0] is event
+  assert snapshot.events is not session.events
+  assert snapshot.state is not session.state
+
+  snapshot.events.append(Event(author='user'))
+  snapshot.state['key'] = 'changed'
+  stored_session = await session_service.get_session(
+      app_name=app_name, user_id=user_id, session_id=session.id
+  )
+  assert len(stored_session.events) == 1
+  assert stored_session.state['key'] == 'new_value'
+
+
+@pytest.mark.asyncio
+async def test_share_events_get_session_with_config():
+  session_service = InMemorySessionService(share_events=True)
+  app_name = 'my_app'
+  user_id = 'user'
+
+  session = await session_service.create_session(
+      app_name=app_name, user_id=user_id
+  )
+  for i in range(1, 6):
+    await session_service.append_event(
+        session, Event(author='user', timestamp=i)
+    )
+
+  config = GetSessionConfig(num_recent_events=3, after_timestamp=4.0)
+  session = await session_service.get_session(
+      app_name=app_name, user_id=user_id, session_id=session.id, config=config
+  )
+  assert [event.timestamp for event in session.events] == [4, 5]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('share_events', [True, False])
+async def test_list_sessions_without_events(share_events):
+  session_service = InMemorySessionService(share_events=share_events)
+  app_name = 'my_app'
+  user_id = 'user'
+
+  session = await session_service.create_session(
+      app_name=app_name, user_id=user_id, state={'key': 'value'}
+  )
+  await session_service.append_event(session, Event(author='user'))
+
+  sessions = (
+      await session_service.list_sessions(app_name=app_name, user_id=user_id)
+  ).sessions
+  assert len(sessions) == 1
+  assert sessions[0].id == session.id
+  assert not sessions[0].events
+  assert not sessions[0].state
+  # Listing does not clear the stored session.
+  stored_session = await session_service.get_session(
+      app_name=app_name, user_id=user_id, session_id=session.id
+  )
+  assert len(stored_session.events) == 1
+  assert stored_session.state == {'key': 'value'}
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    'service_type',
+    [SessionServiceType.DATABASE, SessionServiceType.ASYNC_DATABASE],
+)
+async def test_append_event_to_stale_session(service_type):
+  session_service = get_session_service(service_type)
+  app_name = 'my_app'
+  user_id = 'user'
+
+  session = await session_service.create_session(
+      app_name=app_name, user_id=user_id
+  )
+  session.last_update_time -= 10
+
+  with pytest.raises(ValueError, match='stale session'):
+    await session_service.append_event(
+        session,
+        Event(author='user', actions=EventActions(state_delta={'key': 'v'})),
+    )
+
+  # Nothing is stored for the stale session.
+  stored_session = await session_service.get_session(
+      app_name=app_name, user_id=user_id, session_id=session.id
+  )
+  assert not stored_session.events
+  assert 'key' not in stored_session.state
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    'service_type',
+    [SessionServiceType.DATABASE, SessionServiceType.ASYNC_DATABASE],
+)
+async def test_append_event_updates_only_changed_state(service_type):
+  session_service = get_session_service(service_type)
+  app_name = 'my_app'
+  user_id = 'user'
+
+  session = await session_service.create_session(
+      app_name=app_name,
+      user_id=user_id,
+      state={'key1': 'value1', 'app:key1': 'value1', 'user:key1': 'value1'},
+  )
+  await session_service.append_event(
+      session,
+      Event(
+          author='user',
+          actions=EventActions(
+              state_delta={'key2': 'value2', 'app:key2': 'value2'}
+          ),
+      ),
+  )
+  await session_service.append_event(
+      session,
+      Event(
+          author='user',
+          actions=EventActions(state_delta={'user:key1': 'value1_new'}),
+      ),
+  )
+  await session_service.append_event(session, Event(author='user'))
+
+  stored_session = await session_service.get_session(
+      app_name=app_name, user_id=user_id, session_id=session.id
+  )
+  assert stored_session.state == {
+      'key1': 'value1',
+      'key2': 'value2',
+      'app:key1': 'value1',
+      'app:key2': 'value2',
+      'user:key1': 'value1_new',
+  }
+  assert stored_session.last_update_time == session.last_update_time
+  assert len(stored_session.events) == 3
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    'service_type',
+    [
+        SessionServiceType.IN_MEMORY,
+        SessionServiceType.DATABASE,
+        SessionServiceType.ASYNC_DATABASE,
+    ],
+)
+async def test_append_events(service_type):
+  session_service = get_session_service(service_type)
+  app_name = 'my_app'
+  user_id = 'user'
+
+  session = await session_service.create_session(
+      app_name=app_name, user_id=user_id
+  )
+  events = [
+      Event(
+          author='user',
+          content=types.Content(role='user', parts=[types.Part(text='hi')]),
+          actions=EventActions(state_delta={'key': 'value1', 'app:key': 1}),
+      ),
+      Event(author='agent', partial=True),
+      Event(
+          author='agent',
+          actions=EventActions(
+              state_delta={'key': 'value2', 'temp:key': 'temp'}
+          ),
+      ),
+  ]
+  assert await session_service.append_events(session, events) == events
+
+  assert [event.author for event in session.events] == ['user', 'agent']
+  stored_session = await session_service.get_session(
+      app_name=app_name, user_id=user_id, session_id=session.id
+  )
+  assert [event.id for event in stored_session.events] == [
+      events[0].id,
+      events[2].id,
+  ]
+  assert stored_session.state == {'key': 'value2', 'app:key': 1}
+  assert stored_session.last_update_time == session.last_update_time
@@ -18,11 +18,14 @@ from typing import Dict
 from typing import Optional
 from unittest import mock
 
+from google.adk import telemetry
 from google.adk.agents.invocation_context import InvocationContext
 from google.adk.agents.llm_agent import LlmAgent
 from google.adk.models.llm_request import LlmRequest
 from google.adk.models.llm_response import LlmResponse
 from google.adk.sessions import InMemorySessionService
+from google.adk.telemetry import PayloadCapture
+from google.adk.telemetry import TelemetryPolicy
 from google.adk.telemetry import trace_call_llm
 from google.adk.telemetry import trace_merged_tool_calls
 from google.adk.telemetry import trace_tool_call
@@ -294,3 +297,178 @@ def test_trace_merged_tool_calls_sets_correct_attributes(
       expected_calls, any_order=True
   )
   mock_event_fixture.model_dumps_json.assert_called_once_with(exclude_none=True)
+
+
+@pytest.fixture
+def telemetry_policy_fixture():
+  policy = telemetry.get_telemetry_policy()
+  yield
+  telemetry.set_telemetry_policy(policy)
+
+
+def _llm_request_with_contents(num_contents: int) -> LlmRequest:
+  return LlmRequest(
+      contents=[
+          types.Content(role='user', parts=[types.Part(text=f'text_{i}' * 100)])
+          for i in range(num_contents)
+      ],
+      config=types.GenerateContentConfig(system_instruction=''),
+  )
+
+
+def _span_attributes(mock_span: mock.MagicMock) -> dict[str, Any]:
+  return {
+      call_obj.args[0]: call_obj.args[1]
+      for call_obj in mock_span.set_attribute.call_args_list
+  }
+
+
+@pytest.mark.asyncio
+async def test_trace_call_llm_skips_span_not_recording(
+    monkeypatch, mock_span_fixture
+):
+  monkeypatch.setattr(
+      'opentelemetry.trace.get_current_span', lambda: mock_span_fixture
+  )
+  mock_span_fixture.is_recording.return_value = False
+  llm_request = mock.MagicMock()
+  llm_response = mock.MagicMock()
+
+  invocation_context = await _create_invocation_context(
+      LlmAgent(name='test_agent')
+  )
+  trace_call_llm(invocation_context, 'test_event_id', llm_request, llm_response)
+
+  mock_span_fixture.set_attribute.assert_not_called()
+  llm_response.model_dump_json.assert_not_called()
+  assert not llm_request.mock_calls
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    'payload_capture, expected_attributes',
+    [
+        (PayloadCapture.OFF, set()),
+        (
+            PayloadCapture.METADATA,
+            {
+                'gen_ai.system',
+                'gen_ai.request.model',
+                'gcp.vertex.agent.invocation_id',
+                'gcp.vertex.agent.session_id',
+                'gcp.vertex.agent.event_id',
+            },
+        ),
+    ],
+)
+async def test_trace_call_llm_without_payloads(
+    monkeypatch,
+    mock_span_fixture,
+    telemetry_policy_fixture,
+    payload_capture,
+    expected_attributes,
+):
+  monkeypatch.setattr(
+      'opentelemetry.trace.get_current_span', lambda: mock_span_fixture
+  )
+  telemetry.set_telemetry_policy(
+      TelemetryPolicy(payload_capture=payload_capture)
+  )
+
+  invocation_context = await _create_invocation_context(
+      LlmAgent(name='test_agent')
+  )
+  trace_call_llm(
+      invocation_context,
+      'test_event_id',
+      _llm_request_with_contents(3),
+      LlmResponse(turn_complete=True),
+  )
+
+  assert set(_span_attributes(mock_span_fixture)) == expected_attributes
+
+
+@pytest.mark.asyncio
+async def test_trace_call_llm_truncates_payloads(
+    monkeypatch, mock_span_fixture, telemetry_policy_fixture
+):
+  monkeypatch.setattr(
+      'opentelemetry.trace.get_current_span', lambda: mock_span_fixture
+  )
+  telemetry.set_telemetry_policy(
+      TelemetryPolicy(
+          payload_capture=PayloadCapture.TRUNCATED,
+          max_payload_chars=1000,
+          max_payload_contents=2,
+      )
+  )
+
+  invocation_context = await _create_invocation_context(
+      LlmAgent(name='test_agent')
+  )
+  trace_call_llm(
+      invocation_context,
+      'test_event_id',
+      _llm_request_with_contents(10),
+      LlmResponse(turn_complete=True),
+  )
+
+  llm_request_json = _span_attributes(mock_span_fixture)[
+      'gcp.vertex.agent.llm_request'
+  ]
+  assert llm_request_json.endswith('...<truncated>')
+  assert len(llm_request_json) == 1000 + len('...<truncated>')
+  assert '"num_omitted_contents": 8' in llm_request_json
+  assert 'text_7' not in llm_request_json
+  assert 'text_8' in llm_request_json
+
+
+def test_trace_tool_call_metadata_only(
+    monkeypatch,
+    mock_span_fixture,
+    mock_tool_fixture,
+    mock_event_fixture,
+    telemetry_policy_fixture,
+):
+  monkeypatch.setattr(
+      'opentelemetry.trace.get_current_span', lambda: mock_span_fixture
+  )
+  telemetry.set_telemetry_policy(
+      TelemetryPolicy(payload_capture=PayloadCapture.METADATA)
+  )
+  mock_event_fixture.id = 'event_id'
+  mock_event_fixture.content = types.Content(role='user', parts=[])
+
+  trace_tool_call(
+      tool=mock_tool_fixture,
+      args={'param': 'value'},
+      function_response_event=mock_event_fixture,
+  )
+
+  attributes = _span_attributes(mock_span_fixture)
+  assert attributes['gen_ai.tool.name'] == 'sample_tool'
+  assert 'gcp.vertex.agent.tool_call_args' not in attributes
+  assert 'gcp.vertex.agent.tool_response' not in attributes
+
+
+def test_default_telemetry_policy_from_env(monkeypatch):
+  monkeypatch.setenv('ADK_TELEMETRY_PAYLOADS', 'Metadata')
+  assert (
+      telemetry._default_telemetry_policy().payload_capture
+      == PayloadCapture.METADATA
+  )
+
+  monkeypatch.delenv('ADK_TELEMETRY_PAYLOADS')
+  assert (
+      telemetry._default_telemetry_policy().payload_capture
+      == PayloadCapture.FULL
+  )
+
+
+def test_default_telemetry_policy_ignores_invalid_env(monkeypatch, caplog):
+  monkeypatch.setenv('ADK_TELEMETRY_PAYLOADS', 'everything')
+  assert (
+      telemetry._default_telemetry_policy().payload_capture
+      == PayloadCapture.FULL
+  )
+  assert 'off, metadata, truncated, full' in caplog.text
@@ -50,7 +50,9 @@ def mock_rest_api_tool():
       "required": ["user_id", "page_size", "filter", "connection_name"],
   }
   mock_tool._operation_parser = mock_parser
-  mock_tool.call.return_value = {"status": "success", "data": "mock_data"}
+  mock_tool.run_async = mock.AsyncMock(
+      return_value={"status": "success", "data": "mock_data"}
+  )
   return mock_tool
 
 
@@ -143,8 +145,8 @@ async def test_run_async(integration_tool, mock_rest_api_tool):
 
   result = await integration_tool.run_async(args=input_args, tool_context=None)
 
-  # Assert the underlying rest_api_tool.call was called correctly
-  mock_rest_api_tool.call.assert_called_once_with(
+  # Assert the underlying rest_api_tool.run_async was called correctly
+  mock_rest_api_tool.run_async.assert_awaited_once_with(
       args=expected_call_args, tool_context=None
   )
 
@@ -199,7 +201,7 @@ async def test_run_with_auth_async_none_token(
         args=input_args, tool_context={}
     )
 
-    mock_rest_api_tool.call.assert_called_once_with(
+    mock_rest_api_tool.run_async.assert_awaited_once_with(
         args=expected_call_args, tool_context={}
     )
     assert result == {"status": "success", "data": "mock_data"}
@@ -246,7 +248,7 @@ async def test_run_with_auth_async(
     result = await integration_tool_with_auth.run_async(
         args=input_args, tool_context={}
     )
-    mock_rest_api_tool.call.assert_called_once_with(
+    mock_rest_api_tool.run_async.assert_awaited_once_with(
         args=expected_call_args, tool_context={}
     )
     assert result == {"status": "success", "data": "mock_data"}
@@ -0,0 +1,201 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+from unittest import mock
+
+import anyio
+from google.adk.tools.mcp_tool import mcp_session_pool
+from google.adk.tools.mcp_tool.mcp_session_manager import SseConnectionParams
+from google.adk.tools.mcp_tool.mcp_session_pool import MCPSessionPool
+from google.adk.tools.mcp_tool.mcp_session_pool import MCPSessionPoolConfig
+import pytest
+
+
+class _FakeSession:
+
+  def __init__(self):
+    self.closed = False
+    self.ping = mock.AsyncMock()
+
+
+class _FakeSessionManager:
+  """Opens fake sessions, and records them."""
+
+  instances = []
+
+  def __init__(self, connection_params, errlog):
+    self.connection_params = connection_params
+    self.tools_version = 0
+    self.session = None
+    _FakeSessionManager.instances.append(self)
+
+  async def create_session(self):
+    self.session = _FakeSession()
+    self.session.send_ping = self.session.ping
+    self.tools_version += 1
+    return self.session
+
+  async def close(self):
+    self.session.closed = True
+
+
+@pytest.fixture(autouse=True)
+def fake_session_manager(monkeypatch):
+  _FakeSessionManager.instances = []
+  monkeypatch.setattr(
+      mcp_session_pool, 'MCPSessionManager', _FakeSessionManager
+  )
+
+
+def _create_pool(**kwargs) -> MCPSessionPool:
+  return MCPSessionPool(
+      connection_params=SseConnectionParams(
+          url='http://localhost/sse', headers={'x-app': 'app'}
+      ),
+      config=MCPSessionPoolConfig(**kwargs),
+  )
+
+
+@pytest.mark.asyncio
+async def test_sessions_are_reused():
+  pool = _create_pool()
+  async with pool.session() as first_session:
+    pass
+  async with pool.session() as second_session:
+    pass
+  assert first_session is second_session
+  await pool.close()
+  assert first_session.closed
+
+
+@pytest.mark.asyncio
+async def test_concurrent_callers_use_up_to_max_size_sessions():
+  pool = _create_pool(max_size=2, max_in_flight_per_session=2)
+  async with pool.session() as session_1:
+    async with pool.session() as session_2:
+      # Callers are spread over the sessions before sharing them.
+      assert session_2 is not session_1
+      async with pool.session() as session_3:
+        assert session_3 in (session_1, session_2)
+  assert len(_FakeSessionManager.instances) == 2
+  await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_waiters_are_served_in_order():
+  pool = _create_pool(max_size=1, max_in_flight_per_session=1)
+  order = []
+
+  async def call(index: int):
+    async with pool.session():
+      order.append(index)
+      await asyncio.sleep(0)
+
+  async with pool.session():
+    tasks = [asyncio.create_task(call(i)) for i in range(5)]
+    await asyncio.sleep(0)
+  await asyncio.gather(*tasks)
+
+  assert order == [0, 1, 2, 3, 4]
+  assert len(_FakeSessionManager.instances) == 1
+  await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_acquire_timeout():
+  pool = _create_pool(
+      max_size=1, max_in_flight_per_session=1, acquire_timeout_secs=0.01
+  )
+  async with pool.session():
+    with pytest.raises(asyncio.TimeoutError):
+      async with pool.session():
+        pass
+  # The session is still usable after the waiter gave up.
+  async with pool.session():
+    pass
+  await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_closed_session_is_replaced():
+  pool = _create_pool(max_size=1)
+  tools_version = pool.tools_version
+  with pytest.raises(anyio.ClosedResourceError):
+    async with pool.session() as closed_session:
+      raise anyio.ClosedResourceError()
+
+  async with pool.session() as session:
+    assert session is not closed_session
+  assert closed_session.closed
+  assert pool.tools_version != tools_version
+  await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_idle_session_is_health_checked():
+  pool = _create_pool(health_check_interval_secs=0)
+  async with pool.session() as unhealthy_session:
+    unhealthy_session.ping.side_effect = anyio.ClosedResourceError()
+
+  async with pool.session() as session:
+    assert session is not unhealthy_session
+    assert unhealthy_session.closed
+  async with pool.session() as healthy_session:
+    assert healthy_session is session
+  session.ping.assert_awaited_once()
+  await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_idle_sessions_are_closed_down_to_min_size():
+  pool = _create_pool(min_size=1, idle_timeout_secs=0)
+  async with pool.session() as session_1:
+    async with pool.session() as session_2:
+      pass
+  async with pool.session() as session_3:
+    # The idle sessions are closed in the background.
+    await asyncio.sleep(0.01)
+  assert session_3 is session_2
+  assert [session_1.closed, session_2.closed] == [True, False]
+  await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_user_affinity():
+  pool = _create_pool(
+      user_affinity=True,
+      user_headers_provider=lambda user_id: {'Authorization': user_id},
+  )
+  async with pool.session(pool.get_affinity_key('user_1')) as session_1:
+    pass
+  async with pool.session(pool.get_affinity_key('user_2')) as session_2:
+    pass
+  async with pool.session(pool.get_affinity_key('user_1')) as session_3:
+    pass
+
+  assert session_1 is session_3
+  assert session_1 is not session_2
+  assert [
+      manager.connection_params.headers
+      for manager in _FakeSessionManager.instances
+  ] == [
+      {'x-app': 'app', 'Authorization': 'user_1'},
+      {'x-app': 'app', 'Authorization': 'user_2'},
+  ]
+  await pool.close()
+
+
+def test_no_user_affinity_by_default():
+  assert _create_pool().get_affinity_key('user_1') is None
@@ -0,0 +1,210 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for MCPToolset against a local stdio MCP server."""
+
+import asyncio
+import sys
+import textwrap
+from unittest import mock
+
+from google.adk.tools.mcp_tool.mcp_session_manager import StdioConnectionParams
+from google.adk.tools.mcp_tool.mcp_session_pool import MCPSessionPoolConfig
+from google.adk.tools.mcp_tool.mcp_toolset import MCPToolset
+from mcp import StdioServerParameters
+import pytest
+
+_SERVER_CODE = textwrap.dedent('''
+    import asyncio
+    import os
+
+    from mcp.server.fastmcp import Context
+    from mcp.server.fastmcp import FastMCP
+
+
+    class CountingFastMCP(FastMCP):
+      num_list_tools_calls = 0
+
+      async def list_tools(self):
+        CountingFastMCP.num_list_tools_calls += 1
+        return await super().list_tools()
+
+
+    server = CountingFastMCP("test_server")
+
+
+    @server.tool()
+    def get_num_list_tools_calls() -> int:
+      """Gets the number of tools/list requests."""
+      return CountingFastMCP.num_list_tools_calls
+
+
+    @server.tool()
+    async def add_tool(name: str, ctx: Context) -> str:
+      """Adds a tool, and notifies the client."""
+      server.add_tool(lambda: name, name=name, description="Added tool.")
+      await ctx.session.send_tool_list_changed()
+      return name
+
+
+    @server.tool()
+    async def get_pid() -> int:
+      """Gets the process id of the server, after a while."""
+      await asyncio.sleep(0.2)
+      return os.getpid()
+
+
+    server.run()
+''')
+
+
+def _create_toolset(tmp_path, **kwargs) -> MCPToolset:
+  server_path = tmp_path / 'server.py'
+  server_path.write_text(_SERVER_CODE)
+  return MCPToolset(
+      connection_params=StdioConnectionParams(
+          server_params=StdioServerParameters(
+              command=sys.executable, args=[str(server_path)]
+          ),
+          timeout=30,
+      ),
+      **kwargs,
+  )
+
+
+async def _call_tool(toolset: MCPToolset, name: str, args: dict):
+  tools = {tool.name: tool for tool in await toolset.get_tools()}
+  result = await tools[name].run_async(args=args, tool_context=mock.Mock())
+  return result.content[0].text
+
+
+async def _get_num_list_tools_calls(toolset: MCPToolset) -> int:
+  return int(await _call_tool(toolset, 'get_num_list_tools_calls', {}))
+
+
+@pytest.mark.asyncio
+async def test_tools_are_cached(tmp_path):
+  toolset = _create_toolset(tmp_path)
+  try:
+    tools = await toolset.get_tools()
+    assert {tool.name for tool in tools} == {
+        'get_num_list_tools_calls',
+        'add_tool',
+        'get_pid',
+    }
+    assert await toolset.get_tools() == tools
+    declaration = tools[0]._get_declaration()
+    declaration.description = 'changed'
+    assert tools[0]._get_declaration().description != 'changed'
+    assert await _get_num_list_tools_calls(toolset) == 1
+  finally:
+    await toolset.close()
+
+
+@pytest.mark.asyncio
+async def test_tools_are_filtered_from_cache(tmp_path):
+  toolset = _create_toolset(tmp_path, tool_filter=['add_tool'])
+  try:
+    assert [tool.name for tool in await toolset.get_tools()] == ['add_tool']
+    toolset.tool_filter = ['get_num_list_tools_calls']
+    assert await _get_num_list_tools_calls(toolset) == 1
+  finally:
+    await toolset.close()
+
+
+@pytest.mark.asyncio
+async def test_cache_expires_after_ttl(tmp_path):
+  toolset = _create_toolset(tmp_path, tools_cache_ttl_secs=0.1)
+  try:
+    await toolset.get_tools()
+    await asyncio.sleep(0.2)
+    await toolset.get_tools()
+    assert await _get_num_list_tools_calls(toolset) == 2
+  finally:
+    await toolset.close()
+
+
+@pytest.mark.asyncio
+async def test_cache_is_cleared_on_tool_list_changed(tmp_path):
+  toolset = _create_toolset(tmp_path, tools_cache_ttl_secs=None)
+  try:
+    await _call_tool(toolset, 'add_tool', {'name': 'new_tool'})
+    # Waits for the notification, which is handled in the background.
+    for _ in range(100):
+      if 'new_tool' in {tool.name for tool in await toolset.get_tools()}:
+        break
+      await asyncio.sleep(0.05)
+    assert 'new_tool' in {tool.name for tool in await toolset.get_tools()}
+  finally:
+    await toolset.close()
+
+
+@pytest.mark.asyncio
+async def test_cache_is_cleared_on_reconnect(tmp_path):
+  toolset = _create_toolset(tmp_path, tools_cache_ttl_secs=None)
+  try:
+    await toolset.get_tools()
+    await toolset._reinitialize_session()
+    await toolset.get_tools()
+    # The new server process has only served this listing.
+    assert await _get_num_list_tools_calls(toolset) == 1
+    assert toolset._tools_caches[None].tools_version == 2
+  finally:
+    await toolset.close()
+
+
+@pytest.mark.asyncio
+async def test_tools_are_called_over_session_pool(tmp_path):
+  toolset = _create_toolset(
+      tmp_path, session_pool_config=MCPSessionPoolConfig(max_size=2)
+  )
+  try:
+    pids = await asyncio.gather(
+        *[_call_tool(toolset, 'get_pid', {}) for _ in range(4)]
+    )
+    # The calls were spread over two server processes.
+    assert len(set(pids)) == 2
+    assert await _get_num_list_tools_calls(toolset) == 1
+  finally:
+    await toolset.close()
+
+
+@pytest.mark.asyncio
+async def test_tools_are_cached_per_user_with_user_affinity(tmp_path):
+  toolset = _create_toolset(
+      tmp_path,
+      tools_cache_ttl_secs=None,
+      session_pool_config=MCPSessionPoolConfig(user_affinity=True),
+  )
+  user_1_context = mock.Mock()
+  user_1_context._invocation_context.user_id = 'user_1'
+  user_2_context = mock.Mock()
+  user_2_context._invocation_context.user_id = 'user_2'
+  try:
+    # Each user has their own server process, so a tool added for user_1 is
+    # not added for user_2.
+    tools = {tool.name: tool for tool in await toolset.get_tools()}
+    await tools['add_tool'].run_async(
+        args={'name': 'user_1_tool'}, tool_context=user_1_context
+    )
+    await asyncio.sleep(0.1)
+
+    user_1_tools = await toolset.get_tools(user_1_context)
+    user_2_tools = await toolset.get_tools(user_2_context)
+    assert 'user_1_tool' in {tool.name for tool in user_1_tools}
+    assert 'user_1_tool' not in {tool.name for tool in user_2_tools}
+    assert await toolset.get_tools(user_1_context) == user_1_tools
+    assert await toolset.get_tools(user_2_context) == user_2_tools
+  finally:
+    await toolset.close()
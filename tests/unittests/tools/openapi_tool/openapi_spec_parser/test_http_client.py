@@ -0,0 +1,258 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import http.server
+import json
+import threading
+
+from fastapi.openapi.models import Operation
+from google.adk.tools.openapi_tool.openapi_spec_parser.http_client import _get_retry_after_secs
+from google.adk.tools.openapi_tool.openapi_spec_parser.http_client import HttpClient
+from google.adk.tools.openapi_tool.openapi_spec_parser.http_client import HttpClientConfig
+from google.adk.tools.openapi_tool.openapi_spec_parser.openapi_spec_parser import OperationEndpoint
+from google.adk.tools.openapi_tool.openapi_spec_parser.openapi_toolset import OpenAPIToolset
+from google.adk.tools.openapi_tool.openapi_spec_parser.rest_api_tool import _to_httpx_request_params
+from google.adk.tools.openapi_tool.openapi_spec_parser.rest_api_tool import RestApiTool
+import httpx
+import pytest
+
+
+class _StubHandler(http.server.BaseHTTPRequestHandler):
+  """Responds with the status codes queued for a path, then with 200."""
+
+  protocol_version = "HTTP/1.1"
+  # Sends the headers and the body without waiting for delayed ACKs.
+  disable_nagle_algorithm = True
+
+  def _respond(self):
+    server = self.server
+    server.requests.append((self.command, self.path, dict(self.headers)))
+    server.client_ports.add(self.client_address[1])
+    body_length = int(self.headers.get("Content-Length", 0))
+    request_body = self.rfile.read(body_length).decode()
+    status_codes = server.status_codes.get(self.path, [])
+    status_code = status_codes.pop(0) if status_codes else 200
+    if self.path.startswith("/text"):
+      body = b"plain text"
+    else:
+      body = json.dumps({"path": self.path, "body": request_body}).encode()
+    self.send_response(status_code)
+    self.send_header("Content-Length", str(len(body)))
+    self.end_headers()
+    self.wfile.write(body)
+
+  do_GET = do_POST = _respond
+
+  def log_message(self, *args):
+    pass
+
+
+@pytest.fixture
+def stub_server():
+  server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), _StubHandler)
+  server.daemon_threads = True
+  server.requests = []
+  server.client_ports = set()
+  server.status_codes = {}
+  thread = threading.Thread(
+      target=server.serve_forever, kwargs={"poll_interval": 0.01}, daemon=True
+  )
+  thread.start()
+  yield server
+  server.shutdown()
+  server.server_close()
+
+
+def _base_url(server) -> str:
+  return f"http://127.0.0.1:{server.server_address[1]}"
+
+
+def _create_tool(
+    server, method: str, path: str, http_client: HttpClient
+) -> RestApiTool:
+  return RestApiTool(
+      name="test_tool",
+      description="Test tool",
+      endpoint=OperationEndpoint(
+          base_url=_base_url(server), path=path, method=method
+      ),
+      operation=Operation(operationId="testTool"),
+      http_client=http_client,
+  )
+
+
+_NO_BACKOFF = HttpClientConfig(retry_backoff_secs=0)
+
+
+@pytest.mark.asyncio
+async def test_connections_are_reused(stub_server):
+  http_client = HttpClient()
+  tool = _create_tool(stub_server, "GET", "/items", http_client)
+  for _ in range(3):
+    assert await tool.run_async(args={}, tool_context=None) == {
+        "path": "/items",
+        "body": "",
+    }
+  await http_client.close()
+  assert len(stub_server.requests) == 3
+  assert len(stub_server.client_ports) == 1
+
+
+@pytest.mark.asyncio
+async def test_idempotent_requests_are_retried(stub_server):
+  stub_server.status_codes["/items"] = [503, 502]
+  http_client = HttpClient(_NO_BACKOFF)
+  tool = _create_tool(stub_server, "GET", "/items", http_client)
+  assert await tool.run_async(args={}, tool_context=None) == {
+      "path": "/items",
+      "body": "",
+  }
+  await http_client.close()
+  assert len(stub_server.requests) == 3
+
+
+@pytest.mark.asyncio
+async def test_error_is_returned_after_last_retry(stub_server):
+  stub_server.status_codes["/items"] = [503, 503, 503]
+  http_client = HttpClient(_NO_BACKOFF)
+  tool = _create_tool(stub_server, "GET", "/items", http_client)
+  result = await tool.run_async(args={}, tool_context=None)
+  await http_client.close()
+  assert result["error"].startswith("Tool test_tool execution failed.")
+  assert len(stub_server.requests) == 3
+
+
+@pytest.mark.asyncio
+async def test_non_idempotent_requests_are_not_retried(stub_server):
+  stub_server.status_codes["/items"] = [503]
+  http_client = HttpClient(_NO_BACKOFF)
+  tool = _create_tool(stub_server, "POST", "/items", http_client)
+  result = await tool.run_async(args={}, tool_context=None)
+  await http_client.close()
+  assert "error" in result
+  assert len(stub_server.requests) == 1
+
+
+@pytest.mark.asyncio
+async def test_connect_errors_are_retried(caplog):
+  http_client = HttpClient(_NO_BACKOFF)
+  with pytest.raises(httpx.ConnectError):
+    # Nothing listens on port 9 of localhost.
+    await http_client.request("POST", "http://127.0.0.1:9/items")
+  await http_client.close()
+  assert [
+      record.message.startswith("Retrying POST") for record in caplog.records
+  ] == [True, True]
+
+
+@pytest.mark.asyncio
+async def test_text_response(stub_server):
+  http_client = HttpClient()
+  tool = _create_tool(stub_server, "GET", "/text", http_client)
+  assert await tool.run_async(args={}, tool_context=None) == {
+      "text": "plain text"
+  }
+  await http_client.close()
+
+
+def test_to_httpx_request_params():
+  assert _to_httpx_request_params({
+      "method": "post",
+      "url": "https://example.com/items",
+      "headers": {"Content-Type": "text/plain"},
+      "cookies": {"session": "abc", "theme": "dark"},
+      "data": "raw body",
+  }) == {
+      "method": "post",
+      "url": "https://example.com/items",
+      "headers": {
+          "Content-Type": "text/plain",
+          "Cookie": "session=abc; theme=dark",
+      },
+      "content": "raw body",
+  }
+  assert _to_httpx_request_params({
+      "method": "post",
+      "url": "https://example.com/items",
+      "headers": {},
+      "cookies": {},
+      "data": {"key": "value"},
+  }) == {
+      "method": "post",
+      "url": "https://example.com/items",
+      "headers": {},
+      "data": {"key": "value"},
+  }
+
+
+@pytest.mark.asyncio
+async def test_toolset_closes_its_http_client(stub_server):
+  toolset = OpenAPIToolset(
+      spec_dict={
+          "openapi": "3.0.0",
+          "info": {"title": "Test API", "version": "1.0"},
+          "servers": [{"url": _base_url(stub_server)}],
+          "paths": {
+              "/items": {"get": {"operationId": "listItems", "responses": {}}}
+          },
+      },
+      http_client_config=HttpClientConfig(max_connections=1),
+  )
+  [tool] = await toolset.get_tools()
+  assert tool._http_client is toolset._http_client
+  assert await tool.run_async(args={}, tool_context=None) == {
+      "path": "/items",
+      "body": "",
+  }
+  await toolset.close()
+  assert not toolset._http_client._clients
+
+
+def test_each_event_loop_gets_its_own_client(stub_server):
+  http_client = HttpClient()
+
+  async def request():
+    response = await http_client.request("GET", f"{_base_url(stub_server)}/")
+    return response.status_code, http_client._get_client()
+
+  status_code_1, client_1 = asyncio.run(request())
+  status_code_2, client_2 = asyncio.run(request())
+
+  assert status_code_1 == status_code_2 == 200
+  assert client_2 is not client_1
+  # The client of the closed event loop was dropped.
+  assert list(http_client._clients.values()) == [client_2]
+
+
+def test_get_retry_after_secs():
+  assert _get_retry_after_secs(httpx.Response(503)) is None
+  assert (
+      _get_retry_after_secs(httpx.Response(503, headers={"Retry-After": "2"}))
+      == 2.0
+  )
+  assert (
+      _get_retry_after_secs(
+          httpx.Response(
+              503, headers={"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"}
+          )
+      )
+      == 0.0
+  )
+  assert (
+      _get_retry_after_secs(
+          httpx.Response(503, headers={"Retry-After": "invalid"})
+      )
+      is None
+  )
@@ -14,6 +14,7 @@
 
 from unittest.mock import MagicMock
 
+from google.adk.tools import function_tool
 from google.adk.tools.function_tool import FunctionTool
 import pytest
 
@@ -294,3 +295,60 @@ async def test_run_async_with_optional_args_not_set_async_func():
   args = {"arg1": "test_value_1", "arg3": "test_value_3"}
   result = await tool.run_async(args=args, tool_context=MagicMock())
   assert result == "test_value_1,test_value_3"
+
+
+def test_declaration_is_built_once_per_api_variant(monkeypatch):
+  """Test that the declaration is cached for each API variant."""
+
+  def typed_function(arg1: str, arg2: int) -> str:
+    """Typed function."""
+    return arg1
+
+  tool = FunctionTool(typed_function)
+  build_function_declaration = MagicMock(
+      side_effect=function_tool.build_function_declaration
+  )
+  monkeypatch.setattr(
+      function_tool, "build_function_declaration", build_function_declaration
+  )
+
+  monkeypatch.setenv("GOOGLE_GENAI_USE_VERTEXAI", "0")
+  gemini_declaration = tool._get_declaration()
+  assert tool._get_declaration() == gemini_declaration
+  monkeypatch.setenv("GOOGLE_GENAI_USE_VERTEXAI", "1")
+  vertex_declaration = tool._get_declaration()
+  assert tool._get_declaration() == vertex_declaration
+  assert build_function_declaration.call_count == 2
+
+
+def test_declaration_changes_do_not_affect_the_cache():
+  """Test that callers can modify the declaration they get."""
+
+  def typed_function(arg1: str, arg2: int) -> str:
+    """Typed function."""
+    return arg1
+
+  tool = FunctionTool(typed_function)
+
+  declaration = tool._get_declaration()
+  declaration.description = "changed"
+  declaration.parameters.properties.clear()
+
+  declaration = tool._get_declaration()
+  assert declaration.description != "changed"
+  assert set(declaration.parameters.properties) == {"arg1", "arg2"}
+
+
+@pytest.mark.asyncio
+async def test_signature_is_inspected_once(monkeypatch):
+  """Test that run_async does not inspect the signature on each call."""
+  tool = FunctionTool(function_for_testing_with_2_arg_and_no_tool_context)
+  await tool.run_async(args={"arg1": 1, "arg2": 2}, tool_context=MagicMock())
+  signature = MagicMock(side_effect=AssertionError("inspected again"))
+  monkeypatch.setattr("inspect.signature", signature)
+
+  result = await tool.run_async(
+      args={"arg1": 1, "arg2": 2}, tool_context=MagicMock()
+  )
+  assert result == 1
+  assert tool._get_mandatory_args() == ["arg1", "arg2"]